@@ -0,0 +1,52 @@
+from time import perf_counter
+import numpy as np
+import synthetica as sth
+
+
+def legacy_jumps(model: sth.Merton) -> np.ndarray:
+    """Per-path arrival scan used before the vectorized jump generator"""
+    small_lmbda = - (1.0 / model.lmbda)
+    jump = np.zeros((model.length, model.num_paths), dtype=np.float64)
+    for path in range(model.num_paths):
+        s_n = time = 0
+        while s_n < model.length:
+            s_n += small_lmbda * np.log(np.random.uniform(0, 1))
+            for length in range(model.length):
+                if time * model.delta <= s_n * model.delta <= (length + 1) * model.delta:
+                    jump[length, path] += np.random.normal(model.mu, model.var)
+                    break
+            time += 1
+    return jump
+
+
+def timeit(func, *args, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func(*args)
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+
+    length = 2520
+    lmbda = 0.00025
+
+    # Jump generator only, legacy vs vectorized
+
+    print(f"{'paths':>8} {'steps':>6} {'legacy (s)':>12} {'vectorized (s)':>15}")
+    for num_paths in [10, 100, 1_000]:
+        model = sth.Merton(length=length, num_paths=num_paths, lmbda=lmbda)
+        legacy = timeit(legacy_jumps, model, repeat=1)
+        vectorized = timeit(lambda: model._jumps(model.streams(), length))
+        print(f"{num_paths:>8} {length:>6} {legacy:>12.4f} {vectorized:>15.6f}")
+
+    # Scaling of the vectorized generator up to 100k paths x 2,520 steps
+
+    print(f"\n{'paths':>8} {'steps':>6} {'jumps (s)':>12} {'transform (s)':>15}")
+    for num_paths in [1_000, 10_000, 100_000]:
+        model = sth.Merton(length=length, num_paths=num_paths, lmbda=lmbda)
+        jumps = timeit(lambda: model._jumps(model.streams(), length))
+        transform = timeit(model.transform, repeat=1)
+        print(f"{num_paths:>8} {length:>6} {jumps:>12.4f} {transform:>15.4f}")
@@ -0,0 +1,53 @@
+from time import perf_counter
+import numpy as np
+from synthetica import nearest_positive_definite
+from synthetica.stats import _is_positive_definite
+
+
+def legacy_nearest_positive_definite(matrix: np.ndarray) -> np.ndarray:
+    """SVD-based repair with unbounded shrinkage used before eigh clipping"""
+    symmetric_matrix = (matrix + matrix.T) / 2
+    _, variance, eigenvectors = np.linalg.svd(symmetric_matrix)
+    transformed_matrix = np.dot(
+        eigenvectors.T, np.dot(np.diag(variance), eigenvectors))
+    weighted_matrix = (symmetric_matrix + transformed_matrix) / 2
+    weighted_symetric_matrix = (weighted_matrix + weighted_matrix.T) / 2
+    if _is_positive_definite(weighted_symetric_matrix):
+        return weighted_symetric_matrix
+    spacing = np.spacing(np.linalg.norm(matrix))
+    identity_matrix = np.eye(matrix.shape[0])
+    k = 1
+    while not _is_positive_definite(weighted_symetric_matrix):
+        min_eigenvalues = np.min(
+            np.real(np.linalg.eigvals(weighted_symetric_matrix)))
+        weighted_symetric_matrix += identity_matrix * \
+            (- min_eigenvalues * k**2 + spacing)
+        k += 1
+    return weighted_symetric_matrix
+
+
+def estimated_correlation(n: int, seed: int = 123) -> np.ndarray:
+    """Sample correlation from fewer observations than assets (singular)"""
+    rng = np.random.default_rng(seed)
+    return np.corrcoef(rng.normal(size=(n // 2, n)), rowvar=False)
+
+
+def timeit(func, *args, **kwargs) -> float:
+    start = perf_counter()
+    func(*args, **kwargs)
+    return perf_counter() - start
+
+
+if __name__ == "__main__":
+
+    print(f"{'n':>6} {'legacy (s)':>12} {'eigh (s)':>10} {'eigh factor (s)':>16}")
+    for n in [50, 100, 250, 500, 1_000, 2_000, 5_000]:
+        matrix = estimated_correlation(n)
+        legacy = (
+            f"{timeit(legacy_nearest_positive_definite, matrix):>12.4f}"
+            if n <= 1_000
+            else f"{'-':>12}"
+        )
+        eigh = timeit(nearest_positive_definite, matrix)
+        factor = timeit(nearest_positive_definite, matrix, return_factor=True)
+        print(f"{n:>6} {legacy} {eigh:>10.4f} {factor:>16.4f}")
@@ -0,0 +1,41 @@
+from time import perf_counter
+import numpy as np
+import synthetica as sth
+
+
+def timeit(func, *args, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func(*args)
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def first_pandas(model: sth.GeometricBrownianMotion, paths: np.ndarray):
+    """Conversion building the column labels, as on a fresh model"""
+    model.__dict__.pop('columns', None)
+    return model.to_output(paths, 'pandas')
+
+
+if __name__ == "__main__":
+
+    length = 10
+
+    # Output conversion only, on already simulated paths
+
+    print(
+        f"{'paths':>10} {'numpy (s)':>10} {'pandas (s)':>11} "
+        f"{'cached (s)':>11} {'simulate (s)':>13}"
+    )
+    for num_paths in [1_000, 100_000, 1_000_000]:
+        model = sth.GeometricBrownianMotion(length=length, num_paths=num_paths, seed=1)
+        paths = model.transform(output='numpy')
+        numpy = timeit(model.to_output, paths, 'numpy')
+        pandas = timeit(first_pandas, model, paths)
+        cached = timeit(model.to_output, paths, 'pandas')
+        simulate = timeit(model.transform, None, 'numpy', repeat=1)
+        print(
+            f"{num_paths:>10} {numpy:>10.6f} {pandas:>11.4f} "
+            f"{cached:>11.6f} {simulate:>13.4f}"
+        )
@@ -1 +1 @@
-# =============================================================================# Synthetica Module# =============================================================================from .config import SyntheticConfigfrom .stats import nearest_positive_definitefrom .decorators import callbackfrom .base import BaseSyntheticfrom .models import *CAR = MeanRevertingOrnsteinUhlenbeck = MeanReverting__all__ = [    "SyntheticConfig",    "BaseSynthetic",    "GeometricBrownianMotion",    "Heston",    "Merton",    "Poisson",    "LevyStable",    "CIR",    "MeanReverting",    "CAR",    "OrnsteinUhlenbeck",    "AR",    "NARMA",    "Seasonal"]
\ No newline at end of file
+# =============================================================================# Synthetica Module# =============================================================================from .config import SyntheticConfigfrom .stats import nearest_positive_definite, control_variatefrom .filters import red_noise_filter, all_pole_filter, all_pole_zifrom .cache import CholeskyCache, cholesky_cachefrom .streams import RandomStreams, BIT_GENERATORS, VARIANCE_REDUCTIONS, SOBOL_MAX_DIMENSIONfrom .decorators import callbackfrom .base import BaseSyntheticfrom .models import *from .parallel import ParallelRunnerfrom .arrow import write_parquet, write_arrow, record_batches, arrow_schemaCAR = MeanRevertingOrnsteinUhlenbeck = MeanReverting__all__ = [    "SyntheticConfig",    "BaseSynthetic",    "CholeskyCache",    "RandomStreams",    "GeometricBrownianMotion",    "Heston",    "Merton",    "Poisson",    "LevyStable",    "CIR",    "MeanReverting",    "CAR",    "OrnsteinUhlenbeck",    "AR",    "NARMA",    "Seasonal",    "ParallelRunner",    "write_parquet",    "write_arrow",    "record_batches",    "arrow_schema"]
\ No newline at end of file
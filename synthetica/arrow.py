@@ -0,0 +1,222 @@
+from typing import Iterator, Optional
+import inspect
+import json
+import numpy as np
+import pandas as pd
+
+from .base import BaseSynthetic
+
+
+def _import_pyarrow():
+    """Import the optional pyarrow dependency"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError(
+            "pyarrow is required to write Arrow and Parquet data. Install it "
+            "with `pip install python-synthetica[arrow]`."
+        ) from error
+    return pyarrow
+
+
+def _to_json(value):
+    """Serialize the parameters that json does not handle natively"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def model_parameters(model: BaseSynthetic) -> dict:
+    """
+    Collect the parameters of a model, as passed to its constructor.
+
+    Parameters
+    ----------
+    model : BaseSynthetic
+        The model.
+
+    Returns
+    -------
+    dict
+        The model class name and its parameters, with the length as the
+        number of time steps.
+    """
+    signature = inspect.signature(type(model).__init__)
+    parameters = {
+        name: getattr(model, name, None)
+        for name in signature.parameters
+        if name != 'self'
+    }
+    return {'model': type(model).__name__, 'parameters': parameters}
+
+
+def arrow_schema(model: BaseSynthetic):
+    """
+    Build the Arrow schema of the paths of a model.
+
+    Note
+    ----
+    The schema has one column per path, named after the pandas columns (see
+    `BaseSynthetic.columns`), followed by the 'Date' index column. Its
+    metadata holds the pandas metadata, so that tables convert back to
+    pandas with their DatetimeIndex, and a 'synthetica' JSON entry with the
+    model parameters (see `model_parameters`) and its index range and
+    frequency.
+
+    Parameters
+    ----------
+    model : BaseSynthetic
+        The model.
+
+    Returns
+    -------
+    pa.Schema
+        The schema of the record batches of the model.
+    """
+    pa = _import_pyarrow()
+
+    # Empty frame with the dtypes and labels of the output
+    frame = pd.DataFrame(
+        np.empty((0, model.num_paths), dtype=model.dtype),
+        index=model.index[:0].rename('Date'),
+        columns=model.columns
+    )
+    schema = pa.Schema.from_pandas(frame, preserve_index=True)
+
+    index = model.index
+    metadata = {
+        **model_parameters(model),
+        'index': {
+            'start': str(index[0]) if len(index) else None,
+            'end': str(index[-1]) if len(index) else None,
+            'freq': index.freqstr,
+            'length': len(index),
+        },
+    }
+    return schema.with_metadata({
+        **schema.metadata,
+        b'synthetica': json.dumps(metadata, default=_to_json).encode(),
+    })
+
+
+def record_batches(
+    model: BaseSynthetic,
+    chunk_size: Optional[int] = None,
+    matrix: Optional[pd.DataFrame | np.ndarray] = None,
+    schema=None
+) -> Iterator:
+    """
+    Generate the paths of a model as Arrow record batches, in chunks of time
+    steps.
+
+    Note
+    ----
+    Chunks are simulated with `BaseSynthetic.iter_transform`, so that only a
+    chunk of the simulation is held in memory, and converted from NumPy
+    without going through pandas.
+
+    Parameters
+    ----------
+    model : BaseSynthetic
+        The model to simulate.
+    chunk_size : int, optional
+        The number of time steps per batch. If None, batches of about 2**24
+        values are used. Default is None.
+    matrix : pd.DataFrame or np.array, optional
+        The matrix applied in Cholesky decomposition (optional).
+    schema : pa.Schema, optional
+        The schema of the batches. If None, it is built with `arrow_schema`.
+        Default is None.
+
+    Yields
+    ------
+    pa.RecordBatch
+        Batches of up to chunk_size time steps.
+    """
+    pa = _import_pyarrow()
+    if schema is None:
+        schema = arrow_schema(model)
+    if chunk_size is None:
+        chunk_size = model._default_chunk_size()
+
+    start = 0
+    for paths in model.iter_transform(chunk_size, matrix, output='numpy'):
+        rows = len(paths)
+        # Transposed once, so that each path is contiguous and wrapped by
+        # Arrow without a copy
+        columns = np.ascontiguousarray(paths.T)
+        arrays = [pa.array(column) for column in columns]
+        arrays.append(pa.array(model.index[start:start + rows]))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+        start += rows
+
+
+def write_parquet(
+    model: BaseSynthetic,
+    path: str,
+    chunk_size: Optional[int] = None,
+    matrix: Optional[pd.DataFrame | np.ndarray] = None,
+    **kwargs
+):
+    """
+    Stream the paths of a model to a Parquet file, one row group per chunk
+    of time steps.
+
+    Parameters
+    ----------
+    model : BaseSynthetic
+        The model to simulate.
+    path : str
+        The path of the Parquet file.
+    chunk_size : int, optional
+        The number of time steps per row group. If None, row groups of about
+        2**24 values are used. Default is None.
+    matrix : pd.DataFrame or np.array, optional
+        The matrix applied in Cholesky decomposition (optional).
+    **kwargs
+        Keyword arguments passed to `pyarrow.parquet.ParquetWriter` (e.g.
+        compression).
+
+    Example
+    -------
+    >>> model = GeometricBrownianMotion(length=2520, num_paths=10_000, seed=1)
+    >>> write_parquet(model, 'paths.parquet', chunk_size=252)
+    >>> data = pd.read_parquet('paths.parquet')
+    """
+    pa = _import_pyarrow()
+    schema = arrow_schema(model)
+    with pa.parquet.ParquetWriter(path, schema, **kwargs) as writer:
+        for batch in record_batches(model, chunk_size, matrix, schema=schema):
+            writer.write_batch(batch)
+
+
+def write_arrow(
+    model: BaseSynthetic,
+    sink,
+    chunk_size: Optional[int] = None,
+    matrix: Optional[pd.DataFrame | np.ndarray] = None
+):
+    """
+    Stream the paths of a model to an Arrow IPC file, one record batch per
+    chunk of time steps.
+
+    Parameters
+    ----------
+    model : BaseSynthetic
+        The model to simulate.
+    sink : str | pa.NativeFile
+        The path or the file the IPC data is written to.
+    chunk_size : int, optional
+        The number of time steps per record batch. If None, batches of about
+        2**24 values are used. Default is None.
+    matrix : pd.DataFrame or np.array, optional
+        The matrix applied in Cholesky decomposition (optional).
+    """
+    pa = _import_pyarrow()
+    schema = arrow_schema(model)
+    with pa.ipc.new_file(sink, schema) as writer:
+        for batch in record_batches(model, chunk_size, matrix, schema=schema):
+            writer.write_batch(batch)
@@ -1,9 +1,12 @@
-from abc import ABC, abstractmethod
-from typing import Iterable, Optional
+from abc import ABC
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
 from functools import cached_property
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+import warnings
 import synthetica as sth
 
 
@@ -30,9 +33,53 @@ class BaseSynthetic(ABC):
         The frequency of the data. Default is 'D'.
     seed : int, optional
         The random seed for reproducibility. Default is None.
+    as_of : str | datetime | pd.Timestamp, optional
+        The anchor (last) date of the generated index when `length` is an 
+        integer. If None, the current date is used when the index is first 
+        resolved. Default is None.
+    bit_generator : str, optional
+        The bit generator of the model random streams, one of 'pcg64', 
+        'pcg64dxsm', 'philox', 'sfc64' or 'mt19937'. Default is 'pcg64'.
+    dtype : str, optional
+        The floating point precision of the simulation, 'float32' or 
+        'float64'. In single precision, random variables are drawn natively 
+        in float32 and paths are computed and returned in float32, halving 
+        memory and bandwidth at the cost of about 7 significant digits. 
+        Default is 'float64'.
+    variance_reduction : str, optional
+        The variance reduction technique of the simulation, None, 
+        'antithetic', 'sobol' or 'moment_matching', applied to every Gaussian 
+        driver of the model (e.g. white noise, both Heston drivers). With 
+        antithetic variates, the normal variables of each pair of adjacent 
+        paths (0 and 1, 2 and 3, ...) are mirrored (z and -z). With 'sobol', 
+        they are randomized quasi-Monte Carlo variables: each path is a point 
+        of a scrambled Sobol sequence, built with a Brownian bridge so that 
+        the leading coordinates carry most of the variance of the path (see 
+        `RandomStreams`). The horizon is limited to 21201 time steps, the 
+        maximum dimension of the Sobol points (`SOBOL_MAX_DIMENSION`). Sobol 
+        points keep their balance properties for powers of 2 paths (per block 
+        of paths); other path counts are simulated without scipy's balance 
+        warning. The normal variables of the whole horizon are drawn on the 
+        first chunk. With moment matching, each time step of the normal 
+        variables is matched to the target mean and variance across each 
+        block of paths (see `block_size`), and therefore across all the 
+        paths. Each block, including the last one, must hold at least 2 paths 
+        (i.e. num_paths % block_size != 1). All techniques couple the paths, 
+        which are correlated assets when a `matrix` is applied, and therefore 
+        cannot be combined with one. Default is None.
+
+    Note
+    ----
+    Each model draws from its own `np.random.Generator` streams (see 
+    `RandomStreams`) seeded from `seed`, and never from the global 
+    `np.random` state, so that models can be used concurrently from several 
+    threads with reproducible results.
 
     """
 
+    # Number of paths sharing a random stream
+    block_size = 1024
+
     def __init__(
         self,
         length: Optional[int | pd.DatetimeIndex] = 252,
@@ -41,13 +88,32 @@ class BaseSynthetic(ABC):
         delta: Optional[float] = 1/252,
         sigma: Optional[float] = 0.125,
         freq: Optional[str] = 'D',
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        as_of: Optional[str | datetime | pd.Timestamp] = None,
+        bit_generator: Optional[str] = 'pcg64',
+        dtype: Optional[str | np.dtype] = 'float64',
+        variance_reduction: Optional[str] = None
     ):
+        if bit_generator not in sth.BIT_GENERATORS:
+            raise ValueError(
+                f"Bit generator must be one of {list(sth.BIT_GENERATORS)}. "
+                f"Got '{bit_generator}'."
+            )
+        self._check_dtype(dtype)
+
         # Generic
         self._length = length
         self._freq = freq
+        self._as_of = as_of
         self._num_paths = num_paths
         self._seed = seed
+        self._bit_generator = bit_generator
+        self._dtype = np.dtype(dtype)
+        self._check_variance_reduction(variance_reduction)
+        self._variance_reduction = variance_reduction
+        # Index of the first block of paths, when simulating a subset of the
+        # paths of a larger simulation
+        self._block_offset = 0
 
         # White noise params
         self._mean = mean
@@ -59,29 +125,408 @@ class BaseSynthetic(ABC):
 
     @property
     def freq(self) -> str:
+        """Frequency value"""
         return self._freq
 
+    @freq.setter
+    @sth.callback('index', 'white_noise', 'red_noise')
+    def freq(self, value: str) -> str:
+        """Frequency value update"""
+        self._freq = value
+
     @property
+    def as_of(self) -> Optional[str | datetime | pd.Timestamp]:
+        """Anchor date value"""
+        return self._as_of
+
+    @as_of.setter
+    @sth.callback('index', 'white_noise', 'red_noise')
+    def as_of(self, value: Optional[str | datetime | pd.Timestamp]):
+        """Anchor date value update"""
+        self._as_of = value
+
+    @cached_property
     def index(self) -> pd.DatetimeIndex:
+        """
+        Resolve the date index of the simulated data.
+
+        Note
+        ----
+        The index is computed once and cached until `length`, `freq` or 
+        `as_of` change. When `as_of` is None, the anchor date is the current 
+        date at the time the index is resolved.
+
+        Returns
+        -------
+        pd.DatetimeIndex
+            Date index of the simulated data.
+        """
         if isinstance(self._length, pd.DatetimeIndex):
             return self._length
         else:
-            # Calculate the nt ago from today
-            end_date = datetime.now().date()
+            # Calculate the nt ago from the anchor date
+            end_date = (
+                pd.Timestamp(self._as_of).date()
+                if self._as_of is not None
+                else datetime.now().date()
+            )
             start_date = end_date - timedelta(days=self._length - 1)
             return pd.date_range(start=start_date, end=end_date, freq=self.freq)
 
     @property
     def length(self) -> int:
+        """Number of time steps"""
         return len(self.index)
 
+    @length.setter
+    @sth.callback('index', 'white_noise', 'red_noise')
+    def length(self, value: int | pd.DatetimeIndex):
+        """Length value update"""
+        self._length = value
+
     @property
     def num_paths(self) -> int:
         return self._num_paths
 
-    @abstractmethod
-    def transform(self, *args, **kwargs) -> pd.Series | pd.DataFrame:
-        pass
+    def _simulate(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: object,
+        matrix: Optional[np.ndarray | pd.DataFrame] = None,
+        out: Optional[np.ndarray] = None
+    ) -> tuple[np.ndarray, object]:
+        """
+        Simulate a chunk of time steps of the model.
+
+        Note
+        ----
+        Models implement this method. Subclasses written before it, which 
+        only override `transform`, are still supported for whole-horizon 
+        runs: their paths are then taken from `transform`, with a 
+        DeprecationWarning, and chunks shorter than the horizon raise a 
+        NotImplementedError.
+
+        Parameters
+        ----------
+        streams : RandomStreams
+            The random streams of the simulation, shared by all its chunks.
+        start : int
+            The index of the first time step of the chunk.
+        rows : int
+            The number of time steps of the chunk.
+        state : object
+            The state of the model at the end of the previous chunk, or the 
+            initial state (see `_initial_state`) for the first chunk.
+        matrix : pd.DataFrame or np.array, optional
+            The matrix applied in Cholesky decomposition (optional).
+        out : np.ndarray, optional
+            A preallocated array of shape (rows, num_paths) the paths may be 
+            computed in, in place. Default is None.
+
+        Returns
+        -------
+        tuple[np.ndarray, object]
+            The paths of shape (rows, num_paths) and the state of the model at 
+            the end of the chunk.
+        """
+        name = type(self).__name__
+        if type(self).transform is BaseSynthetic.transform:
+            raise NotImplementedError(f"{name} must implement `_simulate`.")
+
+        if start != 0 or rows != self.length:
+            raise NotImplementedError(
+                f"{name} only overrides `transform`, which cannot simulate "
+                "chunks of time steps. Implement `_simulate` instead."
+            )
+
+        warnings.warn(
+            f"{name} overrides `transform` instead of `_simulate`. This is "
+            "deprecated and will stop working in a future version.",
+            DeprecationWarning,
+            stacklevel=3
+        )
+        paths = np.asarray(self.transform(matrix), dtype=self.dtype)
+        return paths.reshape(rows, self.num_paths), None
+
+    def _initial_state(self) -> object:
+        """The state of the model before the first time step"""
+        return None
+
+    def transform(
+        self,
+        matrix: pd.DataFrame | np.ndarray = None,
+        output: Optional[str] = 'pandas',
+        out: Optional[np.ndarray] = None
+    ) -> pd.Series | pd.DataFrame | np.ndarray:
+        """
+        Generate synthetic data.
+
+        Note
+        ----
+        When `out` is provided, GeometricBrownianMotion, Merton, Poisson and 
+        LevyStable draw their noise into it and accumulate prices in place, 
+        for a peak memory of about 1x the output (without `matrix`). If the 
+        white noise is not cached yet, it is drawn into `out` rather than 
+        cached. Other models compute their paths in `out` where their 
+        recursion allows it, or copy them into it.
+
+        Parameters
+        ----------
+        matrix : pd.DataFrame or np.array, optional
+            The matrix applied in Cholesky decomposition (optional).
+        output : str, optional
+            The output type, one of 'pandas', 'numpy' or 'xarray' (see 
+            `to_output`). Default is 'pandas'.
+        out : np.ndarray, optional
+            A preallocated array of shape (length, num_paths) and of the 
+            model dtype the paths are written to, and which backs the 
+            returned object. If None, a new array is allocated. Default is 
+            None.
+
+        Returns
+        -------
+        pd.Series | pd.DataFrame | np.ndarray | xr.DataArray
+            Data containing synthetic data of the model.
+        """
+        self._check_output(output)
+        self._check_matrix(matrix)
+        if out is not None:
+            self._check_out(out)
+
+        paths, _ = self._simulate_into(
+            self.streams(), 0, self.length, self._initial_state(), matrix, out)
+        return self.to_output(paths, output)
+
+    def _simulate_into(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: object,
+        matrix: Optional[np.ndarray | pd.DataFrame] = None,
+        out: Optional[np.ndarray] = None
+    ) -> tuple[np.ndarray, object]:
+        """
+        Simulate a chunk of time steps (see `_simulate`), with the paths 
+        written to `out` if provided, whether or not the model computes them 
+        in place.
+        """
+        paths, state = self._simulate(
+            streams, start, rows, state, matrix, out=out)
+        if out is not None and paths is not out:
+            out[...] = paths
+            paths = out
+        return paths, state
+
+    def _check_out(self, out: np.ndarray):
+        shape = (self.length, self.num_paths)
+        if np.shape(out) != shape or out.dtype != self.dtype:
+            raise ValueError(
+                f"Output array must be of shape {shape} and dtype "
+                f"{self.dtype}. Got {np.shape(out)} and "
+                f"{getattr(out, 'dtype', None)}."
+            )
+
+    def _check_matrix(self, matrix: Optional[np.ndarray | pd.DataFrame]):
+        if matrix is not None and self._variance_reduction is not None:
+            raise ValueError(
+                f"'{self._variance_reduction}' variance reduction couples the "
+                "paths and cannot be combined with a correlation matrix."
+            )
+
+    def iter_transform(
+        self,
+        chunk_size: int,
+        matrix: pd.DataFrame | np.ndarray = None,
+        output: Optional[str] = 'pandas',
+        out: Optional[np.ndarray] = None
+    ) -> Iterator[pd.Series | pd.DataFrame | np.ndarray]:
+        """
+        Generate synthetic data incrementally, in chunks of time steps.
+
+        Note
+        ----
+        Each chunk is simulated from the state of the model at the end of 
+        the previous one (e.g. the last price, variance, rate or lags), and 
+        every random stream continues from one chunk to the next. Peak memory 
+        is therefore bounded by the chunk rather than the horizon, and with a 
+        fixed seed the concatenated chunks match `transform` (up to floating 
+        point rounding for the price models).
+
+        Parameters
+        ----------
+        chunk_size : int
+            The number of time steps per chunk.
+        matrix : pd.DataFrame or np.array, optional
+            The matrix applied in Cholesky decomposition (optional).
+        output : str, optional
+            The output type, one of 'pandas', 'numpy' or 'xarray' (see 
+            `to_output`). Default is 'pandas'.
+        out : np.ndarray, optional
+            An array of shape (length, num_paths) and of the model dtype, 
+            e.g. a `np.memmap`, each chunk is written to the rows of. Chunks 
+            are then views of `out`. If None, each chunk is a new array. 
+            Default is None.
+
+        Yields
+        ------
+        pd.Series | pd.DataFrame | np.ndarray | xr.DataArray
+            Chunks of synthetic data of up to chunk_size time steps, indexed 
+            by their dates.
+        """
+        self._check_output(output)
+        self._check_matrix(matrix)
+        if out is not None:
+            self._check_out(out)
+        if chunk_size < 1:
+            raise ValueError(
+                f"Chunk size must be at least 1. Got {chunk_size}."
+            )
+
+        streams = self.streams()
+        state = self._initial_state()
+        for start in range(0, self.length, chunk_size):
+            rows = min(chunk_size, self.length - start)
+            paths, state = self._simulate_into(
+                streams,
+                start,
+                rows,
+                state,
+                matrix,
+                out=None if out is None else out[start:start + rows]
+            )
+            yield self.to_output(
+                paths, output, index=self.index[start:start + rows])
+
+    def to_memmap(
+        self,
+        filename: str,
+        chunk_size: Optional[int] = None,
+        matrix: pd.DataFrame | np.ndarray = None,
+        output: Optional[str] = 'numpy'
+    ) -> np.memmap | pd.Series | pd.DataFrame:
+        """
+        Generate synthetic data into a memory-mapped .npy file on disk.
+
+        Note
+        ----
+        The file is created with `np.lib.format.open_memmap`, then filled 
+        chunk by chunk of time steps with `iter_transform`, so that only a 
+        chunk of the simulation is held in memory on top of the mapped pages, 
+        and the model state carries from one chunk to the next. As rows are 
+        contiguous in the file, each chunk is a sequential write. The file 
+        can be reopened with `np.load(filename, mmap_mode='r')`.
+
+        Parameters
+        ----------
+        filename : str
+            The path of the .npy file, overwritten if it exists.
+        chunk_size : int, optional
+            The number of time steps per chunk. If None, chunks of about 
+            2**24 values are used. Default is None.
+        matrix : pd.DataFrame or np.array, optional
+            The matrix applied in Cholesky decomposition (optional).
+        output : str, optional
+            The output type backed by the file, one of 'numpy', 'pandas' or 
+            'xarray' (see `to_output`). Default is 'numpy'.
+
+        Returns
+        -------
+        np.memmap | pd.Series | pd.DataFrame | xr.DataArray
+            The synthetic data of the model, backed by the file.
+        """
+        self._check_output(output)
+        if chunk_size is None:
+            chunk_size = self._default_chunk_size()
+
+        out = np.lib.format.open_memmap(
+            filename,
+            mode='w+',
+            dtype=self.dtype,
+            shape=(self.length, self.num_paths)
+        )
+        for _ in self.iter_transform(chunk_size, matrix, output='numpy', out=out):
+            pass
+        out.flush()
+        return self.to_output(out, output)
+
+    def to_parquet(
+        self,
+        path: str,
+        chunk_size: Optional[int] = None,
+        matrix: pd.DataFrame | np.ndarray = None,
+        **kwargs
+    ):
+        """
+        Stream synthetic data to a Parquet file, one row group per chunk of 
+        time steps, with the date index and the model parameters attached 
+        (see `write_parquet`).
+
+        Note
+        ----
+        Requires the optional `pyarrow` package.
+
+        Parameters
+        ----------
+        path : str
+            The path of the Parquet file.
+        chunk_size : int, optional
+            The number of time steps per row group. If None, row groups of 
+            about 2**24 values are used. Default is None.
+        matrix : pd.DataFrame or np.array, optional
+            The matrix applied in Cholesky decomposition (optional).
+        **kwargs
+            Keyword arguments passed to `pyarrow.parquet.ParquetWriter`.
+        """
+        sth.write_parquet(self, path, chunk_size, matrix, **kwargs)
+
+    def _default_chunk_size(self) -> int:
+        """Number of time steps of chunks of about 2**24 values"""
+        return max(2 ** 24 // self.num_paths, 1)
+
+    def _white_noise(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        matrix: Optional[np.ndarray | pd.DataFrame] = None,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Get the white noise of a chunk of time steps, correlated by the 
+        Cholesky decomposition of `matrix` if provided.
+
+        Note
+        ----
+        The full series is the cached `white_noise`, which must not be 
+        modified. Chunks are drawn from the same stream, so that they match 
+        it with a fixed seed. If `out` is provided, the noise is written to 
+        it and `out` is returned, drawing it in place unless it is already 
+        cached.
+        """
+        # Draws are correlated into out, from a temporary array
+        noise_out = out if matrix is None else None
+
+        full = start == 0 and rows == self.length
+        if full and (out is None or 'white_noise' in self.__dict__):
+            noise = self.white_noise
+            if noise_out is not None:
+                noise_out[...] = noise
+                noise = noise_out
+        else:
+            noise = streams.normal(
+                'white_noise',
+                rows=rows,
+                loc=self.mean,
+                scale=np.sqrt(self.delta) * self.sigma,
+                out=noise_out
+            )
+
+        if matrix is not None:
+            noise = self.cholesky_transform(noise, matrix, out=out)
+        return noise
 
     @cached_property
     def white_noise(self) -> np.ndarray:
@@ -99,25 +544,228 @@ class BaseSynthetic(ABC):
         np.ndarray
             White noise (Wiener process) paths.
         """
-        return np.random.normal(
+        return self.streams().normal(
+            'white_noise',
+            rows=self.length,
             loc=self.mean,
-            scale=np.sqrt(self.delta) * self.sigma,
-            size=(self.length, self.num_paths)
+            scale=np.sqrt(self.delta) * self.sigma
         )
 
+    def streams(self) -> sth.RandomStreams:
+        """
+        Create the random streams of the model.
+
+        Note
+        ----
+        With a fixed seed, every call returns streams starting from the same 
+        state. If `seed` is None, fresh entropy is drawn on each call.
+
+        Returns
+        -------
+        RandomStreams
+            Independent random streams for each draw and block of paths.
+        """
+        return sth.RandomStreams(
+            np.random.SeedSequence(self._seed),
+            num_paths=self.num_paths,
+            block_size=self.block_size,
+            block_offset=self._block_offset,
+            bit_generator=self._bit_generator,
+            dtype=self._dtype,
+            variance_reduction=self._variance_reduction,
+            length=self.length
+        )
+
+    def _shard(
+        self,
+        start: int,
+        stop: int,
+        seed: Optional[int] = None
+    ) -> 'BaseSynthetic':
+        """
+        Create a copy of the model simulating a range of blocks of paths.
+
+        Note
+        ----
+        As each block of paths draws from its own random streams, the shard
+        simulates exactly the corresponding paths of the full model. Models
+        with per-path parameters slice them here.
+
+        Parameters
+        ----------
+        start : int
+            The first block of paths.
+        stop : int
+            The block of paths after the last one.
+        seed : int, optional
+            The seed of the shard, required when the model seed is None so
+            that all shards share the same entropy. Default is None.
+
+        Returns
+        -------
+        BaseSynthetic
+            The model simulating paths start * block_size to
+            stop * block_size.
+        """
+        shard = copy.copy(self)
+        for name in ('white_noise', 'red_noise', 'columns'):
+            shard.__dict__.pop(name, None)
+
+        # Share the resolved index and random streams
+        shard._length = self.index
+        shard._seed = self._seed if seed is None else seed
+        shard._num_paths = (
+            min(stop * self.block_size, self.num_paths) - start * self.block_size
+        )
+        shard._block_offset = self._block_offset + start
+        return shard
+
+    def _shared_seed(self) -> int:
+        """
+        The seed shared by all the shards of a simulation: the model seed, or 
+        fresh entropy if it is None.
+        """
+        if self._seed is None:
+            return np.random.SeedSequence().entropy
+        return self._seed
+
+    def iter_paths(
+        self,
+        batch_size: int,
+        output: Optional[str] = 'pandas',
+        out: Optional[np.ndarray] = None
+    ) -> Iterator[pd.Series | pd.DataFrame | np.ndarray]:
+        """
+        Generate synthetic data incrementally, in batches of paths.
+
+        Note
+        ----
+        Each batch holds all the time steps of a range of paths. Batches are 
+        made of whole blocks of paths (see `block_size`), each drawing from 
+        its own random streams, so that the batches are reproducible from 
+        the seed and their union equals `transform`, whatever the batch 
+        size. Peak memory is bounded by the batch rather than the number of 
+        paths.
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of paths per batch, rounded down to a multiple of 
+            `block_size` (of at least one block).
+        output : str, optional
+            The output type, one of 'pandas', 'numpy' or 'xarray' (see 
+            `to_output`). Default is 'pandas'.
+        out : np.ndarray, optional
+            An array of shape (length, num_paths) and of the model dtype, 
+            e.g. a `np.memmap`, each batch is written to the columns of. 
+            Batches are then views of `out`. If None, each batch is a new 
+            array. Default is None.
+
+        Yields
+        ------
+        pd.Series | pd.DataFrame | np.ndarray | xr.DataArray
+            Batches of synthetic data of shape (length, batch), with the 
+            column labels of the full simulation.
+        """
+        self._check_output(output)
+        if out is not None:
+            self._check_out(out)
+        if batch_size < 1:
+            raise ValueError(
+                f"Batch size must be at least 1. Got {batch_size}."
+            )
+
+        blocks = max(batch_size // self.block_size, 1)
+        num_blocks = -(-self.num_paths // self.block_size)
+        seed = self._shared_seed()
+        for start in range(0, num_blocks, blocks):
+            stop = min(start + blocks, num_blocks)
+            shard = self._shard(start, stop, seed=seed)
+            first = start * self.block_size
+            yield shard.transform(
+                output=output,
+                out=(
+                    None if out is None
+                    else out[:, first:first + shard.num_paths]
+                )
+            )
+
     @property
     def seed(self) -> int:
-        if self._seed is not None:
-            np.random.seed(self._seed)
+        """Random seed value"""
         return self._seed
 
     @seed.setter
-    @sth.callback('white_noise')
-    def seed(self, value: int) -> float:
+    @sth.callback('white_noise', 'red_noise')
+    def seed(self, value: int):
         """Random seed value update"""
         self._seed = value
-        if self._seed is not None:
-            np.random.seed(self._seed)
+
+    @property
+    def bit_generator(self) -> str:
+        """Bit generator name"""
+        return self._bit_generator
+
+    @bit_generator.setter
+    @sth.callback('white_noise', 'red_noise')
+    def bit_generator(self, value: str):
+        """Bit generator value update"""
+        if value not in sth.BIT_GENERATORS:
+            raise ValueError(
+                f"Bit generator must be one of {list(sth.BIT_GENERATORS)}. "
+                f"Got '{value}'."
+            )
+        self._bit_generator = value
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Floating point type of the simulation"""
+        return self._dtype
+
+    @dtype.setter
+    @sth.callback('white_noise', 'red_noise')
+    def dtype(self, value: str | np.dtype):
+        """Floating point type value update"""
+        self._check_dtype(value)
+        self._dtype = np.dtype(value)
+
+    @staticmethod
+    def _check_dtype(dtype: str | np.dtype):
+        try:
+            valid = np.dtype(dtype) in (np.float32, np.float64)
+        except TypeError:
+            valid = False
+        if not valid:
+            raise ValueError(
+                f"Dtype must be 'float32' or 'float64'. Got '{dtype}'."
+            )
+
+    @property
+    def variance_reduction(self) -> Optional[str]:
+        """Variance reduction technique"""
+        return self._variance_reduction
+
+    @variance_reduction.setter
+    @sth.callback('white_noise', 'red_noise')
+    def variance_reduction(self, value: Optional[str]):
+        """Variance reduction technique value update"""
+        self._check_variance_reduction(value)
+        self._variance_reduction = value
+
+    def _check_variance_reduction(self, variance_reduction: Optional[str]):
+        if variance_reduction not in sth.VARIANCE_REDUCTIONS:
+            raise ValueError(
+                "Variance reduction must be one of "
+                f"{sth.VARIANCE_REDUCTIONS}. Got '{variance_reduction}'."
+            )
+        if (
+            variance_reduction == 'sobol'
+            and self.length > sth.SOBOL_MAX_DIMENSION
+        ):
+            raise ValueError(
+                f"Sobol variance reduction is limited to "
+                f"{sth.SOBOL_MAX_DIMENSION} time steps. Got {self.length}."
+            )
 
     @property
     def mean(self) -> float:
@@ -176,55 +824,128 @@ class BaseSynthetic(ABC):
         if not hasattr(self, 'tau'):
             raise AttributeError(f"{self} does not integrate red noise.")
 
-        # Initialize the red noise array
-        red_noise = np.zeros((self.length, self.num_paths))
-        previous_value = None
+        # The first step carries no filtered noise
+        noise = self.white_noise.copy()
+        noise[0] = 0
 
-        for i, noise in enumerate(self.white_noise):
-            time_diff = self.delta  # Assuming constant time intervals
+        red_noise, _ = sth.red_noise_filter(noise, self.tau, self.delta)
+        return red_noise
 
-            if previous_value is None:
-                previous_value = noise
-            else:
-                red_noise[i] = (
-                    (self.tau / (self.tau + time_diff)) *
-                    (time_diff * noise + previous_value)
-                )
+    def iter_red_noise(self, chunk_size: int) -> Iterator[np.ndarray]:
+        """
+        Generate red noise incrementally, in chunks of time steps.
 
-            previous_value = red_noise[i]
+        Note
+        ----
+        White noise is drawn one chunk at a time and the red noise filter 
+        state is carried from one chunk to the next, so that long horizons 
+        can be produced without materializing the full series. With a fixed 
+        seed, the concatenated chunks equal `red_noise`.
 
-        return red_noise
+        Parameters
+        ----------
+        chunk_size : int
+            The number of time steps per chunk.
+
+        Yields
+        ------
+        np.ndarray
+            Red noise chunks of shape (chunk_size, num_paths). The last chunk 
+            may be shorter.
+        """
+        if not hasattr(self, 'tau'):
+            raise AttributeError(f"{self} does not integrate red noise.")
+
+        streams = self.streams()
+
+        zi = None
+        for start in range(0, self.length, chunk_size):
+            noise = streams.normal(
+                'white_noise',
+                rows=min(chunk_size, self.length - start),
+                loc=self.mean,
+                scale=np.sqrt(self.delta) * self.sigma
+            )
+            if start == 0:
+                noise[0] = 0
+
+            red_noise, zi = sth.red_noise_filter(
+                noise, self.tau, self.delta, zi)
+            yield red_noise
 
     # #### Cholesky #### #
 
     @staticmethod
-    def cholesky_transform(rvs: np.array, matrix: np.array) -> np.ndarray:
+    def cholesky_transform(
+        rvs: np.array,
+        matrix: np.array,
+        out: Optional[np.ndarray] = None,
+        cache: Optional[sth.CholeskyCache] = None,
+        n_jobs: Optional[int] = None
+    ) -> np.ndarray:
         """
         Perform Cholesky transformation on random variables.
 
         Parameters
         ----------
         rvs : np.array
-            Random variables to transform.
+            Random variables to transform, of shape (length, num_paths).
         matrix : np.array
             The matrix for Cholesky decomposition.
+        out : np.ndarray, optional
+            A preallocated output array of shape (length, num_paths) and 
+            float dtype. If None, a new array is allocated. Default is None.
+        cache : CholeskyCache, optional
+            The cache of Cholesky factors. If None, the default cache shared 
+            by all models is used. Default is None.
+        n_jobs : int, optional
+            The number of threads the time steps are split across. As the 
+            matrix product releases the GIL, each thread transforms its rows 
+            into its slice of the output concurrently. If None, the product 
+            runs in a single call. Default is None.
 
         Returns
         -------
         np.ndarray
             Transformed random variables.
         """
-        try:
-            decomposition = np.linalg.cholesky(matrix)
+        if cache is None:
+            cache = sth.cholesky_cache
+
+        decomposition, _ = cache.factorize(matrix)
+        # Single precision variables are transformed in single precision
+        decomposition = decomposition.astype(
+            np.result_type(rvs, np.float32), copy=False)
 
-        except:
-            updated_matrix = sth.nearest_positive_definite(matrix)
-            decomposition = np.linalg.cholesky(updated_matrix)
+        # Equivalent to (decomposition @ rvs.T).T, without the transposed copy
+        if n_jobs is None or n_jobs <= 1 or len(rvs) < 2:
+            return np.matmul(rvs, decomposition.T, out=out)
 
-        # return (decomposition @ rvs.T).T
-        return np.matmul(decomposition, rvs.T).T
+        if out is None:
+            out = np.empty(np.shape(rvs), dtype=np.result_type(rvs, decomposition))
 
-    def create_corr_returns(self, matrix: np.ndarray | pd.DataFrame) -> pd.Series | pd.DataFrame:
+        bounds = np.linspace(0, len(rvs), min(n_jobs, len(rvs)) + 1).astype(int)
+        with ThreadPoolExecutor(max_workers=len(bounds) - 1) as executor:
+            futures = [
+                executor.submit(
+                    np.matmul,
+                    rvs[start:stop],
+                    decomposition.T,
+                    out=out[start:stop]
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+        return out
+
+    def create_corr_returns(
+        self,
+        matrix: np.ndarray | pd.DataFrame,
+        out: Optional[np.ndarray] = None,
+        n_jobs: Optional[int] = None,
+        output: Optional[str] = 'pandas'
+    ) -> pd.Series | pd.DataFrame | np.ndarray:
         """
         This method can construct a basket of correlated asset paths using the 
         Cholesky decomposition method.
@@ -233,36 +954,42 @@ class BaseSynthetic(ABC):
         ----------
         matrix : pd.DataFrame or np.array
             The matrix applied in Cholesky decomposition.
+        out : np.ndarray, optional
+            A preallocated output array of shape (length, num_paths) and 
+            of the model dtype the correlated returns are written to. If None, a 
+            new array is allocated. Default is None.
+        n_jobs : int, optional
+            The number of threads of the Cholesky transformation. If None, it 
+            runs in a single call. Default is None.
+        output : str, optional
+            The output type, one of 'pandas', 'numpy' or 'xarray' (see 
+            `to_output`). Default is 'pandas'.
 
         Returns
         -------
-        pd.Series or pd.DataFrame:
+        pd.Series or pd.DataFrame or np.ndarray or xr.DataArray:
             Data representing correlated log returns.
         """
-        self.seed  # Regenerate seed
+        self._check_output(output)
+        self._check_matrix(matrix)
 
         # Construct uncorrelated paths to convert into correlated paths
-        rvs = np.random.normal(
-            loc=0,
-            scale=np.sqrt(self.delta) * self.sigma,
-            size=(self.length + 1, self.num_paths)
+        rvs = self.streams().normal(
+            'corr_returns',
+            rows=self.length,
+            scale=np.sqrt(self.delta) * self.sigma
         )
-        rvs_matrix = np.matrix(rvs)
-
-        correlated_matrix = self.cholesky_transform(rvs_matrix, matrix)
 
-        extracted_paths = [[] for _ in range(1, self.num_paths + 1)]
-        for j in range(0, len(correlated_matrix) * self.num_paths - self.num_paths, self.num_paths):
-            for i in range(self.num_paths):
-                extracted_paths[i].append(correlated_matrix.item(j + i))
-
-        output = np.array(extracted_paths).T
-        return self.to_pandas(output)
+        returns = self.cholesky_transform(rvs, matrix, out=out, n_jobs=n_jobs)
+        return self.to_output(returns, output)
 
     # #### Converter #### #
 
     @staticmethod
-    def to_returns(log_returns: Iterable) -> np.ndarray:
+    def to_returns(
+        log_returns: Iterable,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         This method exponentiates a sequence of log-returns to returns.
 
@@ -270,30 +997,43 @@ class BaseSynthetic(ABC):
         ----------
         log_returns : Iterable
             An iterable containing log returns.
+        out : np.ndarray, optional
+            A preallocated output array, which may be `log_returns` itself. 
+            If None, a new array is allocated. Default is None.
 
         Returns
         -------
         np.ndarray
             An array of returns.
         """
-        return np.exp(log_returns)
+        return np.exp(log_returns, out=out)
 
     def to_prices(
         self,
         log_returns: Iterable,
-        start_value: Optional[float] = 100.0
+        start_value: Optional[float] = 100.0,
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
        This method converts a sequence of log returns into normal returns 
        (exponentiation) and then computes a price sequence given a starting 
        price, start_value.
 
+       Note
+       ----
+       The cumulative sum, exponentiation and scaling are all computed in a 
+       single array: `out` if provided (which may be `log_returns` itself, 
+       for no allocation at all), or else one new array.
+
        Parameters
        ----------
        log_returns : Iterable
            An iterable containing log returns.
        start_value : float, optional
            The starting value of the price sequence. Default is 100.0.
+       out : np.ndarray, optional
+           A preallocated output array of the shape of `log_returns`. If 
+           None, a new array is allocated. Default is None.
 
        Returns
        -------
@@ -301,13 +1041,21 @@ class BaseSynthetic(ABC):
            An array of price sequences.
        """
 
-        log_returns = np.cumsum(log_returns, axis=0)
+        prices = np.cumsum(np.asarray(log_returns), axis=0, out=out)
+        if not np.issubdtype(prices.dtype, np.inexact):
+            # Integer log returns, exponentiated in double precision
+            prices = prices.astype(np.float64)
 
-        returns = self.to_returns(log_returns)
+        self.to_returns(prices, out=prices)
         # A sequence of prices starting with start_value
-        return returns * start_value
+        prices *= start_value
+        return prices
 
-    def to_pandas(self, output: np.ndarray) -> pd.Series | pd.DataFrame:
+    def to_pandas(
+        self,
+        output: np.ndarray,
+        index: Optional[pd.DatetimeIndex] = None
+    ) -> pd.Series | pd.DataFrame:
         """
         Convert synthetic output to a pandas DataFrame or Series.
 
@@ -315,16 +1063,131 @@ class BaseSynthetic(ABC):
         ----------
         output : np.ndarray
             The synthetic output to convert.
+        index : pd.DatetimeIndex, optional
+            The dates of the output rows. If None, the model index is used. 
+            Default is None.
 
         Returns
         -------
         pd.DataFrame or pd.Series
             A pandas DataFrame or Series containing the converted data.
         """
-        return (
-            pd.Series(output[:, 0], index=self.index, name='symbol')
-            if output.shape[1] == 1
-            else pd.DataFrame(output, index=self.index, columns=['path_' + str(i+1) for i in range(self.num_paths)])
-            .rename_axis('Date', axis=0)
-            .rename_axis('symbol', axis=1)
+        if index is None:
+            index = self.index
+
+        if output.shape[1] == 1:
+            return pd.Series(output[:, 0], index=index, name='symbol')
+
+        # Build the axes labels upfront so that pandas wraps the array 
+        # without copying it
+        return pd.DataFrame(
+            output,
+            index=index.rename('Date'),
+            columns=self.columns,
+            copy=False
+        )
+
+    @cached_property
+    def columns(self) -> pd.Index:
+        """
+        Column labels of the simulated paths.
+
+        Note
+        ----
+        Labels are built on first use and cached, as building millions of 
+        labels dominates the cost of wrapping the output in pandas.
+
+        Returns
+        -------
+        pd.Index
+            The labels 'path_1', 'path_2', ... of the paths.
+        """
+        # Index of the first path, when simulating a subset of the paths
+        first = self._block_offset * self.block_size
+        return pd.Index(
+            ['path_' + str(i+1) for i in range(first, first + self.num_paths)],
+            name='symbol'
+        )
+
+    def to_xarray(
+        self,
+        output: np.ndarray,
+        index: Optional[pd.DatetimeIndex] = None
+    ):
+        """
+        Convert synthetic output to an xarray DataArray, without copying it.
+
+        Note
+        ----
+        Requires the optional `xarray` package.
+
+        Parameters
+        ----------
+        output : np.ndarray
+            The synthetic output to convert.
+        index : pd.DatetimeIndex, optional
+            The dates of the output rows. If None, the model index is used. 
+            Default is None.
+
+        Returns
+        -------
+        xr.DataArray
+            A DataArray of dimensions ('Date', 'symbol').
+        """
+        try:
+            import xarray as xr
+        except ImportError as error:
+            raise ImportError(
+                "xarray is required for the 'xarray' output. Install it with "
+                "`pip install python-synthetica[xarray]`."
+            ) from error
+
+        if index is None:
+            index = self.index
+
+        return xr.DataArray(
+            output,
+            coords={'Date': index.rename('Date'), 'symbol': self.columns},
+            dims=('Date', 'symbol')
         )
+
+    @staticmethod
+    def _check_output(output: str):
+        if output not in ('pandas', 'numpy', 'xarray'):
+            raise ValueError(
+                "Output must be 'pandas', 'numpy' or 'xarray'. Got "
+                f"'{output}'."
+            )
+
+    def to_output(
+        self,
+        paths: np.ndarray,
+        output: Optional[str] = 'pandas',
+        index: Optional[pd.DatetimeIndex] = None
+    ) -> pd.Series | pd.DataFrame | np.ndarray:
+        """
+        Convert synthetic paths to the requested output type.
+
+        Parameters
+        ----------
+        paths : np.ndarray
+            The synthetic paths of shape (length, num_paths).
+        output : str, optional
+            Either 'numpy', returning the array itself with no conversion, 
+            'pandas' (see `to_pandas`) or 'xarray' (see `to_xarray`). None of 
+            them copies the paths. Default is 'pandas'.
+        index : pd.DatetimeIndex, optional
+            The dates of the rows. If None, the model index is used. Default 
+            is None.
+
+        Returns
+        -------
+        pd.Series | pd.DataFrame | np.ndarray | xr.DataArray
+            The converted paths.
+        """
+        self._check_output(output)
+        if output == 'numpy':
+            return paths
+        if output == 'xarray':
+            return self.to_xarray(paths, index=index)
+        return self.to_pandas(paths, index=index)
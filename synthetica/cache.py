@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from hashlib import blake2b
+from threading import Lock
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+from .stats import nearest_positive_definite
+
+
+class CholeskyCache:
+    """
+    A least-recently-used cache of Cholesky factors keyed by matrix content.
+
+    The same correlation matrix is typically reused across many models and
+    `transform` calls. This cache stores its Cholesky factor, together with
+    whether the matrix had to be repaired with `nearest_positive_definite`,
+    so that the factorization runs once per distinct matrix. A single cache
+    can be shared across model instances and threads.
+
+    Attributes
+    ----------
+    max_bytes : int, optional
+        The maximum total size of the cached factors, in bytes. Least
+        recently used factors are evicted beyond this size. Default is
+        256 MiB.
+
+    Example
+    -------
+    >>> cache = CholeskyCache(max_bytes=64 * 2**20)
+    >>> factor, repaired = cache.factorize(matrix)
+    """
+
+    def __init__(self, max_bytes: Optional[int] = 256 * 2**20):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = Lock()
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}(entries={len(self)}, '
+            f'nbytes={self.nbytes}, max_bytes={self.max_bytes})'
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the cached factors, in bytes"""
+        return self._nbytes
+
+    @staticmethod
+    def key(matrix: np.ndarray) -> tuple:
+        """
+        Compute the cache key of a matrix from its shape and content.
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            A float64, C-contiguous matrix.
+
+        Returns
+        -------
+        tuple
+            The matrix shape and the digest of its bytes.
+        """
+        digest = blake2b(matrix.data, digest_size=16).hexdigest()
+        return matrix.shape, digest
+
+    def factorize(self, matrix: np.ndarray | pd.DataFrame) -> tuple[np.ndarray, bool]:
+        """
+        Return the (lower) Cholesky factor of a matrix, computing it on a
+        cache miss.
+
+        Note
+        ----
+        When the matrix is not positive-definite, the factor of its nearest
+        positive-definite matrix is returned and cached instead.
+
+        Parameters
+        ----------
+        matrix : np.ndarray or pd.DataFrame
+            The matrix for Cholesky decomposition.
+
+        Returns
+        -------
+        tuple[np.ndarray, bool]
+            The read-only Cholesky factor, and whether the matrix had to be
+            repaired to be positive-definite.
+        """
+        matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+        key = self.key(matrix)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        try:
+            factor = np.linalg.cholesky(matrix)
+            repaired = False
+
+        except np.linalg.LinAlgError:
+            factor = nearest_positive_definite(matrix, return_factor=True)
+            repaired = True
+
+        factor.setflags(write=False)
+        entry = (factor, repaired)
+
+        with self._lock:
+            self.misses += 1
+            if key not in self._entries and factor.nbytes <= self.max_bytes:
+                self._entries[key] = entry
+                self._nbytes += factor.nbytes
+                # Evict least recently used factors
+                while self._nbytes > self.max_bytes:
+                    _, (evicted, _) = self._entries.popitem(last=False)
+                    self._nbytes -= evicted.nbytes
+
+        return entry
+
+    def clear(self):
+        """Remove all cached factors"""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+# Default cache, shared by all models
+cholesky_cache = CholeskyCache()
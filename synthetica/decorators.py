@@ -1,7 +1,17 @@
 from functools import wraps
 
 
-def callback(cache_name):
+def _has_changed(current_value, new_value) -> bool:
+    """Returns true when the property value has changed"""
+    try:
+        return bool(current_value != new_value)
+
+    except (TypeError, ValueError):
+        # Array-like values (e.g. pd.DatetimeIndex) compare element-wise
+        return current_value is not new_value
+
+
+def callback(*cache_names):
     def decorator(setter_func):
         @wraps(setter_func)
         def wrapper(self, new_value, *args, **kwargs):
@@ -12,12 +22,13 @@ def callback(cache_name):
             # Call the original setter function
             result = setter_func(self, new_value, *args, **kwargs)
 
-            # If the value has changed, invalidate the cache
-            if current_value != new_value:
-                self.__dict__.pop(cache_name, None)
+            # If the value has changed, invalidate the caches
+            if _has_changed(current_value, new_value):
+                for cache_name in cache_names:
+                    self.__dict__.pop(cache_name, None)
 
             return result
-        
+
         return wrapper
-    
+
     return decorator
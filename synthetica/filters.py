@@ -0,0 +1,132 @@
+from typing import Iterable, Optional
+import numpy as np
+from scipy.signal import lfilter
+
+
+def red_noise_filter(
+    noise: np.ndarray,
+    tau: float,
+    delta: float,
+    zi: Optional[np.ndarray] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Apply the first-order recursive (IIR) red noise filter along the time
+    axis.
+
+    The filter computes, for every path at once:
+
+    $$
+    y_t = \\frac{\\tau}{\\tau + \\delta} (\\delta x_t + y_{t-1})
+    $$
+
+    Parameters
+    ----------
+    noise : np.ndarray
+        White noise of shape (length, num_paths).
+    tau : float
+        The filter time constant.
+    delta : float
+        The time step size.
+    zi : np.ndarray, optional
+        The filter state returned by a previous call, of shape
+        (1, num_paths). If None, the filter starts at rest. Default is None.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The filtered noise and the final filter state, which can be passed as
+        `zi` to filter the next chunk of the same series.
+    """
+    # Filter in the precision of the noise (float32 or float64)
+    dtype = np.result_type(noise, np.float32)
+    coef = tau / (tau + delta)
+    if zi is None:
+        zi = np.zeros((1,) + noise.shape[1:], dtype=dtype)
+
+    return lfilter(
+        np.array([coef * delta], dtype=dtype),
+        np.array([1.0, -coef], dtype=dtype),
+        noise,
+        axis=0,
+        zi=np.asarray(zi, dtype=dtype)
+    )
+
+
+def all_pole_filter(
+    x: np.ndarray,
+    ar: Iterable[float],
+    zi: Optional[np.ndarray] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Apply an all-pole (autoregressive) linear filter along the time axis.
+
+    The filter computes, for every path at once:
+
+    $$
+    y_t = x_t + \\sum_{j=1}^{p} a_j y_{t-j}
+    $$
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Input (innovations) of shape (length, num_paths).
+    ar : Iterable[float]
+        The autoregressive coefficients a_1, ..., a_p.
+    zi : np.ndarray, optional
+        The filter state of shape (p, num_paths), either returned by a 
+        previous call or built from past values with `all_pole_zi`. If None, 
+        past values are zero. Default is None.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The filtered series and the final filter state, which can be passed 
+        as `zi` to filter the next chunk of the same series.
+    """
+    # Filter in the precision of the input (float32 or float64)
+    dtype = np.result_type(x, np.float32)
+    ar = np.asarray(ar, dtype=dtype)
+    if zi is None:
+        zi = np.zeros((len(ar),) + x.shape[1:], dtype=dtype)
+
+    return lfilter(
+        np.ones(1, dtype=dtype),
+        np.r_[1.0, -ar].astype(dtype),
+        x,
+        axis=0,
+        zi=np.asarray(zi, dtype=dtype)
+    )
+
+
+def all_pole_zi(ar: Iterable[float], past: np.ndarray) -> np.ndarray:
+    """
+    Build the initial state of `all_pole_filter` from past values.
+
+    Parameters
+    ----------
+    ar : Iterable[float]
+        The autoregressive coefficients a_1, ..., a_p.
+    past : np.ndarray
+        The p most recent values y_{-p}, ..., y_{-1} of shape (p, num_paths) 
+        or (p,), ordered from the oldest to the most recent.
+
+    Returns
+    -------
+    np.ndarray
+        The filter state of shape (p, num_paths) or (p,).
+    """
+    ar = np.asarray(ar, dtype=np.float64)
+    past = np.asarray(past, dtype=np.float64)
+    order = len(ar)
+    if len(past) != order:
+        raise ValueError(
+            f"Expected {order} past values, got {len(past)}."
+        )
+
+    # Most recent value first: recent[m] = y_{-1-m}
+    recent = past[::-1]
+    zi = np.zeros_like(recent)
+    for k in range(order):
+        # z_k = sum_{m=k}^{p-1} a_{m+1} y_{-1-(m-k)}
+        zi[k] = np.tensordot(ar[k:], recent[:order - k], axes=1)
+    return zi
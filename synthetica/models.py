@@ -1,7 +1,8 @@
 import numpy as np
 import pandas as pd
-from scipy.stats import levy_stable, norm
+from scipy.special import ndtr
 
+import synthetica as sth
 from synthetica import BaseSynthetic
 
 
@@ -31,6 +32,19 @@ class GeometricBrownianMotion(BaseSynthetic):
         The frequency of the data. Default is 'D'.
     seed : int, optional
         The random seed for reproducibility. Default is None.
+    as_of : str | pd.Timestamp, optional
+        The anchor (last) date of the generated index. Default is None.
+    bit_generator : str, optional
+        The bit generator of the random streams, one of 'pcg64', 'pcg64dxsm', 
+        'philox', 'sfc64' or 'mt19937'. Default is 'pcg64'.
+    dtype : str, optional
+        The floating point precision of the simulation, 'float32' or 
+        'float64'. Default is 'float64'.
+    variance_reduction : str, optional
+        The variance reduction technique, None, 'antithetic' to mirror the 
+        normal variables of adjacent paths, 'sobol' for quasi-Monte Carlo 
+        normal variables or 'moment_matching' to match their mean and 
+        variance across paths (see `BaseSynthetic`). Default is None.
 
     Note
     ----
@@ -59,7 +73,11 @@ class GeometricBrownianMotion(BaseSynthetic):
         sigma: float = 0.125,
         mu: float = 0.058,
         freq: str = 'D',
-        seed: int = None
+        seed: int = None,
+        as_of: str | pd.Timestamp = None,
+        bit_generator: str = 'pcg64',
+        dtype: str = 'float64',
+        variance_reduction: str = None
     ):
         super().__init__(
             length=length,
@@ -68,38 +86,68 @@ class GeometricBrownianMotion(BaseSynthetic):
             delta=delta,
             sigma=sigma,
             freq=freq,
-            seed=seed
+            seed=seed,
+            as_of=as_of,
+            bit_generator=bit_generator,
+            dtype=dtype,
+            variance_reduction=variance_reduction
         )
         self.mu = mu
 
-    def transform(self, matrix: pd.DataFrame | np.ndarray = None) -> pd.Series | pd.DataFrame:
+    def _initial_state(self) -> float:
+        return 100.0
+
+    def expectation(self) -> pd.Series:
         """
-        Generate synthetic Geometric Brownian Motion (GBM) data.
+        Compute the analytic expectation of the prices.
 
-        Parameters
-        ----------
-        matrix : pd.DataFrame or np.array, optional
-            The matrix applied in Cholesky decomposition (optional).
+        Note
+        ----
+        Log returns are normal, with mean `mean + (mu - sigma^2 / 2) delta` 
+        and variance `sigma^2 delta`, so that the expected price after t 
+        steps is S_0 exp(t (mean + mu delta)). It is the expectation of 
+        control variates (see `control_variate`).
 
         Returns
         -------
-        pd.Series | pd.DataFrame
-            Data containing synthetic GBM data.
+        pd.Series
+            The expected price at each date of the index.
+        """
+        steps = np.arange(1, self.length + 1)
+        return pd.Series(
+            self._initial_state()
+            * np.exp(steps * (self.mean + self.mu * self.delta)),
+            index=self.index,
+            name='expectation'
+        )
+
+    def _simulate(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: float | np.ndarray,
+        matrix: pd.DataFrame | np.ndarray = None,
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generate synthetic Geometric Brownian Motion (GBM) data.
+
+        Note
+        ----
+        The state is the last price of each path.
         """
         sigma_pow_mu_delta = (
             self.mu - 0.5 * np.power(self.sigma, 2.0)
         ) * self.delta
 
-        noise = (
-            self.cholesky_transform(self.white_noise, matrix)
-            if matrix is not None
-            else self.white_noise
-        )
+        noise = self._white_noise(streams, start, rows, matrix, out=out)
 
-        paths = np.array(noise) + sigma_pow_mu_delta
-        prices = self.to_prices(paths)
+        # In place when the noise is drawn into out
+        paths = np.add(noise, sigma_pow_mu_delta, out=out)
+        prices = self.to_prices(paths, start_value=state, out=paths)
 
-        return self.to_pandas(prices)
+        return prices, prices[-1].copy()
 
 
 class Heston(BaseSynthetic):
@@ -139,10 +187,28 @@ class Heston(BaseSynthetic):
         The long-run average volatility. Default is 0.20^2.
     nu : float, optional
         The volatility of the volatility. Default is 0.6.
+    method : str, optional
+        The variance discretization scheme, either 'euler' (Euler full 
+        truncation) or 'qe' (Andersen's Quadratic-Exponential scheme with 
+        martingale correction, accurate at much larger time steps). Default 
+        is 'euler'.
     freq : str, optional
         The frequency of the data. Default is 'D'.
     seed : int, optional
         The random seed for reproducibility. Default is None.
+    as_of : str | pd.Timestamp, optional
+        The anchor (last) date of the generated index. Default is None.
+    bit_generator : str, optional
+        The bit generator of the random streams, one of 'pcg64', 'pcg64dxsm', 
+        'philox', 'sfc64' or 'mt19937'. Default is 'pcg64'.
+    dtype : str, optional
+        The floating point precision of the simulation, 'float32' or 
+        'float64'. Default is 'float64'.
+    variance_reduction : str, optional
+        The variance reduction technique, None, 'antithetic' to mirror the 
+        normal variables of adjacent paths, 'sobol' for quasi-Monte Carlo 
+        normal variables or 'moment_matching' to match their mean and 
+        variance across paths (see `BaseSynthetic`). Default is None.
 
     Example
     -------
@@ -175,8 +241,13 @@ class Heston(BaseSynthetic):
         kappa: float = 3,
         theta: float = 0.20**2,
         nu: float = 0.6,
+        method: str = 'euler',
         freq: str = 'D',
-        seed: int = None
+        seed: int = None,
+        as_of: str | pd.Timestamp = None,
+        bit_generator: str = 'pcg64',
+        dtype: str = 'float64',
+        variance_reduction: str = None
     ):
         super().__init__(
             length=length,
@@ -185,7 +256,11 @@ class Heston(BaseSynthetic):
             delta=delta,
             sigma=sigma,
             freq=freq,
-            seed=seed
+            seed=seed,
+            as_of=as_of,
+            bit_generator=bit_generator,
+            dtype=dtype,
+            variance_reduction=variance_reduction
         )
         self.start_value = start_value
         self.rho = rho
@@ -194,62 +269,240 @@ class Heston(BaseSynthetic):
         self.kappa = kappa
         self.theta = theta
         self.nu = nu
+        self.method = method
+
+        if self.method not in ('euler', 'qe'):
+            raise ValueError(
+                "Discretization method must be 'euler' or 'qe'. Got "
+                f"'{self.method}'."
+            )
+
+        if self.method == 'qe' and self.kappa <= 0:
+            raise ValueError(
+                "The QE scheme requires a positive mean reversion speed "
+                f"(kappa). Got {self.kappa}."
+            )
+
+    def _initial_state(self) -> tuple[np.ndarray, np.ndarray]:
+        price = self.start_value
+        if self.method == 'qe':
+            price = np.log(self.start_value)
+
+        return (
+            np.full(self.num_paths, price, dtype=self.dtype),
+            np.full(self.num_paths, self.vol0, dtype=self.dtype)
+        )
 
-    def transform(self, matrix: pd.DataFrame | np.ndarray = None) -> pd.Series | pd.DataFrame:
+    def _simulate(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: tuple[np.ndarray, np.ndarray],
+        matrix: pd.DataFrame | np.ndarray = None,
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]:
         """
         Generate synthetic Heston model data.
 
-        Parameters
-        ----------
-        matrix : pd.DataFrame or np.array, optional
-            The matrix applied in Cholesky decomposition (optional).
-
-        Returns
-        -------
-        pd.Series | pd.DataFrame
-            Data containing synthetic Heston model data.
+        Note
+        ----
+        The state is the last price (log price with the 'qe' method) and
+        the last variance of each path.
         """
-        bm_volatility = np.random.multivariate_normal(
-            mean=np.array([0, 0]),
-            cov=np.array([[1, self.rho], [self.rho, 1]]),
-            size=(self.length, self.num_paths)
-        )
+        # Two independent standard normal drivers
+        z_price = streams.standard_normal('price', rows=rows)
+        z_volatility = streams.standard_normal('volatility', rows=rows)
 
         if matrix is not None:
-            bm_volatility = self.cholesky_transform(bm_volatility, matrix)
+            z_price = self.cholesky_transform(z_price, matrix)
+            z_volatility = self.cholesky_transform(z_volatility, matrix)
+
+        if self.method == 'qe':
+            return self._qe_paths(z_price, z_volatility, state, out=out)
 
-        # arrays for storing prices and variances
-        prices = np.full(
-            shape=((self.length+1, self.num_paths)),
-            fill_value=self.start_value,
-            dtype=np.float64
+        # Brownian motions correlated by rho
+        bm_price = z_price
+        bm_volatility = (
+            self.rho * z_price + np.sqrt(1 - self.rho ** 2) * z_volatility
         )
-        volatility = np.full(
-            shape=((self.length+1, self.num_paths)),
-            fill_value=self.vol0,
-            dtype=np.float64
+
+        # array for storing prices
+        prices = (
+            np.empty((rows, self.num_paths), dtype=self.dtype)
+            if out is None
+            else out
         )
+        price, volatility = state
 
-        for length in range(1, self.length + 1):
-            prices[length] = (
-                prices[length-1]
+        for length in range(rows):
+            price = (
+                price
                 * np.exp(
-                    (self.rf - 0.5 * volatility[length-1])
+                    (self.rf - 0.5 * volatility)
                     * self.delta
-                    + np.sqrt(volatility[length-1] * self.delta)
-                    * bm_volatility[length-1, :, 0]
+                    + np.sqrt(volatility * self.delta)
+                    * bm_price[length]
                 )
             )
             prev_vol = (
-                volatility[length-1] + self.kappa *
-                (self.theta - volatility[length-1]) *
+                volatility + self.kappa *
+                (self.theta - volatility) *
                 self.delta + self.nu *
-                np.sqrt(volatility[length-1] * self.delta) *
-                bm_volatility[length-1, :, 1]
+                np.sqrt(volatility * self.delta) *
+                bm_volatility[length]
             )
-            volatility[length] = np.maximum(prev_vol, 0)
+            volatility = np.maximum(prev_vol, 0)
+            prices[length] = price
+
+        return prices, (price, volatility)
+
+    def _qe_paths(
+        self,
+        z_price: np.ndarray,
+        z_volatility: np.ndarray,
+        state: tuple[np.ndarray, np.ndarray],
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+        """
+        Simulate Heston prices with Andersen's Quadratic-Exponential (QE) 
+        scheme.
+
+        Note
+        ----
+        The variance is moment-matched to its exact conditional mean and 
+        variance, either with a squared (scaled) normal variable when the 
+        ratio psi = variance / mean^2 is at most 1.5, or with a mixture of a 
+        point mass at zero and an exponential variable otherwise. The log 
+        price is integrated with the central (gamma_1 = gamma_2 = 1/2) 
+        discretization of the variance integral, correlation rho being 
+        carried by the variance increments. The martingale correction makes 
+        discounted prices exact martingales in the discrete scheme. Without 
+        volatility of volatility (nu = 0), the variance follows its 
+        deterministic mean and the log price is conditionally normal, so 
+        that neither correlation nor correction applies.
+
+        Parameters
+        ----------
+        z_price : np.ndarray
+            Standard normal drivers of the log price, of shape 
+            (length, num_paths).
+        z_volatility : np.ndarray
+            Standard normal drivers of the variance, independent of 
+            `z_price`, of shape (length, num_paths).
+        state : tuple[np.ndarray, np.ndarray]
+            The last log price and variance of each path.
+        out : np.ndarray, optional
+            A preallocated array of shape (length, num_paths) the log prices, 
+            then prices, are computed in. Default is None.
+
+        Returns
+        -------
+        tuple[np.ndarray, tuple[np.ndarray, np.ndarray]]
+            Price paths of shape (length, num_paths), and the last log price 
+            and variance of each path.
+        """
+        psi_c = 1.5
+        gamma_1 = gamma_2 = 0.5
+
+        decay = np.exp(-self.kappa * self.delta)
+
+        log_prices = (
+            np.empty(z_price.shape, dtype=z_price.dtype) if out is None else out
+        )
+        log_price, volatility = state
+
+        if self.nu == 0:
+            # Deterministic variance, integrated with the same gammas
+            for length in range(len(z_price)):
+                next_volatility = self.theta + (volatility - self.theta) * decay
+                integrated = (
+                    gamma_1 * volatility + gamma_2 * next_volatility
+                ) * self.delta
+                log_price = (
+                    log_price + self.rf * self.delta - 0.5 * integrated
+                    + np.sqrt(integrated) * z_price[length]
+                )
+                log_prices[length] = log_price
+                volatility = next_volatility
+
+            return np.exp(log_prices, out=log_prices), (log_price, volatility)
+
+        k0 = - self.rho * self.kappa * self.theta * self.delta / self.nu
+        k1 = (
+            gamma_1 * self.delta * (self.kappa * self.rho / self.nu - 0.5)
+            - self.rho / self.nu
+        )
+        k2 = (
+            gamma_2 * self.delta * (self.kappa * self.rho / self.nu - 0.5)
+            + self.rho / self.nu
+        )
+        k3 = gamma_1 * self.delta * (1 - self.rho ** 2)
+        k4 = gamma_2 * self.delta * (1 - self.rho ** 2)
+        big_a = k2 + 0.5 * k4
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for length in range(len(z_price)):
+                # Exact conditional moments of the variance
+                m = self.theta + (volatility - self.theta) * decay
+                s2 = (
+                    volatility * self.nu ** 2 * decay * (1 - decay) / self.kappa
+                    + self.theta * self.nu ** 2 * (1 - decay) ** 2
+                    / (2 * self.kappa)
+                )
+                psi = s2 / m ** 2
+                quadratic = psi <= psi_c
+
+                # Quadratic branch
+                inv_psi = 2 / psi
+                b2 = np.where(
+                    quadratic,
+                    inv_psi - 1 + np.sqrt(inv_psi)
+                    * np.sqrt(np.maximum(inv_psi - 1, 0)),
+                    0
+                )
+                a = m / (1 + b2)
+
+                # Exponential branch, with U = N(z) and 1 - U = N(-z), in the 
+                # precision of the drivers
+                p = np.where(quadratic, 0, (psi - 1) / (psi + 1))
+                beta = (1 - p) / m
+                upper_tail = ndtr(-z_volatility[length])
+
+                next_volatility = np.where(
+                    quadratic,
+                    a * (np.sqrt(b2) + z_volatility[length]) ** 2,
+                    np.where(
+                        1 - upper_tail <= p,
+                        0,
+                        np.log((1 - p) / upper_tail) / beta
+                    )
+                )
+
+                # Martingale correction
+                martingale = np.where(
+                    quadratic,
+                    np.exp(big_a * b2 * a / (1 - 2 * big_a * a))
+                    / np.sqrt(1 - 2 * big_a * a),
+                    p + beta * (1 - p) / (beta - big_a)
+                )
+                valid = np.where(quadratic, 2 * big_a * a < 1, big_a < beta)
+                k0_star = np.where(
+                    valid,
+                    - np.log(martingale) - (k1 + 0.5 * k3) * volatility,
+                    k0
+                )
+
+                log_price = (
+                    log_price + self.rf * self.delta + k0_star
+                    + k1 * volatility + k2 * next_volatility
+                    + np.sqrt(k3 * volatility + k4 * next_volatility)
+                    * z_price[length]
+                )
+                log_prices[length] = log_price
+                volatility = next_volatility
 
-        return self.to_pandas(prices[1:,])
+        return np.exp(log_prices, out=log_prices), (log_price, volatility)
 
 
 class Merton(BaseSynthetic):
@@ -282,6 +535,19 @@ class Merton(BaseSynthetic):
         The frequency of the data. Default is 'D'.
     seed : int, optional
         The random seed for reproducibility. Default is None.
+    as_of : str | pd.Timestamp, optional
+        The anchor (last) date of the generated index. Default is None.
+    bit_generator : str, optional
+        The bit generator of the random streams, one of 'pcg64', 'pcg64dxsm', 
+        'philox', 'sfc64' or 'mt19937'. Default is 'pcg64'.
+    dtype : str, optional
+        The floating point precision of the simulation, 'float32' or 
+        'float64'. Default is 'float64'.
+    variance_reduction : str, optional
+        The variance reduction technique, None, 'antithetic' to mirror the 
+        normal variables of adjacent paths, 'sobol' for quasi-Monte Carlo 
+        normal variables or 'moment_matching' to match their mean and 
+        variance across paths (see `BaseSynthetic`). Default is None.
 
     Note
     ------
@@ -314,7 +580,11 @@ class Merton(BaseSynthetic):
         var: float = 0.001,
         mu: float = 0.2,
         freq: str = 'D',
-        seed: int = None
+        seed: int = None,
+        as_of: str | pd.Timestamp = None,
+        bit_generator: str = 'pcg64',
+        dtype: str = 'float64',
+        variance_reduction: str = None
     ):
         super().__init__(
             length=length,
@@ -323,53 +593,88 @@ class Merton(BaseSynthetic):
             delta=delta,
             sigma=sigma,
             freq=freq,
-            seed=seed
+            seed=seed,
+            as_of=as_of,
+            bit_generator=bit_generator,
+            dtype=dtype,
+            variance_reduction=variance_reduction
         )
         self.lmbda = lmbda
         self.var = var
         self.mu = mu
 
-    def transform(self, matrix: pd.DataFrame | np.ndarray = None) -> pd.Series | pd.DataFrame:
+    def _jumps(
+        self,
+        streams: sth.RandomStreams,
+        rows: int,
+        out: np.ndarray = None
+    ) -> np.ndarray:
         """
-        Generate synthetic Merton model data.
+        Generate the compound Poisson jump component.
+
+        Note
+        ----
+        Jumps arrive as a Poisson process with intensity `lmbda` per time 
+        step, so each (step, path) cell receives an independent 
+        Poisson(`lmbda`) number of jumps. As the sum of k independent 
+        N(`mu`, `var`) jump sizes is N(k * `mu`, sqrt(k) * `var`), sizes are 
+        only drawn for the cells with at least one jump.
 
         Parameters
         ----------
-        matrix : pd.DataFrame or np.array, optional
-            The matrix applied in Cholesky decomposition (optional).
+        streams : RandomStreams
+            The random streams of the simulation.
+        rows : int
+            The number of time steps.
+        out : np.ndarray, optional
+            An array of shape (rows, num_paths) the jumps are added to, in 
+            place. If None, the jumps are returned in a new array. Default is 
+            None.
 
         Returns
         -------
-        pd.Series | pd.DataFrame
-            Data containing synthetic Merton model data.
+        np.ndarray
+            Aggregated jump sizes (added to `out` if provided) of shape 
+            (rows, num_paths).
         """
-        small_lmbda = - (1.0 / self.lmbda)
-        jump = np.zeros((self.length, self.num_paths), dtype=np.float64)
-
-        for path in range(self.num_paths):
-            s_n = time = 0
-
-            while s_n < self.length:
-                s_n += small_lmbda * np.log(np.random.uniform(0, 1))
+        return streams.compound_poisson(
+            'jumps',
+            'jump_sizes',
+            rows=rows,
+            lam=self.lmbda,
+            loc=self.mu,
+            scale=self.var,
+            out=out
+        )
 
-                for length in range(self.length):
-                    if time * self.delta <= s_n * self.delta <= (length + 1) * self.delta:
-                        rand = np.random.normal(self.mu, self.var)
-                        jump[length, path] += rand
-                        break
+    def _initial_state(self) -> float:
+        return 100.0
 
-                time += 1
+    def _simulate(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: float | np.ndarray,
+        matrix: pd.DataFrame | np.ndarray = None,
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generate synthetic Merton model data.
 
-        noise = (
-            self.cholesky_transform(self.white_noise, matrix)
-            if matrix is not None
-            else self.white_noise
-        )
+        Note
+        ----
+        The state is the last price of each path.
+        """
+        paths = self._white_noise(streams, start, rows, matrix, out=out)
+        if out is None:
+            # Leave the cached white noise untouched
+            paths = np.array(paths)
 
-        paths = np.add(jump, noise)
-        prices = self.to_prices(paths)
+        self._jumps(streams, rows, out=paths)
+        prices = self.to_prices(paths, start_value=state, out=paths)
 
-        return self.to_pandas(prices)
+        return prices, prices[-1].copy()
 
 
 class Poisson(BaseSynthetic):
@@ -402,6 +707,19 @@ class Poisson(BaseSynthetic):
         The frequency of the data. Default is 'D'.
     seed : int, optional
         The random seed for reproducibility. Default is None.
+    as_of : str | pd.Timestamp, optional
+        The anchor (last) date of the generated index. Default is None.
+    bit_generator : str, optional
+        The bit generator of the random streams, one of 'pcg64', 'pcg64dxsm', 
+        'philox', 'sfc64' or 'mt19937'. Default is 'pcg64'.
+    dtype : str, optional
+        The floating point precision of the simulation, 'float32' or 
+        'float64'. Default is 'float64'.
+    variance_reduction : str, optional
+        The variance reduction technique, None, 'antithetic' to mirror the 
+        normal variables of adjacent paths, 'sobol' for quasi-Monte Carlo 
+        normal variables or 'moment_matching' to match their mean and 
+        variance across paths (see `BaseSynthetic`). Default is None.
 
     Note
     ----
@@ -434,7 +752,11 @@ class Poisson(BaseSynthetic):
         var: float = 0.001,
         mu: float = 0.2,
         freq: str = 'D',
-        seed: int = None
+        seed: int = None,
+        as_of: str | pd.Timestamp = None,
+        bit_generator: str = 'pcg64',
+        dtype: str = 'float64',
+        variance_reduction: str = None
     ):
         super().__init__(
             length=length,
@@ -443,7 +765,11 @@ class Poisson(BaseSynthetic):
             delta=delta,
             sigma=sigma,
             freq=freq,
-            seed=seed
+            seed=seed,
+            as_of=as_of,
+            bit_generator=bit_generator,
+            dtype=dtype,
+            variance_reduction=variance_reduction
         )
         self.lmbda = lmbda
         self.var = var
@@ -457,69 +783,78 @@ class Poisson(BaseSynthetic):
     def lambda_poisson(self, l: int | float = 2) -> float:
         self.lambda_poisson = l * (1 / self.length)
 
-    def _inverse_poisson(self) -> int:
+    def _jumps(
+        self,
+        streams: sth.RandomStreams,
+        rows: int,
+        out: np.ndarray = None
+    ) -> np.ndarray:
         """
-        Calculate the inverse of the Poisson cumulative distribution function.
+        Generate the compound Poisson jump component.
+
+        Note
+        ----
+        The number of jumps k in each (step, path) cell is drawn from a 
+        Poisson(`lambda_poisson`) distribution. As the sum of k independent 
+        N(`mu`, `var`) jump sizes is N(k * `mu`, sqrt(k) * `var`), the total 
+        jump of a cell is drawn in a single normal draw.
 
-        Parameters:
+        Parameters
         ----------
-        u : float
-            Random uniform variable.
-        lmbda : float
-            Lambda parameter for Poisson distribution.
+        streams : RandomStreams
+            The random streams of the simulation.
+        rows : int
+            The number of time steps.
+        out : np.ndarray, optional
+            An array of shape (rows, num_paths) the jumps are added to, in 
+            place. If None, the jumps are returned in a new array. Default is 
+            None.
 
         Returns
         -------
-        int
-            Inverse Poisson random variable.
+        np.ndarray
+            Aggregated jump sizes (added to `out` if provided) of shape 
+            (rows, num_paths).
         """
-        poisson = np.exp(-self.lambda_poisson)
-        F = poisson
-        k = 0
-        u = np.random.rand()
-        while u > F:
-            k = k + 1
-            poisson = poisson * (self.lambda_poisson / k)
-            F = F + poisson
-
-        return k
-
-    def transform(self, matrix: pd.DataFrame | np.ndarray = None) -> pd.Series | pd.DataFrame:
+        # Only cells with at least one jump need a size draw
+        return streams.compound_poisson(
+            'jumps',
+            'jump_sizes',
+            rows=rows,
+            lam=self.lambda_poisson,
+            loc=self.mu,
+            scale=self.var,
+            out=out
+        )
+
+    def _initial_state(self) -> float:
+        return 100.0
+
+    def _simulate(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: float | np.ndarray,
+        matrix: pd.DataFrame | np.ndarray = None,
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
         Generate synthetic data using the Poisson model.
 
-        Parameters
-        ----------
-        matrix : pd.DataFrame or np.array, optional
-            The matrix applied in Cholesky decomposition (optional).
-
-        Returns
-        -------
-        pd.Series | pd.DataFrame
-            Data containing synthetic data following the poisson process model.
+        Note
+        ----
+        The state is the last price of each path.
         """
-        jump = np.zeros((self.length, self.num_paths))
-        for path in range(self.num_paths):
-            for length in range(self.length):
-                alea_poisson = self._inverse_poisson()
-                if alea_poisson != 0:
-                    for j in range(0, alea_poisson):
-                        jump[length, path] += norm.ppf(
-                            np.random.rand(),
-                            loc=self.mu,
-                            scale=self.var
-                        )
-
-        noise = (
-            self.cholesky_transform(self.white_noise, matrix)
-            if matrix is not None
-            else self.white_noise
-        )
+        paths = self._white_noise(streams, start, rows, matrix, out=out)
+        if out is None:
+            # Leave the cached white noise untouched
+            paths = np.array(paths)
 
-        paths = np.add(jump, noise)
-        prices = self.to_prices(paths)
+        self._jumps(streams, rows, out=paths)
+        prices = self.to_prices(paths, start_value=state, out=paths)
 
-        return self.to_pandas(prices)
+        return prices, prices[-1].copy()
 
 
 class LevyStable(BaseSynthetic):
@@ -554,6 +889,19 @@ class LevyStable(BaseSynthetic):
         The frequency of the data. Default is 'D'.
     seed : int, optional
         The random seed for reproducibility. Default is None.
+    as_of : str | pd.Timestamp, optional
+        The anchor (last) date of the generated index. Default is None.
+    bit_generator : str, optional
+        The bit generator of the random streams, one of 'pcg64', 'pcg64dxsm', 
+        'philox', 'sfc64' or 'mt19937'. Default is 'pcg64'.
+    dtype : str, optional
+        The floating point precision of the simulation, 'float32' or 
+        'float64'. Default is 'float64'.
+    variance_reduction : str, optional
+        The variance reduction technique, None, 'antithetic' to mirror the 
+        normal variables of adjacent paths, 'sobol' for quasi-Monte Carlo 
+        normal variables or 'moment_matching' to match their mean and 
+        variance across paths (see `BaseSynthetic`). Default is None.
 
     Note
     ----
@@ -580,6 +928,9 @@ class LevyStable(BaseSynthetic):
     >>> synthetic_data = levy_stable_model.transform()
     """
 
+    # Number of variables transformed at once
+    chunk_variables = 2 ** 16
+
     def __init__(
         self,
         length: int | pd.DatetimeIndex = 252,
@@ -590,7 +941,11 @@ class LevyStable(BaseSynthetic):
         alpha: float = 1.68,
         beta: float = 0.01,
         freq: str = 'D',
-        seed: int = None
+        seed: int = None,
+        as_of: str | pd.Timestamp = None,
+        bit_generator: str = 'pcg64',
+        dtype: str = 'float64',
+        variance_reduction: str = None
     ):
         super().__init__(
             length=length,
@@ -599,39 +954,138 @@ class LevyStable(BaseSynthetic):
             delta=delta,
             sigma=sigma,
             freq=freq,
-            seed=seed
+            seed=seed,
+            as_of=as_of,
+            bit_generator=bit_generator,
+            dtype=dtype,
+            variance_reduction=variance_reduction
         )
         self.alpha = alpha
         self.beta = beta
 
-    def transform(self, matrix: pd.DataFrame | np.ndarray = None) -> pd.Series | pd.DataFrame:
+    def _stable(
+        self,
+        streams: sth.RandomStreams,
+        rows: int,
+        out: np.ndarray = None
+    ) -> np.ndarray:
         """
-        Generate synthetic data using the Levy Stable Process model.
+        Draw Levy stable variables with the Chambers-Mallows-Stuck method.
+
+        Note
+        ----
+        The variables are built from a uniform angle and a standard 
+        exponential variable drawn from two separate streams, with the 
+        formulas and the S1 parameterization of `scipy.stats.levy_stable`. 
+        Unlike `levy_stable.rvs`, draws are then identical whether the time 
+        steps are drawn at once or in chunks. Time steps are computed in 
+        chunks of about `chunk_variables` variables, which bounds the 
+        temporary arrays of the transformation.
 
         Parameters
         ----------
-        matrix : pd.DataFrame or np.array, optional
-            The matrix applied in Cholesky decomposition (optional).
+        streams : RandomStreams
+            The random streams of the simulation.
+        rows : int
+            The number of time steps.
+        out : np.ndarray, optional
+            A preallocated array of shape (rows, num_paths) the variables are 
+            written to. If None, a new array is allocated. Default is None.
 
         Returns
         -------
-        pd.Series | pd.DataFrame
-            Data containing synthetic data following the Levy Stable Process model.
+        np.ndarray
+            Levy stable variables of shape (rows, num_paths).
         """
-        paths = levy_stable.rvs(
-            self.alpha,
-            self.beta,
-            loc=self.mean,
-            scale=np.sqrt(self.delta) * self.sigma,
-            size=(self.length, self.num_paths)
-        )
+        if out is None:
+            out = np.empty((rows, self.num_paths), dtype=self.dtype)
+
+        step = max(self.chunk_variables // self.num_paths, 1)
+        for first in range(0, rows, step):
+            chunk = min(step, rows - first)
+            theta = streams.uniform(
+                'levy_angle', rows=chunk, low=-np.pi / 2, high=np.pi / 2)
+            w = streams.draw(
+                'levy_exponential',
+                rows=chunk,
+                sampler=lambda rng, size: rng.standard_exponential(
+                    size, dtype=streams.dtype)
+            )
+            out[first:first + chunk] = self._chambers_mallows_stuck(theta, w)
 
-        if matrix is not None:
-            paths = self.cholesky_transform(paths, matrix)
+        return out
+
+    def _chambers_mallows_stuck(
+        self,
+        theta: np.ndarray,
+        w: np.ndarray
+    ) -> np.ndarray:
+        """Transform angles and exponential variables into stable variables"""
+        alpha, beta = self.alpha, self.beta
+        scale = np.sqrt(self.delta) * self.sigma
+
+        a_theta = alpha * theta
+        cos_theta = np.cos(theta)
+        tan_theta = np.tan(theta)
+
+        if alpha == 1:
+            b_theta = beta * theta
+            z = 2 / np.pi * (
+                (np.pi / 2 + b_theta) * tan_theta
+                - beta * np.log(
+                    (np.pi / 2 * w * cos_theta) / (np.pi / 2 + b_theta))
+            )
+            # Location shift of the S1 parameterization
+            return z * scale + self.mean + 2 * beta * scale * np.log(scale) / np.pi
+
+        if beta == 0:
+            z = (
+                w / (cos_theta / np.tan(a_theta) + np.sin(theta))
+                * ((np.cos(a_theta) + np.sin(a_theta) * tan_theta) / w)
+                ** (1 / alpha)
+            )
+        else:
+            val0 = beta * np.tan(np.pi * alpha / 2)
+            theta0 = np.arctan(val0) / alpha
+            val3 = w / (
+                cos_theta / np.tan(alpha * (theta0 + theta)) + np.sin(theta))
+            z = val3 * (
+                (
+                    np.cos(a_theta) + np.sin(a_theta) * tan_theta
+                    - val0 * (np.sin(a_theta) - np.cos(a_theta) * tan_theta)
+                ) / w
+            ) ** (1 / alpha)
+
+        return z * scale + self.mean
+
+    def _initial_state(self) -> float:
+        return 100.0
+
+    def _simulate(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: float | np.ndarray,
+        matrix: pd.DataFrame | np.ndarray = None,
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generate synthetic data using the Levy Stable Process model.
+
+        Note
+        ----
+        The state is the last price of each path.
+        """
+        if matrix is None:
+            paths = self._stable(streams, rows, out=out)
+        else:
+            paths = self.cholesky_transform(
+                self._stable(streams, rows), matrix, out=out)
 
-        prices = self.to_prices(paths)
+        prices = self.to_prices(paths, start_value=state, out=paths)
 
-        return self.to_pandas(prices)
+        return prices, prices[-1].copy()
 
 
 class CIR(BaseSynthetic):
@@ -663,10 +1117,36 @@ class CIR(BaseSynthetic):
         The rate of mean reversion for the CIR model. Default is 3.0.
     mu : float, optional
         The long-run average interest rate for the CIR model. Default is 0.5.
+    method : str, optional
+        The simulation scheme, one of:
+
+        * 'euler': plain Euler-Maruyama scheme. Rates may turn negative, in 
+          which case the square root yields NaNs.
+        * 'truncated': full truncation Euler scheme, using the positive part 
+          of the rate in the drift and diffusion terms.
+        * 'reflected': reflected Euler scheme, using the absolute value of 
+          the rate.
+        * 'exact': exact simulation from the (scaled noncentral chi-square) 
+          transition density, unbiased at any `delta`.
+
+        Default is 'euler'.
     freq : str, optional
         The frequency of the data. Default is 'D'.
     seed : int, optional
         The random seed for reproducibility. Default is None.
+    as_of : str | pd.Timestamp, optional
+        The anchor (last) date of the generated index. Default is None.
+    bit_generator : str, optional
+        The bit generator of the random streams, one of 'pcg64', 'pcg64dxsm', 
+        'philox', 'sfc64' or 'mt19937'. Default is 'pcg64'.
+    dtype : str, optional
+        The floating point precision of the simulation, 'float32' or 
+        'float64'. Default is 'float64'.
+    variance_reduction : str, optional
+        The variance reduction technique, None, 'antithetic' to mirror the 
+        normal variables of adjacent paths, 'sobol' for quasi-Monte Carlo 
+        normal variables or 'moment_matching' to match their mean and 
+        variance across paths (see `BaseSynthetic`). Default is None.
 
     Note
     ----
@@ -702,8 +1182,13 @@ class CIR(BaseSynthetic):
         start_value: float = 0.5,
         kappa: float = 6.0,
         mu: float = 0.5,
+        method: str = 'euler',
         freq: str = 'D',
-        seed: int = None
+        seed: int = None,
+        as_of: str | pd.Timestamp = None,
+        bit_generator: str = 'pcg64',
+        dtype: str = 'float64',
+        variance_reduction: str = None
     ):
         super().__init__(
             length=length,
@@ -712,13 +1197,41 @@ class CIR(BaseSynthetic):
             delta=delta,
             sigma=sigma,
             freq=freq,
-            seed=seed
+            seed=seed,
+            as_of=as_of,
+            bit_generator=bit_generator,
+            dtype=dtype,
+            variance_reduction=variance_reduction
         )
         self.start_value = start_value
         self.kappa = kappa
         self.mu = mu
+        self.method = method
+
+        if self.method not in ('euler', 'truncated', 'reflected', 'exact'):
+            raise ValueError(
+                "Simulation method must be 'euler', 'truncated', 'reflected' "
+                f"or 'exact'. Got '{self.method}'."
+            )
+
+        if self.method == 'exact' and self.sigma <= 0:
+            raise ValueError(
+                "The exact scheme requires a positive volatility (sigma). Got "
+                f"{self.sigma}."
+            )
+
+    def _initial_state(self) -> np.ndarray:
+        return np.full(self.num_paths, self.start_value, dtype=self.dtype)
 
-    def transform(self, matrix: pd.DataFrame | np.ndarray = None) -> pd.Series | pd.DataFrame:
+    def _simulate(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: np.ndarray,
+        matrix: pd.DataFrame | np.ndarray = None,
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
         Generate synthetic interest rate data using the Cox-Ingersoll-Ross 
         (CIR) model.
@@ -728,36 +1241,98 @@ class CIR(BaseSynthetic):
         The main difference between this and the Ornstein Uhlenbeck model
         is that we multiply the 'random' component by the square-root of
         the previous level i.e. the process has level dependent interest
-        rates.
-
-        Parameters
-        ----------
-        matrix : pd.DataFrame or np.array, optional
-            The matrix applied in Cholesky decomposition (optional).
-
-        Returns
-        -------
-        pd.Series | pd.DataFrame
-            Data containing synthetic interest rate data.
+        rates. The state is the last rate of each path, before truncation 
+        with the 'truncated' method.
         """
-        paths = np.full((self.length+1, self.num_paths), self.start_value)
+        if self.method == 'exact':
+            if matrix is not None:
+                raise ValueError(
+                    "Cholesky correlation is not supported by the 'exact' "
+                    "method."
+                )
+            return self._exact_paths(streams, rows, state, out=out)
 
-        noise = (
-            self.cholesky_transform(self.white_noise, matrix)
-            if matrix is not None
-            else self.white_noise
+        paths = (
+            np.empty((rows, self.num_paths), dtype=self.dtype)
+            if out is None
+            else out
         )
+        previous = state
+
+        noise = self._white_noise(streams, start, rows, matrix)
+
+        for length in range(rows):
+            level = previous
+            if self.method == 'truncated':
+                level = np.maximum(level, 0)
 
-        for length in range(1, self.length + 1):
             drift = (
-                self.kappa * (self.mu - paths[length-1]) * self.delta
+                self.kappa * (self.mu - level) * self.delta
             )
             deviation = (
-                np.sqrt(paths[length-1]) * noise[length-1]
+                np.sqrt(level) * noise[length]
             )
-            paths[length] = paths[length-1] + drift + deviation
+            previous = previous + drift + deviation
+            if self.method == 'reflected':
+                previous = np.abs(previous)
+            paths[length] = previous
+
+        if self.method == 'truncated':
+            np.maximum(paths, 0, out=paths)
+
+        return paths, previous
+
+    def _exact_paths(
+        self,
+        streams: sth.RandomStreams,
+        rows: int,
+        previous: np.ndarray,
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate the CIR process from its exact transition density.
+
+        Note
+        ----
+        Given r(t), the rate r(t + delta) is distributed as c times a 
+        noncentral chi-square variable with d degrees of freedom and 
+        noncentrality r(t) exp(-kappa delta) / c, where 
+        c = sigma^2 (1 - exp(-kappa delta)) / (4 kappa) and 
+        d = 4 kappa mu / sigma^2. All paths are drawn in a single call per 
+        time step and block of paths.
+
+        Parameters
+        ----------
+        streams : RandomStreams
+            The random streams of the simulation.
+        rows : int
+            The number of time steps.
+        previous : np.ndarray
+            The last rate of each path.
+        out : np.ndarray, optional
+            A preallocated array of shape (rows, num_paths) the paths are 
+            written to. Default is None.
 
-        return self.to_pandas(paths[1:,])
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            CIR paths of shape (rows, num_paths) and their last rate.
+        """
+        decay = np.exp(-self.kappa * self.delta)
+        scale = self.sigma ** 2 * (1 - decay) / (4 * self.kappa)
+        df = 4 * self.kappa * self.mu / self.sigma ** 2
+
+        paths = (
+            np.empty((rows, self.num_paths), dtype=self.dtype)
+            if out is None
+            else out
+        )
+        for length in range(rows):
+            previous = scale * streams.noncentral_chisquare(
+                'rates', df, previous * decay / scale)
+            paths[length] = previous
+
+        return paths, previous
 
 
 class MeanReverting(BaseSynthetic):
@@ -791,10 +1366,27 @@ class MeanReverting(BaseSynthetic):
     mu : float, optional
         The long-run average interest rate for the Ornstein-Uhlenbeck model.
         Default is 0.5.
+    method : str, optional
+        The discretization scheme, either 'euler' (Euler-Maruyama) or 
+        'exact' (exact Gaussian transition, unbiased at any `delta`). 
+        Default is 'euler'.
     freq : str, optional
         The frequency of the data. Default is 'D'.
     seed : int, optional
         The random seed for reproducibility. Default is None.
+    as_of : str | pd.Timestamp, optional
+        The anchor (last) date of the generated index. Default is None.
+    bit_generator : str, optional
+        The bit generator of the random streams, one of 'pcg64', 'pcg64dxsm', 
+        'philox', 'sfc64' or 'mt19937'. Default is 'pcg64'.
+    dtype : str, optional
+        The floating point precision of the simulation, 'float32' or 
+        'float64'. Default is 'float64'.
+    variance_reduction : str, optional
+        The variance reduction technique, None, 'antithetic' to mirror the 
+        normal variables of adjacent paths, 'sobol' for quasi-Monte Carlo 
+        normal variables or 'moment_matching' to match their mean and 
+        variance across paths (see `BaseSynthetic`). Default is None.
 
     Example
     -------
@@ -820,8 +1412,13 @@ class MeanReverting(BaseSynthetic):
         start_value: float = 0.5,
         kappa: float = 6.0,
         mu: float = 0.5,
+        method: str = 'euler',
         freq: str = 'D',
-        seed: int = None
+        seed: int = None,
+        as_of: str | pd.Timestamp = None,
+        bit_generator: str = 'pcg64',
+        dtype: str = 'float64',
+        variance_reduction: str = None
     ):
         super().__init__(
             length=length,
@@ -830,46 +1427,79 @@ class MeanReverting(BaseSynthetic):
             delta=delta,
             sigma=sigma,
             freq=freq,
-            seed=seed
+            seed=seed,
+            as_of=as_of,
+            bit_generator=bit_generator,
+            dtype=dtype,
+            variance_reduction=variance_reduction
         )
         self.start_value = start_value
         self.kappa = kappa
         self.mu = mu
+        self.method = method
+
+        if self.method not in ('euler', 'exact'):
+            raise ValueError(
+                "Discretization method must be 'euler' or 'exact'. Got "
+                f"'{self.method}'."
+            )
+
+    @property
+    def phi(self) -> float:
+        """Autoregressive coefficient of the discretized process"""
+        kappa_delta = self.kappa * self.delta
+        if self.method == 'exact':
+            return np.exp(-kappa_delta)
+        return 1 - kappa_delta
+
+    def _initial_state(self) -> np.ndarray:
+        return sth.all_pole_zi(
+            [self.phi],
+            np.full((1, self.num_paths), self.start_value, dtype=self.dtype)
+        )
 
-    def transform(self, matrix: pd.DataFrame | np.ndarray = None) -> pd.Series | pd.DataFrame:
+    def _simulate(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: np.ndarray,
+        matrix: pd.DataFrame | np.ndarray = None,
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
         Generate synthetic mean-reverting data using the Ornstein-Uhlenbeck
         model.
 
-        Parameters
-        ----------
-        matrix : pd.DataFrame or np.array, optional
-            The matrix applied in Cholesky decomposition (optional).
-
-        Returns
-        -------
-        pd.Series | pd.DataFrame
-            Data containing synthetic mean-reverting data.
-        """
-        paths = np.full(
-            (self.length+1, self.num_paths), self.start_value, dtype=np.float64
-        )
+        Note
+        ----
+        Both schemes are linear recursions of the form 
+        x(t) = phi x(t-1) + (1 - phi) mu + e(t), evaluated with a single 
+        all-pole filter over all paths:
 
-        noise = (
-            self.cholesky_transform(self.white_noise, matrix)
-            if matrix is not None
-            else self.white_noise
-        )
+        * 'euler': phi = 1 - kappa * delta and e(t) is the white noise.
+        * 'exact': phi = exp(-kappa * delta) and the white noise is rescaled 
+          to the exact conditional standard deviation 
+          sigma * sqrt((1 - phi^2) / (2 kappa)).
 
-        for length in range(1, self.length + 1):
-            drift = (
-                self.kappa * (self.mu - paths[length-1]) * self.delta
+        The state is the filter state, carrying the last value of each path.
+        """
+        noise = self._white_noise(streams, start, rows, matrix)
+
+        kappa_delta = self.kappa * self.delta
+        phi = self.phi
+        if self.method == 'exact':
+            # Ratio of the exact to the Euler conditional variance
+            scale = (
+                np.sqrt(-np.expm1(-2 * kappa_delta) / (2 * kappa_delta))
+                if kappa_delta > 0
+                else 1.0
             )
-            deviation = noise[length - 1]
-
-            paths[length] = paths[length-1] + drift + deviation
+            innovations = scale * noise + (1 - phi) * self.mu
+        else:
+            innovations = noise + kappa_delta * self.mu
 
-        return self.to_pandas(paths[1:,])
+        return sth.all_pole_filter(innovations, [phi], state)
 
 
 class AutoRegressive(BaseSynthetic):
@@ -896,11 +1526,33 @@ class AutoRegressive(BaseSynthetic):
     ar : list of float, optional
         Coefficients for the AR model. The number of coefficients defines the 
         order. E.g., [0.8, -0.2] for an AR(2) process. IF None, it defaults to
-        [0.8]. Dafaults to None.
+        [0.8]. Dafaults to None. An array of p coefficient matrices of shape 
+        (p, num_paths, num_paths) defines a vector autoregressive VAR(p) 
+        process across paths.
+    initial : np.ndarray, optional
+        The p values preceding the series, ordered from the oldest to the 
+        most recent, of shape (p,) or (p, num_paths). If None, past values 
+        are zero. Default is None.
+    burn_in : int, optional
+        The number of initial time steps simulated and discarded before the 
+        series starts. Default is 0.
     freq : str, optional
         The frequency of the data. Default is 'D'.
     seed : int, optional
         The random seed for reproducibility. Default is None.
+    as_of : str | pd.Timestamp, optional
+        The anchor (last) date of the generated index. Default is None.
+    bit_generator : str, optional
+        The bit generator of the random streams, one of 'pcg64', 'pcg64dxsm', 
+        'philox', 'sfc64' or 'mt19937'. Default is 'pcg64'.
+    dtype : str, optional
+        The floating point precision of the simulation, 'float32' or 
+        'float64'. Default is 'float64'.
+    variance_reduction : str, optional
+        The variance reduction technique, None, 'antithetic' to mirror the 
+        normal variables of adjacent paths, 'sobol' for quasi-Monte Carlo 
+        normal variables or 'moment_matching' to match their mean and 
+        variance across paths (see `BaseSynthetic`). Default is None.
 
     """
 
@@ -912,8 +1564,14 @@ class AutoRegressive(BaseSynthetic):
         delta: float = 1/252,
         sigma: float = 0.125,
         ar=None,
+        initial: np.ndarray | None = None,
+        burn_in: int = 0,
         freq: str = 'D',
-        seed: int = None
+        seed: int = None,
+        as_of: str | pd.Timestamp = None,
+        bit_generator: str = 'pcg64',
+        dtype: str = 'float64',
+        variance_reduction: str = None
     ):
         super().__init__(
             length=length,
@@ -922,41 +1580,132 @@ class AutoRegressive(BaseSynthetic):
             delta=delta,
             sigma=sigma,
             freq=freq,
-            seed=seed
+            seed=seed,
+            as_of=as_of,
+            bit_generator=bit_generator,
+            dtype=dtype,
+            variance_reduction=variance_reduction
         )
-        self.ar = ar or [0.8]
+        self.ar = [0.8] if ar is None else ar
         self.order = len(self.ar)
+        self.initial = initial
+        self.burn_in = burn_in
+
+        if (
+            np.ndim(self.ar) == 3
+            and np.shape(self.ar)[1:] != (self.num_paths, self.num_paths)
+        ):
+            raise ValueError(
+                "VAR coefficient matrices must be of shape (num_paths, "
+                f"num_paths). Got {np.shape(self.ar)[1:]}."
+            )
 
-    def transform(self, matrix: pd.DataFrame | np.ndarray = None) -> pd.Series | pd.DataFrame:
+    def _initial_state(self) -> np.ndarray:
+        past = np.zeros((self.order, self.num_paths), dtype=self.dtype)
+        if self.initial is not None:
+            past += np.reshape(self.initial, (self.order, -1))
+
+        if np.ndim(self.ar) == 3:
+            # Companion state [y(t), y(t-1), ..., y(t-p+1)]
+            return past[::-1].ravel()
+        return sth.all_pole_zi(self.ar, past)
+
+    def _simulate(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: np.ndarray,
+        matrix: pd.DataFrame | np.ndarray = None,
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
         Generate synthetic autoregressive (AR) data.
 
+        Note
+        ----
+        AR(p) paths are generated with a single all-pole filter over all 
+        paths. VAR(p) paths are generated with the companion-matrix form of 
+        the recursion. The state is the filter (or companion) state, carrying 
+        the last p values of each path. Burn-in steps are simulated before 
+        the first chunk.
+        """
+        noise = self._white_noise(streams, start, rows, matrix)
+
+        burn_in = self.burn_in if start == 0 else 0
+        if burn_in > 0:
+            burn_in_noise = streams.normal(
+                'burn_in',
+                rows=burn_in,
+                loc=self.mean,
+                scale=np.sqrt(self.delta) * self.sigma
+            )
+            if matrix is not None:
+                burn_in_noise = self.cholesky_transform(burn_in_noise, matrix)
+            noise = np.vstack([burn_in_noise, noise])
+
+        if np.ndim(self.ar) == 3:
+            paths, state = self._companion_filter(noise, state)
+        else:
+            paths, state = sth.all_pole_filter(noise, self.ar, state)
+
+        return paths[burn_in:], state
+
+    def _shard(self, start: int, stop: int, seed: int = None) -> 'AutoRegressive':
+        if np.ndim(self.ar) == 3:
+            raise ValueError(
+                "VAR(p) paths depend on each other and cannot be sharded."
+            )
+        shard = super()._shard(start, stop, seed)
+        if np.ndim(self.initial) == 2:
+            first = start * self.block_size
+            shard.initial = np.asarray(self.initial)[
+                :, first:first + shard.num_paths]
+        return shard
+
+    def _companion_filter(
+        self,
+        noise: np.ndarray,
+        state: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Run the VAR(p) recursion in companion-matrix form.
+
+        Note
+        ----
+        The state s(t) = [y(t), y(t-1), ..., y(t-p+1)] follows the first 
+        order recursion s(t) = C s(t-1) + [e(t), 0, ..., 0], where the 
+        companion matrix C stacks the coefficient matrices on its first block 
+        row and identity matrices on its first block sub-diagonal.
+
         Parameters
         ----------
-        matrix : pd.DataFrame or np.array, optional
-            The matrix applied in Cholesky decomposition (optional).
+        noise : np.ndarray
+            Innovations of shape (length, num_paths).
+        state : np.ndarray
+            The companion state preceding the series, i.e. the p last values 
+            from the most recent to the oldest, raveled to shape 
+            (p * num_paths,).
 
         Returns
         -------
-        pd.Series | pd.DataFrame
-            Data containing synthetic autoregressive (AR) data.
-
+        tuple[np.ndarray, np.ndarray]
+            VAR(p) paths of shape (length, num_paths) and the final companion 
+            state.
         """
-        paths = np.zeros((self.length+1, self.num_paths), dtype=np.float64)
+        k = self.num_paths
+        kp = k * self.order
 
-        noise = (
-            self.cholesky_transform(self.white_noise, matrix)
-            if matrix is not None
-            else self.white_noise
-        )
+        companion = np.eye(kp, k=-k, dtype=noise.dtype)
+        companion[:k] = np.hstack(self.ar)
 
-        for length in range(1, self.length + 1):
-            deviation = noise[length - 1]
-            paths[length] = (
-                sum([self.ar[j] * paths[length - j - 1] for j in range(self.order)]) + deviation
-            )
+        paths = np.empty_like(noise)
+        for length, deviation in enumerate(noise):
+            state = companion @ state
+            state[:k] += deviation
+            paths[length] = state[:k]
 
-        return self.to_pandas(paths[1:,])
+        return paths, state
 
 
 class NARMA(BaseSynthetic):
@@ -993,6 +1742,19 @@ class NARMA(BaseSynthetic):
         The frequency of the data. Default is 'D'.
     seed : int, optional
         The random seed for reproducibility. Default is None.
+    as_of : str | pd.Timestamp, optional
+        The anchor (last) date of the generated index. Default is None.
+    bit_generator : str, optional
+        The bit generator of the random streams, one of 'pcg64', 'pcg64dxsm', 
+        'philox', 'sfc64' or 'mt19937'. Default is 'pcg64'.
+    dtype : str, optional
+        The floating point precision of the simulation, 'float32' or 
+        'float64'. Default is 'float64'.
+    variance_reduction : str, optional
+        The variance reduction technique, None, 'antithetic' to mirror the 
+        normal variables of adjacent paths, 'sobol' for quasi-Monte Carlo 
+        normal variables or 'moment_matching' to match their mean and 
+        variance across paths (see `BaseSynthetic`). Default is None.
     """
 
     def __init__(
@@ -1003,16 +1765,24 @@ class NARMA(BaseSynthetic):
         n: int = 10,
         a: list | None = None,
         freq: str = 'D',
-        seed: int = None
+        seed: int = None,
+        as_of: str | pd.Timestamp = None,
+        bit_generator: str = 'pcg64',
+        dtype: str = 'float64',
+        variance_reduction: str = None
     ):
         super().__init__(
             length=length,
             num_paths=num_paths,
             freq=freq,
-            seed=seed
+            seed=seed,
+            as_of=as_of,
+            bit_generator=bit_generator,
+            dtype=dtype,
+            variance_reduction=variance_reduction
         )
         self.n = n
-        self.a = [0.3, 0.05, 1.5, 0.1] or a
+        self.a = [0.3, 0.05, 1.5, 0.1] if a is None else list(a)
         self.start_value = start_value
 
         if len(self.a) != 4:
@@ -1021,45 +1791,81 @@ class NARMA(BaseSynthetic):
                 f"{len(self.a)}."
             )
 
-    def transform(self, matrix: pd.DataFrame | np.ndarray = None) -> pd.Series | pd.DataFrame:
+    def _initial_state(self) -> tuple[np.ndarray, np.ndarray, None]:
+        return (
+            np.full((1, self.num_paths), self.start_value, dtype=self.dtype),
+            np.zeros(self.num_paths, dtype=self.dtype),
+            None
+        )
+
+    def _simulate(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: tuple[np.ndarray, np.ndarray, np.ndarray | None],
+        matrix: pd.DataFrame | np.ndarray = None,
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray, np.ndarray]]:
         """
         Generate synthetic Non-linear Autoregressive Moving Average (NARMA) 
         data.
 
-        Parameters
-        ----------
-        matrix : pd.DataFrame or np.array, optional
-            The matrix applied in Cholesky decomposition (optional).
-
-        Returns
-        -------
-        pd.Series | pd.DataFrame
-            Data containing non-linear Autoregressive Moving Average (NARMA) data.
+        Note
+        ----
+        The lagged input u(k-(n-1)) of the first steps is drawn as a 
+        presample of n uniform values preceding the series. The state is the 
+        last n + 1 values of each path, the running window sum and the last 
+        n inputs.
         """
-        paths = np.full(
-            (self.length+1, self.num_paths),
-            self.start_value,
-            dtype=np.float64
-        )
-        # Uniform data
-        u = np.random.uniform(
-            low=0,
-            high=0.5,
-            size=(self.length + 1, self.num_paths)
-        )
+        history, window, inputs = state
+        n = self.n
 
-        for length in range(1, self.length + 1):
-            paths[length] = (
-                self.a[0] * paths[length - 1] +
-                self.a[1] * paths[length - 1] * sum(paths[length - self.n:length]) +
-                self.a[2] * u[length - self.n] * u[length] +
-                self.a[3]
+        # Uniform data
+        u = streams.uniform(
+            'uniform', rows=rows if inputs is not None else n + rows,
+            low=0, high=0.5)
+        if inputs is not None:
+            u = np.vstack([inputs, u])
+
+        # Input term a_2 u(k-(n-1)) u(k) + a_3, for all steps at once
+        forcing = self.a[2] * u[:rows] * u[n:n + rows] + self.a[3]
+
+        # Past values followed by the steps of the chunk
+        offset = len(history)
+        paths = np.vstack(
+            [history, np.empty((rows, self.num_paths), dtype=self.dtype)])
+
+        # Running sum of the trailing window paths[length - n:length], updated
+        # with the incoming row and the outgoing row at each step
+        window = window.copy()
+        for step in range(rows):
+            length = start + step + 1
+            row = offset + step
+            window += paths[row - 1]
+            if length > n:
+                window -= paths[row - n - 1]
+                if not np.isfinite(window).all():
+                    # Diverging paths, inf - inf must not turn into nan
+                    window = paths[row - n:row].sum(axis=0)
+
+            # Empty window, before the first n steps
+            window_sum = window if length >= n else 0
+
+            paths[row] = (
+                paths[row - 1] * (self.a[0] + self.a[1] * window_sum)
+                + forcing[step]
             )
 
+        # Copied, as the chunk is yielded to the caller
+        state = (
+            paths[max(len(paths) - n - 1, 0):].copy(), window, u[len(u) - n:])
+        paths = paths[offset:]
+
         if matrix is not None:
             paths = self.cholesky_transform(paths, matrix)
 
-        return self.to_pandas(paths[1:,])
+        return paths, state
 
 
 class Seasonal(BaseSynthetic):
@@ -1099,6 +1905,19 @@ class Seasonal(BaseSynthetic):
         The frequency of the data. Default is 'D'.
     seed : int, optional
         The random seed for reproducibility. Default is None.
+    as_of : str | pd.Timestamp, optional
+        The anchor (last) date of the generated index. Default is None.
+    bit_generator : str, optional
+        The bit generator of the random streams, one of 'pcg64', 'pcg64dxsm', 
+        'philox', 'sfc64' or 'mt19937'. Default is 'pcg64'.
+    dtype : str, optional
+        The floating point precision of the simulation, 'float32' or 
+        'float64'. Default is 'float64'.
+    variance_reduction : str, optional
+        The variance reduction technique, None, 'antithetic' to mirror the 
+        normal variables of adjacent paths, 'sobol' for quasi-Monte Carlo 
+        normal variables or 'moment_matching' to match their mean and 
+        variance across paths (see `BaseSynthetic`). Default is None.
     """
 
     def __init__(
@@ -1111,7 +1930,11 @@ class Seasonal(BaseSynthetic):
         omega: float = 1.0,
         phi: float = 0.4,
         freq: str = 'D',
-        seed: int = None
+        seed: int = None,
+        as_of: str | pd.Timestamp = None,
+        bit_generator: str = 'pcg64',
+        dtype: str = 'float64',
+        variance_reduction: str = None
     ):
         super().__init__(
             length=length,
@@ -1120,51 +1943,47 @@ class Seasonal(BaseSynthetic):
             delta=delta,
             sigma=sigma,
             freq=freq,
-            seed=seed
+            seed=seed,
+            as_of=as_of,
+            bit_generator=bit_generator,
+            dtype=dtype,
+            variance_reduction=variance_reduction
         )
         self.omega = omega
         self.phi = phi
 
-    def transform(self, matrix: pd.DataFrame | np.ndarray = None) -> pd.Series | pd.DataFrame:
+    def _simulate(
+        self,
+        streams: sth.RandomStreams,
+        start: int,
+        rows: int,
+        state: None,
+        matrix: pd.DataFrame | np.ndarray = None,
+        out: np.ndarray = None
+    ) -> tuple[np.ndarray, None]:
         """
         Generate synthetic seasonal patterns data.
 
-        Parameters
-        ----------
-        matrix : pd.DataFrame or np.array, optional
-            The matrix applied in Cholesky decomposition (optional).
-
-        Returns
-        -------
-        pd.Series | pd.DataFrame
-            Data containing seasonal patterns.
-
+        Note
+        ----
+        Time steps are independent given t, so the model carries no state.
         """
-        # A time vector from 0 to length - 1.
-        t = np.arange(self.length).reshape(-1, 1)
+        # A time vector from start to start + rows - 1.
+        t = np.arange(start, start + rows, dtype=self.dtype).reshape(-1, 1)
         
         # Random amplitude values
-        amplitude = (
-            self.cholesky_transform(self.white_noise, matrix)
-            if matrix is not None
-            else self.white_noise
-        )
-       
+        amplitude = self._white_noise(streams, start, rows, matrix)
+
         #  Random frequency values
-        frequency = np.random.normal(
-            loc=self.omega,
-            scale=self.phi,
-            size=(self.length, self.num_paths)
-        )
+        frequency = streams.normal(
+            'frequency', rows=rows, loc=self.omega, scale=self.phi)
         
         # Random phase shifts uniformly distributed between 0 and 2pi.
-        phase = np.random.uniform(
-            low=0,
-            high=2*np.pi,
-            size=(self.length, self.num_paths)
-        )
+        phase = streams.uniform(
+            'phase', rows=rows, low=0, high=2*np.pi)
         
         # Generate the seasonal patterns
-        paths = amplitude * np.sin(2 * np.pi * frequency * t + phase)
+        paths = np.multiply(
+            amplitude, np.sin(2 * np.pi * frequency * t + phase), out=out)
 
-        return self.to_pandas(paths)
+        return paths, state
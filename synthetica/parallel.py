@@ -0,0 +1,200 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional
+import os
+import weakref
+import numpy as np
+import pandas as pd
+
+from .base import BaseSynthetic
+
+
+BACKENDS = ('processes', 'threads')
+
+
+def _fill_shard(shard: BaseSynthetic, output: np.ndarray, first: int):
+    """Simulate a shard, writing its paths into the output columns"""
+    shard.transform(output='numpy', out=output[:, first:first + shard.num_paths])
+
+
+def _transform_shard(
+    shard: BaseSynthetic,
+    name: str,
+    shape: tuple[int, int],
+    first: int
+):
+    """Simulate a shard and write its paths into the shared output"""
+    buffer = shared_memory.SharedMemory(name=name)
+    try:
+        output = np.ndarray(shape, dtype=shard.dtype, buffer=buffer.buf)
+        _fill_shard(shard, output, first)
+        del output
+    finally:
+        buffer.close()
+
+
+class ParallelRunner:
+    """
+    Simulate the paths of a model in parallel workers.
+
+    The paths are split into shards of whole blocks of paths (see
+    `BaseSynthetic.block_size`). As each block draws from its own random
+    streams, every shard reproduces exactly its paths of the full simulation,
+    so the output is bit-identical to `model.transform()` regardless of the
+    number and kind of workers. Workers write their paths directly into a 
+    single output array, which backs the returned object.
+
+    Attributes
+    ----------
+    model : BaseSynthetic
+        The model to simulate.
+    n_jobs : int, optional
+        The number of workers. If None, the number of CPUs is used. Default 
+        is None.
+    backend : str, optional
+        Either 'processes', where shards run in worker processes writing into 
+        shared memory, or 'threads', where shards run in a thread pool 
+        writing into a preallocated array. Threads avoid pickling and process 
+        start-up costs, and scale for the models whose work is NumPy-level 
+        and releases the GIL (GeometricBrownianMotion, LevyStable, Seasonal, 
+        Merton, Poisson, MeanReverting, AutoRegressive). Models stepping 
+        through time in Python (Heston, CIR, NARMA) are better run with 
+        processes. Default is 'processes'.
+    mp_context : multiprocessing.context.BaseContext, optional
+        The multiprocessing context of the worker processes. If None, the 
+        default context is used. Default is None.
+
+    Note
+    ----
+    Parallelism is bounded by the number of blocks, i.e.
+    ceil(num_paths / block_size). If the model seed is None, fresh entropy is
+    drawn once per `transform` call and shared by all the shards.
+
+    Example
+    -------
+    >>> model = GeometricBrownianMotion(length=252, num_paths=2_000_000, seed=1)
+    >>> runner = ParallelRunner(model, n_jobs=8)
+    >>> synthetic_data = runner.transform()
+    """
+
+    def __init__(
+        self,
+        model: BaseSynthetic,
+        n_jobs: Optional[int] = None,
+        backend: Optional[str] = 'processes',
+        mp_context=None
+    ):
+        self.model = model
+        self.n_jobs = os.cpu_count() if n_jobs is None else n_jobs
+        self.backend = backend
+        self.mp_context = mp_context
+
+        if self.backend not in BACKENDS:
+            raise ValueError(
+                f"Backend must be one of {list(BACKENDS)}. Got "
+                f"'{self.backend}'."
+            )
+
+        if self.n_jobs < 1:
+            raise ValueError(
+                f"Number of jobs must be at least 1. Got {self.n_jobs}."
+            )
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}({self.model}, n_jobs={self.n_jobs}, '
+            f"backend='{self.backend}')"
+        )
+
+    def shards(self) -> list[tuple[int, int]]:
+        """
+        Split the blocks of paths into contiguous shards.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The first block and the block after the last one, per shard.
+        """
+        num_blocks = -(-self.model.num_paths // self.model.block_size)
+        bounds = np.linspace(
+            0, num_blocks, min(self.n_jobs, num_blocks) + 1).astype(int)
+        return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+    def transform(
+        self,
+        matrix: pd.DataFrame | np.ndarray = None,
+        output: Optional[str] = 'pandas'
+    ) -> pd.Series | pd.DataFrame | np.ndarray:
+        """
+        Generate the synthetic data of the model in parallel.
+
+        Parameters
+        ----------
+        matrix : pd.DataFrame or np.array, optional
+            Not supported, as the Cholesky transformation mixes all paths.
+            Default is None.
+        output : str, optional
+            The output type, one of 'pandas', 'numpy' or 'xarray' (see 
+            `BaseSynthetic.to_output`). Default is 'pandas'.
+
+        Returns
+        -------
+        pd.Series | pd.DataFrame | np.ndarray | xr.DataArray
+            Data containing the synthetic data of the model.
+        """
+        self.model._check_output(output)
+        if matrix is not None:
+            raise ValueError(
+                "Correlated paths depend on each other and cannot be sharded."
+            )
+
+        model = self.model
+        seed = model._shared_seed()
+        bounds = self.shards()
+        shards = [model._shard(start, stop, seed=seed) for start, stop in bounds]
+        shape = (model.length, model.num_paths)
+
+        if len(shards) == 1:
+            return model.to_output(
+                shards[0].transform(output='numpy').reshape(shape), output)
+
+        if self.backend == 'threads':
+            paths = np.empty(shape, dtype=model.dtype)
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                futures = [
+                    executor.submit(
+                        _fill_shard, shard, paths, start * model.block_size)
+                    for shard, (start, _) in zip(shards, bounds)
+                ]
+                for future in futures:
+                    future.result()
+            return model.to_output(paths, output)
+
+        nbytes = max(np.prod(shape) * model.dtype.itemsize, 1)
+        buffer = shared_memory.SharedMemory(create=True, size=int(nbytes))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=len(shards), mp_context=self.mp_context
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _transform_shard,
+                        shard,
+                        buffer.name,
+                        shape,
+                        start * model.block_size
+                    )
+                    for shard, (start, _) in zip(shards, bounds)
+                ]
+                for future in futures:
+                    future.result()
+        except BaseException:
+            buffer.close()
+            buffer.unlink()
+            raise
+
+        paths = np.ndarray(shape, dtype=model.dtype, buffer=buffer.buf)
+        # The mapping outlives its name, and is released with the paths
+        buffer.unlink()
+        weakref.finalize(paths, buffer.close)
+        return model.to_output(paths, output)
@@ -1,3 +1,4 @@
+from typing import Optional
 import numpy as np
 
 
@@ -11,18 +12,28 @@ def _is_positive_definite(symmetric_matrix: np.array) -> bool:
         return False
 
 
-def nearest_positive_definite(matrix: np.array) -> np.ndarray:
+def nearest_positive_definite(
+    matrix: np.array,
+    tol: Optional[float] = None,
+    max_iter: Optional[int] = 100,
+    return_factor: Optional[bool] = False
+) -> np.ndarray:
     """Find the nearest positive-definite matrix to input.
 
-    A Python/Numpy port of John D'Errico's `nearestSPD` MATLAB code [1], 
-    which credits [2]:
-        * [1] [Matlab](https://www.mathworks.com/matlabcentral/fileexchange/42885-nearestspd)
-        * [2] N.J. Higham, "Computing a nearest symmetric positive semidefinite
+    The nearest symmetric positive semidefinite matrix, in the Frobenius 
+    norm, is obtained by clipping the negative eigenvalues of the symmetric 
+    part of the input to zero [1]. Here eigenvalues are clipped to a small 
+    positive floor instead, so that the result is positive-definite. The 
+    eigendecomposition runs once: if the repaired matrix still fails the 
+    Cholesky test because of rounding errors, the floor is raised tenfold, 
+    up to `max_iter` times.
+        * [1] N.J. Higham, "Computing a nearest symmetric positive semidefinite
         matrix" (1988): [Source](https://doi.org/10.1016/0024-3795(88)90223-6)
 
     Notes
     -----
         Other sources:
+        * [Matlab](https://www.mathworks.com/matlabcentral/fileexchange/42885-nearestspd)
         * [Stackoverflow](https://stackoverflow.com/.../python-convert-matrix-to-positive-semi-definite)
         * [Gist](https://gist.github.com/fasiha/fdb5cec2054e6f1c6ae35476045a0bbd)
 
@@ -30,63 +41,134 @@ def nearest_positive_definite(matrix: np.array) -> np.ndarray:
     ----------
     matrix : np.array
         The input matrix.
+    tol : float, optional
+        The initial floor of the eigenvalues. If None, it defaults to 
+        n * eps * max(|eigenvalues|), the usual numerical rank tolerance. 
+        Must be positive. Default is None.
+    max_iter : int, optional
+        The maximum number of times the floor is raised. Default is 100.
+    return_factor : bool, optional
+        If True, return the lower Cholesky factor of the repaired matrix 
+        instead of the matrix itself. Default is False.
 
     Returns
     -------
     np.ndarray
-        The nearest positive-definite matrix.
+        The nearest positive-definite matrix, or its Cholesky factor.
+
+    Raises
+    ------
+    ValueError
+        If `tol` is not positive.
+    np.linalg.LinAlgError
+        If no positive-definite matrix is found within `max_iter` iterations.
     """
-    # Computes the symmetric component of a covariance matrix.
-    # It does this by adding the covariance matrix with its transpose and
-    # dividing the result by 2, which produces a new matrix that is symmetric
-    # about its main diagonal. This operation ensures that the resulting matrix
-    # can be used in further mathematical operations that require a symmetric
-    # matrix.
+    if tol is not None and tol <= 0:
+        raise ValueError(f"Tolerance must be positive. Got {tol}.")
+
+    matrix = np.asarray(matrix, dtype=np.float64)
+    # Computes the symmetric component of the matrix, which produces a new
+    # matrix that is symmetric about its main diagonal.
     symmetric_matrix = (matrix + matrix.T) / 2
-    # Performs a Singular Value Decomposition (SVD) on a symmetric matrix.
-    # Decomposes a matrix into three matrices: left singular vectors, singular
-    # values, and right singular vectors.
-    # Returns principal components and their corresponding variances
-    _, variance, eigenvectors = np.linalg.svd(symmetric_matrix)
-    # Computes the covariance matrix of the data in a new coordinate system
-    # defined by the eigenvectors of the original covariance matrix
-    transformed_matrix = np.dot(
-        eigenvectors.T, np.dot(np.diag(variance), eigenvectors))
-    # Symmetric matrix that blends the original symmetric matrix of the data
-    # with the covariance matrix of the data in the transformed coordinate
-    # system
-    weighted_matrix = (symmetric_matrix + transformed_matrix) / 2
-    weighted_symetric_matrix = (weighted_matrix + weighted_matrix.T) / 2
-    if _is_positive_definite(weighted_symetric_matrix):
-        return weighted_symetric_matrix
-    # The above is different from [1]. It appears that MATLAB's `chol` Cholesky
-    # decomposition will accept matrixes with exactly 0-eigenvalue, whereas
-    # Numpy's will not. So where [1] uses `eps(mineig)` (where `eps` is Matlab
-    # for `np.spacing`), we use the above definition. CAVEAT: our `spacing`
-    # will be much larger than [1]'s `eps(min_eigenvalues)`, since
-    # `min_eigenvalues` is usually on the order of 1e-16, and `eps(1e-16)` is
-    # on the order of 1e-34, whereas `spacing` will, for Gaussian random matrixes
-    # of small dimension, be on other order of 1e-16. In practice, both ways
-    # converge, as the unit test below suggests.
-    spacing = np.spacing(np.linalg.norm(matrix))
-    # Process known as "shrinking" a matrix towards the identity matrix to
-    # ensure that it is positive definite
-    identity_matrix = np.eye(matrix.shape[0])
-    k = 1  # shrinkage parameter
-    # Loop until the weighted symmetric matrix is positive definite, which is
-    # determined by the is_positive_definite() function. This function likely
-    # checks that all eigenvalues of the matrix are positive.
-    while not _is_positive_definite(weighted_symetric_matrix):
-        # Find the minimum eigenvalue of the matrix using linalg.eigvals().
-        # The np.real() function is used to discard any imaginary components
-        # that may be returned due to numerical errors.
-        min_eigenvalues = np.min(
-            np.real(np.linalg.eigvals(weighted_symetric_matrix)))
-        # Shrink the matrix towards the identity matrix by adding a multiple of
-        # the identity matrix to the matrix. The multiple is calculated using a
-        # formula involving the minimum eigenvalue, the shrinkage parameter k,
-        # and a constant spacing.
-        weighted_symetric_matrix += identity_matrix * \
-            (- min_eigenvalues * k**2 + spacing)
-        k += 1  # Increment the shrinkage parameter k.
-    return weighted_symetric_matrix
+    try:
+        # Positive-definite already: nothing to repair
+        factor = np.linalg.cholesky(symmetric_matrix)
+        return factor if return_factor else symmetric_matrix
+
+    except np.linalg.LinAlgError:
+        pass
+
+    # Symmetric eigendecomposition, computed once
+    eigenvalues, eigenvectors = np.linalg.eigh(symmetric_matrix)
+
+    floor = (
+        tol
+        if tol is not None
+        else len(matrix) * np.finfo(np.float64).eps * np.abs(eigenvalues).max()
+    )
+    # Guard against a zero floor, e.g. for a zero matrix
+    floor = max(floor, np.finfo(np.float64).tiny)
+
+    for _ in range(max_iter + 1):
+        # Clip eigenvalues to the floor and rebuild the matrix
+        clipped = np.maximum(eigenvalues, floor)
+        repaired_matrix = (eigenvectors * clipped) @ eigenvectors.T
+        repaired_matrix = (repaired_matrix + repaired_matrix.T) / 2
+        try:
+            factor = np.linalg.cholesky(repaired_matrix)
+            return factor if return_factor else repaired_matrix
+
+        except np.linalg.LinAlgError:
+            floor *= 10
+
+    raise np.linalg.LinAlgError(
+        f"No positive-definite matrix found after {max_iter} iterations."
+    )
+
+
+def control_variate(
+    values: np.ndarray,
+    controls: np.ndarray,
+    expectation: float | np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Estimate a mean with a control variate.
+
+    The Monte Carlo mean of `values` is corrected by the error of the Monte 
+    Carlo mean of `controls`, whose expectation is known analytically:
+
+    $$
+    \\hat{\\mu} = \\bar{Y} - \\hat{\\beta} (\\bar{X} - E[X]), \\quad 
+    \\hat{\\beta} = \\frac{Cov(X, Y)}{Var(X)}
+    $$
+
+    The variance of the estimate is reduced by a factor 1 - rho^2, where 
+    rho is the correlation of the values and the controls across paths.
+
+    Notes
+    -----
+        Controls must be computed on paths sharing the random numbers of the 
+        values, e.g. GeometricBrownianMotion paths with the same seed, mean, 
+        delta and sigma as Merton paths (and mu = sigma**2 / 2, so that both 
+        have the same drift), whose expected prices are given by 
+        `GeometricBrownianMotion.expectation`. Heston paths with the same 
+        seed, nu = 0 and vol0 = theta are GBM paths with mu = rf and 
+        sigma = sqrt(theta), driven by the price noise of the Heston model.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        The simulated values, of shape (num_paths,) or (length, num_paths), 
+        e.g. terminal prices or payoffs.
+    controls : np.ndarray
+        The controls of the same shape, computed on the coupled paths.
+    expectation : float | np.ndarray
+        The expectation of the controls, a scalar or of shape (length,).
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The estimate and its standard error, one per row of 2-D values.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    controls = np.asarray(controls, dtype=np.float64)
+    expectation = np.asarray(expectation, dtype=np.float64)[..., None]
+    if values.shape != controls.shape:
+        raise ValueError(
+            f"Values and controls must have the same shape. Got "
+            f"{values.shape} and {controls.shape}."
+        )
+
+    # Optimal coefficient, estimated across the paths
+    centered_values = values - values.mean(axis=-1, keepdims=True)
+    centered_controls = controls - controls.mean(axis=-1, keepdims=True)
+    beta = (
+        (centered_values * centered_controls).sum(axis=-1, keepdims=True)
+        / (centered_controls ** 2).sum(axis=-1, keepdims=True)
+    )
+
+    adjusted = values - beta * (controls - expectation)
+    num_paths = values.shape[-1]
+    return (
+        adjusted.mean(axis=-1),
+        adjusted.std(axis=-1, ddof=1) / np.sqrt(num_paths)
+    )
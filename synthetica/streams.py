@@ -0,0 +1,507 @@
+from collections import deque
+from typing import Callable, Optional
+from zlib import crc32
+import warnings
+import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+
+BIT_GENERATORS = {
+    'pcg64': np.random.PCG64,
+    'pcg64dxsm': np.random.PCG64DXSM,
+    'philox': np.random.Philox,
+    'sfc64': np.random.SFC64,
+    'mt19937': np.random.MT19937,
+}
+
+VARIANCE_REDUCTIONS = (None, 'antithetic', 'sobol', 'moment_matching')
+
+# Maximum dimension of Sobol points, i.e. number of time steps
+SOBOL_MAX_DIMENSION = qmc.Sobol.MAXDIM
+
+
+class RandomStreams:
+    """
+    Independent random number streams for a set of paths.
+
+    Draws are keyed by a name (e.g. 'white_noise', 'jumps') and paths are
+    split into blocks of `block_size` consecutive paths. Each (name, block)
+    pair owns its own `np.random.Generator`, spawned from a single root
+    `np.random.SeedSequence`. As a result:
+
+    * Draws of a given name do not depend on the order in which other names
+      are drawn.
+    * Draws of a given block do not depend on the other blocks, so any range
+      of blocks can be generated on its own (e.g. by a worker) and matches
+      the corresponding paths of the full simulation.
+    * Successive draws of a stream continue its sequence, so drawing a series
+      in consecutive chunks of time steps matches a single draw.
+
+    Attributes
+    ----------
+    seed_sequence : np.random.SeedSequence
+        The root seed sequence.
+    num_paths : int
+        The number of paths to draw.
+    block_size : int, optional
+        The number of paths per block. Default is 1024.
+    block_offset : int, optional
+        The index of the first block, when drawing a subset of the paths of a
+        larger simulation. Default is 0.
+    bit_generator : str, optional
+        The bit generator, one of 'pcg64', 'pcg64dxsm', 'philox', 'sfc64' or
+        'mt19937'. Default is 'pcg64'.
+    dtype : np.dtype, optional
+        The floating point type of the draws, np.float32 or np.float64. 
+        Single precision variables are drawn natively (e.g. with 
+        `Generator.standard_normal(dtype=np.float32)`), and therefore differ 
+        from the rounded double precision ones. Default is np.float64.
+    variance_reduction : str, optional
+        The sampling of normal variables, None (pseudo-random), 'antithetic', 
+        'sobol' or 'moment_matching'. With 'antithetic', each pair of 
+        adjacent paths (0 and 1, 2 and 3, ...) of a block shares a single 
+        draw, mirrored on the second path. With 'sobol', each path is a point 
+        of a scrambled Sobol sequence (see `sobol_normal`), whose coordinates 
+        are the time steps, up to `SOBOL_MAX_DIMENSION` (21201) steps. Blocks 
+        of a power of 2 paths keep the balance properties of the points; 
+        other widths are drawn without scipy's balance warning. With 
+        'moment_matching', each time step of a block is shifted and rescaled 
+        to a zero mean and a unit variance across its paths, which requires 
+        at least 2 paths per block. Other variables are drawn independently 
+        for every path. Default is None.
+    length : int, optional
+        The number of time steps of the simulation, i.e. the dimension of the 
+        Sobol points. If None, or if the first draw of a name is longer, the 
+        rows of that first draw are used. Default is None.
+
+    Example
+    -------
+    >>> streams = RandomStreams(np.random.SeedSequence(123), num_paths=10)
+    >>> noise = streams.standard_normal('white_noise', rows=252)
+    """
+
+    def __init__(
+        self,
+        seed_sequence: np.random.SeedSequence,
+        num_paths: int,
+        block_size: Optional[int] = 1024,
+        block_offset: Optional[int] = 0,
+        bit_generator: Optional[str] = 'pcg64',
+        dtype: Optional[np.dtype] = np.float64,
+        variance_reduction: Optional[str] = None,
+        length: Optional[int] = None
+    ):
+        if bit_generator not in BIT_GENERATORS:
+            raise ValueError(
+                f"Bit generator must be one of {list(BIT_GENERATORS)}. Got "
+                f"'{bit_generator}'."
+            )
+        if variance_reduction not in VARIANCE_REDUCTIONS:
+            raise ValueError(
+                f"Variance reduction must be one of {VARIANCE_REDUCTIONS}. "
+                f"Got '{variance_reduction}'."
+            )
+        if variance_reduction == 'moment_matching' and (
+            block_size == 1 or num_paths % block_size == 1
+        ):
+            raise ValueError(
+                "Moment matching requires at least 2 paths per block. Got "
+                f"{num_paths} paths in blocks of {block_size}, with a last "
+                "block of a single path."
+            )
+        self.seed_sequence = seed_sequence
+        self.num_paths = num_paths
+        self.block_size = block_size
+        self.block_offset = block_offset
+        self.bit_generator = bit_generator
+        self.dtype = np.dtype(dtype)
+        self.variance_reduction = variance_reduction
+        self.length = length
+        self._generators = {}
+        # Sobol engines by name, and normal variables by (name, block) with
+        # the number of rows already drawn
+        self._engines = {}
+        self._sobol = {}
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}'
+
+    def blocks(self) -> list[tuple[int, slice]]:
+        """
+        Split the paths into blocks.
+
+        Returns
+        -------
+        list[tuple[int, slice]]
+            The global index of each block and its columns.
+        """
+        return [
+            (self.block_offset + i, slice(start, min(start + self.block_size, self.num_paths)))
+            for i, start in enumerate(range(0, self.num_paths, self.block_size))
+        ]
+
+    def generator(self, name: str, block: int) -> np.random.Generator:
+        """
+        Get the generator of a stream, creating it on first use.
+
+        Parameters
+        ----------
+        name : str
+            The name of the draw.
+        block : int
+            The global index of the block of paths.
+
+        Returns
+        -------
+        np.random.Generator
+            The generator of the (name, block) stream.
+        """
+        key = (name, block)
+        if key not in self._generators:
+            seed_sequence = np.random.SeedSequence(
+                entropy=self.seed_sequence.entropy,
+                spawn_key=(
+                    self.seed_sequence.spawn_key
+                    + (crc32(name.encode()), block)
+                )
+            )
+            self._generators[key] = np.random.Generator(
+                BIT_GENERATORS[self.bit_generator](seed_sequence)
+            )
+        return self._generators[key]
+
+    def draw(
+        self,
+        name: str,
+        rows: int,
+        sampler: Callable[[np.random.Generator, tuple], np.ndarray],
+        dtype: Optional[np.dtype] = None,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Draw a (rows, num_paths) array, block by block.
+
+        Parameters
+        ----------
+        name : str
+            The name of the draw.
+        rows : int
+            The number of time steps.
+        sampler : Callable
+            A function taking a generator and a (rows, block width) size and
+            returning the drawn array.
+        dtype : np.dtype, optional
+            The output dtype. If None, the dtype of the streams is used. 
+            Default is None.
+        out : np.ndarray, optional
+            A preallocated output array of shape (rows, num_paths) the draws 
+            are written to. If None, a new array is allocated. Default is 
+            None.
+
+        Returns
+        -------
+        np.ndarray
+            The drawn array of shape (rows, num_paths).
+        """
+        if out is None:
+            out = np.empty(
+                (rows, self.num_paths),
+                dtype=self.dtype if dtype is None else dtype
+            )
+        for block, cols in self.blocks():
+            out[:, cols] = sampler(
+                self.generator(name, block), (rows, cols.stop - cols.start))
+        return out
+
+    def standard_normal(
+        self,
+        name: str,
+        rows: int,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Draw standard normal variables of shape (rows, num_paths)"""
+        if out is None:
+            out = np.empty((rows, self.num_paths), dtype=self.dtype)
+        for block, cols in self.blocks():
+            block_out = out[:, cols]
+            generator = self.generator(name, block)
+            if self.variance_reduction == 'sobol':
+                block_out[...] = self._sobol_normal(name, block, cols, rows)
+            elif self.variance_reduction == 'antithetic':
+                # Half the draws, mirrored on every other path
+                width = cols.stop - cols.start
+                z = generator.standard_normal(
+                    (rows, (width + 1) // 2), dtype=self.dtype)
+                block_out[:, 0::2] = z
+                np.negative(z[:, :width // 2], out=block_out[:, 1::2])
+            elif block_out.flags.c_contiguous and block_out.dtype == self.dtype:
+                # Drawn in place, e.g. for a single block of paths
+                generator.standard_normal(dtype=self.dtype, out=block_out)
+            else:
+                block_out[...] = generator.standard_normal(
+                    block_out.shape, dtype=self.dtype)
+
+            if self.variance_reduction == 'moment_matching':
+                # Exact moments of each time step across the block
+                block_out -= block_out.mean(axis=1, keepdims=True)
+                block_out /= block_out.std(axis=1, keepdims=True)
+        return out
+
+    def _sobol_normal(
+        self,
+        name: str,
+        block: int,
+        cols: slice,
+        rows: int
+    ) -> np.ndarray:
+        """Next rows of the Sobol normal variables of a block"""
+        key = (name, block)
+        if key not in self._sobol:
+            dimension = max(self.length or 0, rows)
+            if dimension > SOBOL_MAX_DIMENSION:
+                raise ValueError(
+                    f"Sobol draws are limited to {SOBOL_MAX_DIMENSION} time "
+                    f"steps. Got {dimension} for '{name}'."
+                )
+            self._sobol[key] = [
+                self._sobol_points(name, block, cols, dimension), 0]
+        normals, position = self._sobol[key]
+        if position + rows > len(normals):
+            raise ValueError(
+                f"Sobol draws of '{name}' are limited to {len(normals)} rows."
+            )
+        self._sobol[key][1] = position + rows
+        return normals[position:position + rows]
+
+    def _sobol_points(
+        self,
+        name: str,
+        block: int,
+        cols: slice,
+        dimension: int
+    ) -> np.ndarray:
+        """Sobol normal variables of shape (dimension, block width)"""
+        # A single scrambled sequence per name, whose points are the paths
+        if name not in self._engines:
+            seed_sequence = np.random.SeedSequence(
+                entropy=self.seed_sequence.entropy,
+                spawn_key=self.seed_sequence.spawn_key + (crc32(name.encode()),)
+            )
+            self._engines[name] = qmc.Sobol(
+                dimension,
+                seed=np.random.Generator(
+                    BIT_GENERATORS[self.bit_generator](seed_sequence))
+            )
+        engine = self._engines[name]
+
+        first = block * self.block_size
+        if engine.num_generated > first:
+            engine.reset()
+        if first > engine.num_generated:
+            engine.fast_forward(first - engine.num_generated)
+        with warnings.catch_warnings():
+            # Other widths than powers of 2 lose the balance properties of
+            # the points (see the class docstring), but remain uniform
+            warnings.filterwarnings(
+                'ignore', message='The balance properties', category=UserWarning)
+            points = engine.random(cols.stop - cols.start)
+
+        # The same point of the sequences of two names are dependent, e.g.
+        # the price and volatility drivers of a path: points are shuffled
+        # within the block, so that names are paired at random
+        points = self.generator(name, block).permutation(points)
+        return sobol_normal(points).astype(self.dtype, copy=False)
+
+    def normal(
+        self,
+        name: str,
+        rows: int,
+        loc: Optional[float] = 0.0,
+        scale: Optional[float] = 1.0,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Draw normal variables of shape (rows, num_paths)"""
+        # Scaled in place, as Generator.normal only draws double precision
+        out = self.standard_normal(name, rows, out=out)
+        out *= scale
+        out += loc
+        return out
+
+    def uniform(
+        self,
+        name: str,
+        rows: int,
+        low: Optional[float] = 0.0,
+        high: Optional[float] = 1.0
+    ) -> np.ndarray:
+        """Draw uniform variables of shape (rows, num_paths)"""
+        # Scaled in place, as Generator.uniform only draws double precision
+        out = self.draw(
+            name, rows, lambda rng, size: rng.random(size, dtype=self.dtype))
+        out *= high - low
+        out += low
+        return out
+
+    def compound_poisson(
+        self,
+        counts_name: str,
+        sizes_name: str,
+        rows: int,
+        lam: float,
+        loc: Optional[float] = 0.0,
+        scale: Optional[float] = 1.0,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Draw compound Poisson sums of N(loc, scale) variables per cell.
+
+        Note
+        ----
+        Counts are drawn from `counts_name` one block of paths at a time, so 
+        that only a block of counts is held in memory. As the sum of k 
+        independent N(loc, scale) variables is N(k * loc, sqrt(k) * scale), 
+        only cells with a non-zero count need a single draw from 
+        `sizes_name`.
+
+        Parameters
+        ----------
+        counts_name : str
+            The name of the Poisson counts draw.
+        sizes_name : str
+            The name of the normal variables draw.
+        rows : int
+            The number of time steps.
+        lam : float
+            The expected number of variables per cell.
+        loc : float, optional
+            The mean of each variable. Default is 0.
+        scale : float, optional
+            The standard deviation of each variable. Default is 1.
+        out : np.ndarray, optional
+            An array of shape (rows, num_paths) the sums are added to, in 
+            place. If None, the sums are returned in a new array. Default is 
+            None.
+
+        Returns
+        -------
+        np.ndarray
+            The sums (added to `out` if given) of shape (rows, num_paths).
+        """
+        if out is None:
+            out = np.zeros((rows, self.num_paths), dtype=self.dtype)
+        for block, cols in self.blocks():
+            counts = self.generator(counts_name, block).poisson(
+                lam, (rows, cols.stop - cols.start))
+            cells = np.nonzero(counts)
+            k = counts[cells]
+            z = self.generator(sizes_name, block).standard_normal(len(k))
+            out[:, cols][cells] += k * loc + np.sqrt(k) * scale * z
+        return out
+
+    def noncentral_chisquare(
+        self,
+        name: str,
+        df: float,
+        nonc: np.ndarray
+    ) -> np.ndarray:
+        """
+        Draw one noncentral chi-square variable per path.
+
+        Parameters
+        ----------
+        name : str
+            The name of the draw.
+        df : float
+            The degrees of freedom.
+        nonc : np.ndarray
+            The non-centrality of each path, of shape (num_paths,).
+
+        Returns
+        -------
+        np.ndarray
+            The drawn variables of shape (num_paths,).
+        """
+        out = np.empty(self.num_paths, dtype=self.dtype)
+        for block, cols in self.blocks():
+            out[cols] = self.generator(name, block).noncentral_chisquare(
+                df, nonc[cols])
+        return out
+
+
+def sobol_normal(points: np.ndarray) -> np.ndarray:
+    """
+    Map (scrambled) Sobol points to normal variables with a Brownian bridge.
+
+    Note
+    ----
+    Points are mapped through the inverse normal CDF, then the coordinates of 
+    each point build a Brownian motion with unit time steps: the first 
+    coordinate sets the terminal value, the next ones the midpoints of 
+    successively halved intervals (see `brownian_bridge`). The leading, most 
+    uniformly distributed, coordinates thus carry most of the variance of the 
+    path. The increments of the path are independent standard normal 
+    variables, as with pseudo-random draws.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Points in [0, 1) of shape (num_points, dimension).
+
+    Returns
+    -------
+    np.ndarray
+        The increments of shape (dimension, num_points).
+    """
+    # Scrambled points can be 0, whose quantile is infinite
+    z = ndtri(np.maximum(points.T, np.finfo(np.float64).tiny))
+    return brownian_bridge(z)
+
+
+def brownian_bridge(z: np.ndarray) -> np.ndarray:
+    """
+    Build the increments of Brownian motions from standard normal variables, 
+    in Brownian bridge order.
+
+    Note
+    ----
+    With unit time steps and W(0) = 0, `z[0]` sets the terminal value 
+    W(n) = sqrt(n) z[0]. Each following variable sets the midpoint of an 
+    interval (l, r) of known values, breadth-first:
+
+    $$
+    W(m) = \\frac{(r - m) W(l) + (m - l) W(r)}{r - l}
+        + \\sqrt{\\frac{(m - l)(r - m)}{r - l}} z_k
+    $$
+
+    Parameters
+    ----------
+    z : np.ndarray
+        Standard normal variables of shape (n, num_paths).
+
+    Returns
+    -------
+    np.ndarray
+        The increments W(t) - W(t - 1) of shape (n, num_paths).
+    """
+    n = len(z)
+    w = np.zeros((n + 1,) + z.shape[1:])
+    if n == 0:
+        return w[1:]
+    w[n] = np.sqrt(n) * z[0]
+
+    k = 1
+    intervals = deque([(0, n)])
+    while intervals:
+        left, right = intervals.popleft()
+        if right - left < 2:
+            continue
+        mid = (left + right) // 2
+        w[mid] = (
+            ((right - mid) * w[left] + (mid - left) * w[right]) / (right - left)
+            + np.sqrt((mid - left) * (right - mid) / (right - left)) * z[k]
+        )
+        k += 1
+        intervals.append((left, mid))
+        intervals.append((mid, right))
+    return np.diff(w, axis=0)
@@ -0,0 +1,64 @@
+import json
+import pytest
+import numpy as np
+import pandas as pd
+
+import synthetica as sth
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+def test_record_batches():
+    model = sth.CIR(100, 3, seed=123, method='exact')
+    expected = model.transform()
+
+    batches = list(sth.record_batches(model, chunk_size=30))
+    assert [batch.num_rows for batch in batches] == [30, 30, 30, 10]
+    assert batches[0].schema.names == ['path_1', 'path_2', 'path_3', 'Date']
+
+    result = pa.Table.from_batches(batches).to_pandas()
+    assert result.index.equals(expected.index)
+    assert result.columns.equals(expected.columns)
+    assert np.allclose(result.to_numpy(), expected.to_numpy())
+
+
+@pytest.mark.parametrize("dtype", ['float32', 'float64'])
+def test_to_parquet(tmp_path, dtype: str):
+    model = sth.Heston(100, 3, seed=123, method='qe', dtype=dtype)
+    expected = model.transform()
+
+    model.to_parquet(tmp_path / 'paths.parquet', chunk_size=30)
+    file = pq.ParquetFile(tmp_path / 'paths.parquet')
+    assert file.metadata.num_row_groups == 4
+    assert file.schema_arrow.field('path_1').type == pa.from_numpy_dtype(np.dtype(dtype))
+
+    result = pd.read_parquet(tmp_path / 'paths.parquet')
+    assert result.index.equals(expected.index)
+    assert result.columns.equals(expected.columns)
+    assert np.allclose(result.to_numpy(), expected.to_numpy())
+
+    metadata = json.loads(file.schema_arrow.metadata[b'synthetica'])
+    assert metadata['model'] == 'Heston'
+    assert metadata['parameters']['method'] == 'qe'
+    assert metadata['parameters']['seed'] == 123
+    assert metadata['parameters']['dtype'] == dtype
+    assert metadata['index']['length'] == 100
+    assert metadata['index']['freq'] == 'D'
+
+
+def test_write_arrow(tmp_path):
+    model = sth.AutoRegressive(100, 1, ar=np.array([0.5, 0.2]), seed=123)
+    expected = model.transform()
+
+    sth.write_arrow(model, str(tmp_path / 'paths.arrow'), chunk_size=16)
+    with pa.ipc.open_file(str(tmp_path / 'paths.arrow')) as reader:
+        assert reader.num_record_batches == 7
+        table = reader.read_all()
+
+    metadata = json.loads(table.schema.metadata[b'synthetica'])
+    assert metadata['parameters']['ar'] == [0.5, 0.2]
+
+    result = table.to_pandas()
+    assert result.index.equals(expected.index)
+    assert np.allclose(result['path_1'].to_numpy(), expected.to_numpy())
@@ -3,7 +3,7 @@ import numpy as np
 import pandas as pd
 from pandas.testing import assert_index_equal
 
-from synthetica import GeometricBrownianMotion, nearest_positive_definite
+from synthetica import BaseSynthetic, GeometricBrownianMotion, nearest_positive_definite
 
 Model = GeometricBrownianMotion
 index = pd.date_range("2010-01-01", "2020-02-01", inclusive="left")
@@ -56,6 +56,23 @@ def test_repr():
     assert model.__class__.__name__ == 'GeometricBrownianMotion'
 
 
+def test_legacy_transform():
+    class Legacy(BaseSynthetic):
+        # Written against the former API, overriding transform only
+        def transform(self, matrix=None):
+            return self.to_pandas(np.ones((self.length, self.num_paths)))
+
+    model = Legacy(10, 2)
+    with pytest.warns(DeprecationWarning):
+        chunks = list(model.iter_transform(chunk_size=10))
+    assert np.array_equal(chunks[0].to_numpy(), np.ones((10, 2)))
+
+    with pytest.raises(NotImplementedError):
+        next(model.iter_transform(chunk_size=5))
+    with pytest.raises(NotImplementedError):
+        BaseSynthetic(10, 2).transform()
+
+
 def test_datetime_index():
     # Before transformation
     model = Model(length=index)
@@ -259,3 +276,293 @@ def test_to_pandas_series():
     # number of paths
     assert pd.DataFrame(res).shape == (length, num_paths), \
         "Shape does not match settings."
+
+
+def test_index_cached():
+    model = Model(length=10, as_of="2024-01-31")
+    idx = model.index
+    # Resolved once per parameter set
+    assert model.index is idx
+    assert model.length == 10
+    assert idx[-1] == pd.Timestamp("2024-01-31")
+
+    # Invalidated when length changes
+    model.length = 20
+    assert model.index is not idx
+    assert model.length == 20
+    assert model.index[-1] == pd.Timestamp("2024-01-31")
+
+    # Invalidated when freq changes
+    idx = model.index
+    model.freq = 'B'
+    assert model.index is not idx
+    assert all(model.index.dayofweek < 5)
+
+    # Invalidated when the anchor date changes
+    model.as_of = "2024-02-29"
+    assert model.index[-1] == pd.Timestamp("2024-02-29")
+
+
+def test_index_as_of_deterministic():
+    model1 = Model(length=30, as_of="2020-06-30")
+    model2 = Model(length=30, as_of=pd.Timestamp("2020-06-30"))
+    assert_index_equal(model1.index, model2.index)
+
+
+def test_length_invalidates_white_noise():
+    model = Model(length=10, num_paths=2, seed=123)
+    assert model.white_noise.shape == (10, 2)
+    model.length = index
+    assert model.white_noise.shape == (len(index), 2)
+    assert_index_equal(model.index, index)
+
+
+def test_red_noise_filter():
+    model = Model(length, num_paths, mean, delta, sigma, seed=123)
+    model.tau = 0.5
+    res = model.red_noise
+    assert res.shape == (length, num_paths)
+
+    # Reference recursion
+    expected = np.zeros((length, num_paths))
+    for i in range(1, length):
+        expected[i] = (
+            (model.tau / (model.tau + delta)) *
+            (delta * model.white_noise[i] + expected[i - 1])
+        )
+    assert np.allclose(res, expected)
+
+
+def test_iter_red_noise():
+    model = Model(length, num_paths, mean, delta, sigma, seed=123)
+    model.tau = 0.5
+    expected = model.red_noise
+
+    chunks = list(model.iter_red_noise(chunk_size=1000))
+    assert len(chunks) == int(np.ceil(length / 1000))
+    assert all(chunk.shape[0] <= 1000 for chunk in chunks)
+    assert np.allclose(np.vstack(chunks), expected)
+
+    with pytest.raises(AttributeError):
+        next(Model(length, num_paths).iter_red_noise(chunk_size=10))
+
+
+def test_create_corr_returns_layout():
+    model = Model(length, num_paths, mean, delta, sigma, seed=123)
+    res = model.create_corr_returns(matrix)
+
+    # Reference element-wise extraction
+    rvs = model.streams().normal(
+        'corr_returns', rows=length, scale=np.sqrt(delta) * sigma)
+    expected = (np.linalg.cholesky(matrix) @ rvs.T).T
+    assert np.allclose(res.to_numpy(), expected)
+
+    # Preallocated output buffer
+    out = np.empty((length, num_paths))
+    res = model.create_corr_returns(matrix, out=out)
+    assert np.shares_memory(res.to_numpy(), out)
+    assert np.allclose(out, expected)
+
+
+def test_random_streams():
+    model = Model(length, num_paths, mean, delta, sigma, seed=123)
+    state = np.random.get_state()[1].copy()
+    model.white_noise
+    model.create_corr_returns(matrix)
+    # The global random state is left untouched
+    assert np.array_equal(np.random.get_state()[1], state)
+
+    # The seed is independent of other models drawing concurrently
+    other = Model(length, num_paths, mean, delta, sigma, seed=123)
+    Model(length, num_paths, seed=1).white_noise
+    assert np.array_equal(other.white_noise, model.white_noise)
+
+    model.bit_generator = 'philox'
+    assert not np.array_equal(other.white_noise, model.white_noise)
+
+    with pytest.raises(ValueError):
+        Model(length, num_paths, bit_generator='unknown')
+
+
+@pytest.mark.parametrize("n_jobs", [None, 1, 4, 5000])
+def test_cholesky_transform_threads(n_jobs):
+    rvs = np.random.normal(size=(1000, num_paths))
+    expected = rvs @ np.linalg.cholesky(matrix).T
+    assert np.allclose(Model.cholesky_transform(rvs, matrix, n_jobs=n_jobs), expected)
+
+    out = np.empty_like(rvs)
+    res = Model.cholesky_transform(rvs, matrix, out=out, n_jobs=n_jobs)
+    assert np.shares_memory(res, out)
+    assert np.allclose(out, expected)
+
+    model = Model(length, num_paths, seed=123)
+    assert np.allclose(
+        model.create_corr_returns(matrix, n_jobs=n_jobs).to_numpy(),
+        model.create_corr_returns(matrix).to_numpy()
+    )
+
+
+@pytest.mark.parametrize("batch_size", [1, 8, 20, 64, 1000])
+def test_iter_paths(batch_size: int):
+    model = Model(length, 50, mean, delta, sigma, seed=123)
+    model.block_size = 8
+    expected = model.transform()
+
+    batches = list(model.iter_paths(batch_size=batch_size))
+    width = max(batch_size // 8, 1) * 8
+    assert all(batch.shape == (length, min(width, 50)) for batch in batches[:-1])
+
+    result = pd.concat(batches, axis=1)
+    assert result.columns.equals(expected.columns)
+    assert np.array_equal(result.to_numpy(), expected.to_numpy())
+
+    # Unseeded batches share the same entropy
+    model.seed = None
+    assert pd.concat(model.iter_paths(batch_size=16), axis=1).shape == (length, 50)
+
+    with pytest.raises(ValueError):
+        next(model.iter_paths(batch_size=0))
+
+
+def test_output():
+    model = Model(length, num_paths, seed=123)
+    expected = model.transform()
+
+    paths = model.transform(output='numpy')
+    assert isinstance(paths, np.ndarray)
+    assert np.array_equal(paths, expected.to_numpy())
+
+    # Neither pandas nor numpy copies the paths
+    assert np.shares_memory(model.to_output(paths, 'numpy'), paths)
+    assert np.shares_memory(model.to_output(paths, 'pandas').to_numpy(), paths)
+    assert model.columns is model.columns
+    assert model.columns.equals(expected.columns)
+
+    returns = model.create_corr_returns(matrix, output='numpy')
+    assert np.array_equal(returns, model.create_corr_returns(matrix).to_numpy())
+
+    chunks = list(model.iter_transform(7, output='numpy'))
+    assert np.allclose(np.concatenate(chunks), paths)
+
+    with pytest.raises(ValueError):
+        model.transform(output='polars')
+    with pytest.raises(ValueError):
+        next(model.iter_paths(8, output='polars'))
+
+
+def test_output_xarray():
+    pytest.importorskip('xarray')
+    model = Model(length, num_paths, seed=123)
+    expected = model.transform()
+    result = model.transform(output='xarray')
+    assert result.dims == ('Date', 'symbol')
+    assert np.array_equal(result.to_numpy(), expected.to_numpy())
+    assert result.indexes['symbol'].equals(expected.columns)
+
+
+def test_dtype():
+    model = Model(length, num_paths, mean, delta, sigma, seed=123)
+    model.tau = 0.5
+    assert model.white_noise.dtype == np.float64
+
+    model.dtype = 'float32'
+    assert model.white_noise.dtype == np.float32
+    assert model.red_noise.dtype == np.float32
+    assert all(chunk.dtype == np.float32 for chunk in model.iter_red_noise(1000))
+    assert Model.cholesky_transform(model.white_noise, matrix).dtype == np.float32
+
+    # Same moments as the double precision draws
+    assert np.isclose(model.white_noise.mean(), mean, atol=1e-3)
+    assert np.isclose(model.white_noise.std(), np.sqrt(delta) * sigma, rtol=1e-2)
+
+    with pytest.raises(ValueError):
+        model.dtype = 'float16'
+    with pytest.raises(ValueError):
+        Model(length, num_paths, dtype='unknown')
+
+
+def test_to_prices_in_place():
+    model = Model(length, num_paths, seed=123)
+    log_returns = model.white_noise.copy()
+    expected = np.exp(np.cumsum(log_returns, axis=0)) * 50
+
+    res = model.to_prices(log_returns, start_value=50)
+    assert np.allclose(res, expected, rtol=1e-12)
+    assert not np.shares_memory(res, log_returns)
+
+    res = model.to_prices(log_returns, start_value=50, out=log_returns)
+    assert res is log_returns
+    assert np.allclose(res, expected, rtol=1e-12)
+
+    assert np.allclose(model.to_prices([0, 1]), [100, 100 * np.e])
+
+
+def test_to_memmap(tmp_path):
+    model = Model(length, num_paths, seed=123)
+    expected = model.transform()
+
+    result = model.to_memmap(tmp_path / 'paths.npy', output='pandas')
+    stored = np.load(tmp_path / 'paths.npy', mmap_mode='r')
+    assert result.columns.equals(expected.columns)
+    assert np.allclose(result.to_numpy(), expected.to_numpy())
+    assert np.array_equal(stored, result.to_numpy())
+
+    # Chunks and batches written to a user array, e.g. a raw memmap
+    out = np.memmap(
+        tmp_path / 'paths.dat', dtype=np.float64, mode='w+', shape=(length, num_paths))
+    chunks = list(model.iter_transform(1000, output='numpy', out=out))
+    assert all(np.shares_memory(chunk, out) for chunk in chunks)
+    assert np.allclose(out, expected.to_numpy())
+
+    out[:] = 0
+    model.block_size = 2
+    batches = list(model.iter_paths(2, out=out))
+    assert all(np.shares_memory(batch.to_numpy(), out) for batch in batches)
+    assert np.array_equal(out, pd.concat(batches, axis=1).to_numpy())
+
+    # Pandas objects wrap the mapped array
+    assert np.shares_memory(model.to_pandas(out).to_numpy(), out)
+
+    with pytest.raises(ValueError):
+        next(model.iter_transform(1000, out=np.empty((length, num_paths + 1))))
+
+
+def test_variance_reduction():
+    model = Model(length, 4, mean, delta, sigma, seed=123)
+    noise = model.white_noise
+
+    model.variance_reduction = 'antithetic'
+    assert 'white_noise' not in model.__dict__
+    antithetic = model.white_noise
+    assert np.allclose(antithetic[:, 0::2] + antithetic[:, 1::2], 2 * mean)
+    assert not np.allclose(noise[:, 0::2] + noise[:, 1::2], 2 * mean)
+
+    # Exact sample mean across the pairs
+    model = Model(length, 1000, mean, delta, sigma, seed=123, variance_reduction='antithetic')
+    assert np.allclose(model.white_noise.mean(axis=1), mean)
+
+    # Mirrored pairs would break the correlation of the paths
+    with pytest.raises(ValueError):
+        model.transform(np.eye(1000))
+    with pytest.raises(ValueError):
+        model.create_corr_returns(np.eye(1000))
+    model.variance_reduction = 'sobol'
+    with pytest.raises(ValueError):
+        model.transform(np.eye(1000))
+
+    # Sobol points have up to 21201 dimensions, one per time step
+    with pytest.raises(ValueError, match='21201'):
+        Model(21202, variance_reduction='sobol')
+    with pytest.raises(ValueError, match='21201'):
+        Model(21202).variance_reduction = 'sobol'
+
+    model.variance_reduction = 'moment_matching'
+    assert np.allclose(model.white_noise.mean(axis=1), mean)
+    assert np.allclose(model.white_noise.std(axis=1), np.sqrt(delta) * sigma)
+
+    # The last block of paths would hold a single path
+    model = Model(length, 1025, variance_reduction='moment_matching')
+    with pytest.raises(ValueError):
+        model.transform()
+    with pytest.raises(ValueError):
+        model.variance_reduction = 'halton'
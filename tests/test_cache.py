@@ -0,0 +1,77 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from synthetica import GeometricBrownianMotion, CholeskyCache, nearest_positive_definite
+
+
+def test_factorize_cached():
+    cache = CholeskyCache()
+    matrix = np.array([[1, .5], [.5, 1]])
+
+    factor, repaired = cache.factorize(matrix)
+    assert np.allclose(factor, np.linalg.cholesky(matrix))
+    assert not repaired
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # Same content, different object and type
+    cached, _ = cache.factorize(pd.DataFrame(matrix.copy()))
+    assert cached is factor
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 1
+
+    # Factors cannot be mutated in place
+    with pytest.raises(ValueError):
+        factor[0, 0] = 2
+
+
+def test_factorize_repaired():
+    cache = CholeskyCache()
+    matrix = np.array([[1, 2], [2, 1]])
+
+    factor, repaired = cache.factorize(matrix)
+    assert repaired
+    assert np.allclose(
+        factor, np.linalg.cholesky(nearest_positive_definite(matrix)))
+
+    _, repaired = cache.factorize(matrix)
+    assert repaired
+    assert cache.hits == 1
+
+
+def test_lru_eviction():
+    matrices = [np.eye(10) * (i + 1) for i in range(3)]
+    nbytes = matrices[0].nbytes
+    cache = CholeskyCache(max_bytes=2 * nbytes)
+
+    cache.factorize(matrices[0])
+    cache.factorize(matrices[1])
+    cache.factorize(matrices[0])  # Most recently used
+    cache.factorize(matrices[2])  # Evicts matrices[1]
+    assert len(cache) == 2
+    assert cache.nbytes == 2 * nbytes
+
+    cache.factorize(matrices[0])
+    assert cache.hits == 2
+    cache.factorize(matrices[1])
+    assert cache.misses == 4
+
+    # Factors larger than the cache are not stored
+    CholeskyCache(max_bytes=nbytes - 1).factorize(matrices[0])
+
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_cholesky_transform_cache():
+    cache = CholeskyCache()
+    matrix = np.array([[1, .7], [.7, 1]])
+    rvs = np.random.normal(size=(100, 2))
+
+    model = GeometricBrownianMotion(num_paths=2)
+    expected = model.cholesky_transform(rvs, matrix)
+    for _ in range(3):
+        result = model.cholesky_transform(rvs, matrix, cache=cache)
+        assert np.allclose(result, expected)
+
+    assert (cache.hits, cache.misses) == (2, 1)
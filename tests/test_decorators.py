@@ -33,4 +33,27 @@ def test_callback():
     
     
     
-    
\ No newline at end of file
+    
+
+class MultiCacheModel:
+    def __init__(self, param):
+        self._param = param
+
+    @property
+    def param(self):
+        return self._param
+
+    @param.setter
+    @callback('first', 'second')
+    def param(self, value):
+        self._param = value
+
+
+def test_callback_multiple_caches():
+    model = MultiCacheModel(1)
+    model.__dict__.update(first=1, second=2, third=3)
+
+    model.param = 2
+    assert 'first' not in model.__dict__
+    assert 'second' not in model.__dict__
+    assert model.__dict__['third'] == 3
@@ -0,0 +1,59 @@
+import pytest
+import numpy as np
+
+from synthetica.filters import red_noise_filter, all_pole_filter, all_pole_zi
+
+
+def loop_red_noise(noise: np.ndarray, tau: float, delta: float) -> np.ndarray:
+    red_noise = np.zeros_like(noise)
+    previous_value = np.zeros(noise.shape[1])
+    for i, row in enumerate(noise):
+        red_noise[i] = (tau / (tau + delta)) * (delta * row + previous_value)
+        previous_value = red_noise[i]
+    return red_noise
+
+
+def test_red_noise_filter():
+    noise = np.random.normal(size=(100, 4))
+    result, zf = red_noise_filter(noise, tau=0.5, delta=0.1)
+    assert result.shape == noise.shape
+    assert zf.shape == (1, 4)
+    assert np.allclose(result, loop_red_noise(noise, 0.5, 0.1))
+
+
+def test_red_noise_filter_chunks():
+    noise = np.random.normal(size=(100, 3))
+    expected, _ = red_noise_filter(noise, tau=2.0, delta=1/252)
+
+    zi = None
+    chunks = []
+    for start in range(0, 100, 33):
+        chunk, zi = red_noise_filter(noise[start:start + 33], 2.0, 1/252, zi)
+        chunks.append(chunk)
+
+    assert np.allclose(np.vstack(chunks), expected)
+
+
+def test_all_pole_filter():
+    ar = [0.5, -0.2, 0.1]
+    past = np.random.normal(size=(3, 4))
+    x = np.random.normal(size=(50, 4))
+    result, zf = all_pole_filter(x, ar, all_pole_zi(ar, past))
+    assert zf.shape == (3, 4)
+
+    # Reference recursion
+    expected = np.vstack([past, np.zeros((50, 4))])
+    for t in range(3, 53):
+        expected[t] = x[t - 3] + sum(
+            ar[j] * expected[t - 1 - j] for j in range(3))
+    assert np.allclose(result, expected[3:])
+
+    # Filter state carries over to the next chunk
+    head, zi = all_pole_filter(x[:20], ar, all_pole_zi(ar, past))
+    tail, _ = all_pole_filter(x[20:], ar, zi)
+    assert np.allclose(np.vstack([head, tail]), result)
+
+
+def test_all_pole_zi_shape():
+    with pytest.raises(ValueError):
+        all_pole_zi([0.5, 0.2], np.zeros(3))
@@ -1,3 +1,4 @@
+import tracemalloc
 import pytest
 import pandas as pd
 import numpy as np
@@ -19,6 +20,23 @@ simulators = [
     sth.Seasonal
 ]
 
+# Define the model configurations covering every simulation scheme.
+models = [
+    (sth.GeometricBrownianMotion, {}),
+    (sth.Heston, {}),
+    (sth.Heston, {'method': 'qe'}),
+    (sth.Merton, {'lmbda': 0.05}),
+    (sth.Poisson, {}),
+    (sth.LevyStable, {}),
+    (sth.CIR, {'method': 'truncated'}),
+    (sth.CIR, {'method': 'exact'}),
+    (sth.MeanReverting, {'method': 'exact'}),
+    (sth.AutoRegressive, {'ar': [0.5, 0.2], 'burn_in': 20}),
+    (sth.AutoRegressive, {'ar': np.array([np.eye(3) * 0.5])}),
+    (sth.NARMA, {'n': 10, 'a': [0.2, 0.004, 1.5, 0.001]}),
+    (sth.Seasonal, {}),
+]
+
 
 @pytest.fixture(params=simulators, ids=[sim.__name__ for sim in simulators])
 def simulator_data(request: pytest.FixtureRequest):
@@ -269,3 +287,515 @@ def test_common_checks(simulator_data: tuple, length: int, num_paths: int):
     assert np.allclose(transformed_rvs, rvs), \
         "Expected transformed variables to be the same as the original ones"
 
+
+
+def test_merton_jumps():
+    length, num_paths, lmbda, mu, var = 1000, 100, 0.01, 0.2, 0.01
+    model = sth.Merton(length, num_paths, lmbda=lmbda, var=var, mu=mu, seed=42)
+    jump = model._jumps(model.streams(), length)
+    assert jump.shape == (length, num_paths)
+
+    # Each cell receives a Poisson(lmbda) number of jumps
+    cells = length * num_paths
+    expected_cells = cells * (1 - np.exp(-lmbda))
+    assert abs(np.count_nonzero(jump) - expected_cells) < 5 * np.sqrt(expected_cells)
+
+    # Jump sizes follow N(mu, var)
+    expected_total = mu * lmbda * cells
+    assert np.isclose(jump.sum(), expected_total, rtol=0.1)
+
+
+def test_poisson_jumps():
+    length, num_paths, mu, var = 500, 200, 0.2, 0.01
+    model = sth.Poisson(length, num_paths, var=var, mu=mu, seed=42)
+    jump = model._jumps(model.streams(), length)
+    assert jump.shape == (length, num_paths)
+
+    # Each cell receives a Poisson(lambda_poisson) number of jumps
+    cells = length * num_paths
+    lmbda = model.lambda_poisson
+    expected_cells = cells * (1 - np.exp(-lmbda))
+    assert abs(np.count_nonzero(jump) - expected_cells) < 5 * np.sqrt(expected_cells)
+
+    # Jump sizes follow N(mu, var)
+    expected_total = mu * lmbda * cells
+    assert np.isclose(jump.sum(), expected_total, rtol=0.1)
+
+
+def test_mean_reverting_euler_recursion():
+    model = sth.MeanReverting(500, 5, kappa=3.0, mu=0.5, start_value=0.1)
+    result = model.transform().to_numpy()
+
+    # Reference Euler loop
+    expected = np.full((501, 5), 0.1)
+    for t in range(1, 501):
+        expected[t] = (
+            expected[t - 1] + 3.0 * (0.5 - expected[t - 1]) * model.delta
+            + model.white_noise[t - 1]
+        )
+    assert np.allclose(result, expected[1:])
+
+
+@pytest.mark.parametrize("delta", [1/252, 1/12, 1.0])
+def test_mean_reverting_exact(delta: float):
+    kappa, mu, sigma = 3.0, 0.5, 0.2
+    model = sth.MeanReverting(
+        200, 5000, delta=delta, sigma=sigma, kappa=kappa, mu=mu,
+        start_value=mu, method='exact'
+    )
+    paths = model.transform().to_numpy()
+
+    # The process starts at its long-run mean and stays stationary
+    expected_std = sigma / np.sqrt(2 * kappa)
+    expected_std_t = expected_std * np.sqrt(
+        1 - np.exp(-2 * kappa * delta * np.arange(1, 201)))
+    assert np.allclose(paths.mean(axis=1), mu, atol=10 * expected_std / np.sqrt(5000))
+    assert np.allclose(paths.std(axis=1), expected_std_t, rtol=0.1)
+
+
+def test_mean_reverting_method():
+    with pytest.raises(ValueError):
+        sth.MeanReverting(method='milstein')
+
+
+def test_autoregressive_recursion():
+    ar = [0.5, -0.2, 0.1]
+    initial = np.array([0.3, -0.1, 0.2])
+    model = sth.AutoRegressive(200, 4, ar=ar, initial=initial)
+    result = model.transform().to_numpy()
+
+    # Reference recursion
+    expected = np.vstack([np.tile(initial[:, None], 4), np.zeros((200, 4))])
+    for t in range(3, 203):
+        expected[t] = model.white_noise[t - 3] + sum(
+            ar[j] * expected[t - 1 - j] for j in range(3))
+    assert np.allclose(result, expected[3:])
+
+
+def test_autoregressive_burn_in():
+    model = sth.AutoRegressive(100, 3, burn_in=50)
+    assert model.transform().shape == (100, 3)
+
+
+def test_vector_autoregressive():
+    # Diagonal VAR(2) matrices reduce to independent AR(2) processes
+    num_paths = 3
+    ar = [[0.5, 0.3, -0.1], [-0.2, 0.1, 0.4]]
+    model = sth.AutoRegressive(
+        100, num_paths, ar=np.array([np.diag(a) for a in ar]), seed=123)
+    result = model.transform().to_numpy()
+
+    for i in range(num_paths):
+        expected = np.zeros(102)
+        for t in range(2, 102):
+            expected[t] = (
+                ar[0][i] * expected[t - 1] + ar[1][i] * expected[t - 2]
+                + model.white_noise[t - 2, i]
+            )
+        assert np.allclose(result[:, i], expected[2:])
+
+    with pytest.raises(ValueError):
+        sth.AutoRegressive(100, 2, ar=np.zeros((2, 3, 3)))
+
+
+def reference_narma(model: sth.NARMA, u: np.ndarray) -> np.ndarray:
+    # u holds n presampled inputs followed by the inputs of the series
+    paths = np.full((model.length + 1, model.num_paths), model.start_value)
+    for length in range(1, model.length + 1):
+        paths[length] = (
+            model.a[0] * paths[length - 1] +
+            model.a[1] * paths[length - 1] * sum(paths[length - model.n:length]) +
+            model.a[2] * u[length - 1] * u[length - 1 + model.n] +
+            model.a[3]
+        )
+    return paths[1:]
+
+
+@pytest.mark.parametrize("length, n, a", [
+    (500, 10, None),
+    (500, 30, None),
+    (500, 30, [0.2, 0.004, 1.5, 0.001]),
+    (5, 4, None),
+    (5, 6, None),
+])
+def test_narma_rolling_window(length: int, n: int, a: list):
+    model = sth.NARMA(length, 4, n=n, a=a, seed=123)
+    result = model.transform().to_numpy()
+
+    u = model.streams().uniform('uniform', rows=n + length, low=0, high=0.5)
+    with np.errstate(all='ignore'):
+        expected = reference_narma(model, u)
+    assert np.allclose(result, expected, equal_nan=True)
+
+
+def test_narma_coefficients():
+    a = [0.2, 0.004, 1.5, 0.001]
+    model = sth.NARMA(50, 2, a=np.array(a))
+    assert model.a == a
+    assert model.transform().shape == (50, 2)
+
+    with pytest.raises(ValueError):
+        sth.NARMA(a=[])
+
+
+@pytest.mark.parametrize("delta", [1/252, 1/4])
+def test_cir_exact(delta: float):
+    kappa, mu, sigma, start_value = 2.0, 0.04, 0.3, 0.1
+    model = sth.CIR(
+        40, 20000, delta=delta, sigma=sigma, start_value=start_value,
+        kappa=kappa, mu=mu, method='exact'
+    )
+    paths = model.transform().to_numpy()
+    assert np.all(paths >= 0)
+
+    # Analytic conditional mean and variance
+    t = delta * np.arange(1, 41)
+    decay = np.exp(-kappa * t)
+    expected_mean = mu + (start_value - mu) * decay
+    expected_var = (
+        start_value * sigma**2 / kappa * (decay - decay**2)
+        + mu * sigma**2 / (2 * kappa) * (1 - decay)**2
+    )
+    assert np.allclose(paths.mean(axis=1), expected_mean, rtol=0.05)
+    assert np.allclose(paths.var(axis=1), expected_var, rtol=0.1)
+
+    with pytest.raises(ValueError):
+        sth.CIR(10, 2, method='exact').transform(np.eye(2))
+    with pytest.raises(ValueError):
+        sth.CIR(method='exact', sigma=0)
+
+
+@pytest.mark.parametrize("method", ['truncated', 'reflected'])
+def test_cir_positive_schemes(method: str):
+    # Feller condition violated: the plain Euler scheme produces NaNs
+    params = dict(sigma=1.0, start_value=0.01, kappa=0.5, mu=0.01)
+    model = sth.CIR(252, 50, **params, method=method)
+    paths = model.transform().to_numpy()
+    assert not np.isnan(paths).any()
+    assert np.all(paths >= 0)
+
+    with pytest.raises(ValueError):
+        sth.CIR(method='milstein')
+
+
+@pytest.mark.parametrize("delta", [1/252, 1/12, 1/2])
+def test_heston_qe_martingale(delta: float):
+    rf, horizon, num_paths = 0.05, 2, 50000
+    model = sth.Heston(
+        int(round(horizon / delta)), num_paths, delta=delta, rf=rf,
+        method='qe', seed=123
+    )
+    prices = model.transform().to_numpy()
+    assert np.all(prices > 0)
+
+    # Discounted prices are martingales
+    terminal = prices[-1]
+    expected = model.start_value * np.exp(rf * horizon)
+    std_error = terminal.std() / np.sqrt(num_paths)
+    assert abs(terminal.mean() - expected) < 4 * std_error
+
+    with pytest.raises(ValueError):
+        sth.Heston(method='milstein')
+    with pytest.raises(ValueError):
+        sth.Heston(method='qe', kappa=0)
+
+
+def test_heston_qe_deterministic_variance():
+    # Without volatility of volatility, from the long-run variance, both
+    # schemes are GBM driven by the price noise
+    qe = sth.Heston(252, 100, seed=123, method='qe', nu=0, vol0=0.2 ** 2)
+    euler = sth.Heston(252, 100, seed=123, nu=0, vol0=0.2 ** 2)
+    assert np.allclose(qe.transform().to_numpy(), euler.transform().to_numpy())
+
+    # Variance decaying to theta, with discounted prices as martingales
+    model = sth.Heston(252, 20000, seed=123, method='qe', nu=0)
+    terminal = model.transform().to_numpy()[-1]
+    expected = model.start_value * np.exp(model.rf * model.delta * 252)
+    assert abs(terminal.mean() - expected) < 4 * terminal.std() / np.sqrt(20000)
+    assert np.all(np.isfinite(terminal))
+
+
+@pytest.mark.parametrize("model, kwargs", models)
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 500])
+def test_iter_transform(model, kwargs: dict, chunk_size: int):
+    model = model(100, 3, seed=123, **kwargs)
+    expected = model.transform()
+
+    chunks = list(model.iter_transform(chunk_size=chunk_size))
+    assert len(chunks) == int(np.ceil(100 / chunk_size))
+    assert all(len(chunk) <= chunk_size for chunk in chunks)
+
+    result = pd.concat(chunks)
+    assert result.index.equals(expected.index)
+    assert np.allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-12)
+
+
+@pytest.mark.parametrize("model, kwargs", models)
+def test_iter_transform_modified_chunks(model, kwargs: dict):
+    model = model(100, 3, seed=123, **kwargs)
+    expected = model.transform().to_numpy()
+
+    # Chunks changed in place by the caller do not leak into the next ones
+    chunks = []
+    for chunk in model.iter_transform(chunk_size=7):
+        values = chunk.to_numpy()
+        chunks.append(values.copy())
+        values[:] = 0
+    assert np.allclose(np.vstack(chunks), expected, rtol=1e-12)
+
+
+def test_iter_transform_matrix():
+    matrix = np.array([[1, .5, .2], [.5, 1, .3], [.2, .3, 1]])
+    model = sth.CIR(60, 3, seed=123)
+    expected = model.transform(matrix).to_numpy()
+    result = pd.concat(model.iter_transform(chunk_size=16, matrix=matrix))
+    assert np.allclose(result.to_numpy(), expected)
+
+    with pytest.raises(ValueError):
+        next(model.iter_transform(chunk_size=0))
+
+
+@pytest.mark.parametrize("alpha, beta", [(1.68, 0.01), (1.5, 0.0), (1.0, 0.5)])
+def test_levy_stable_distribution(alpha: float, beta: float):
+    model = sth.LevyStable(2000, 5, alpha=alpha, beta=beta, seed=123)
+    draws = model._stable(model.streams(), model.length).ravel()
+    scale = np.sqrt(model.delta) * model.sigma
+    _, p_value = stats.kstest(
+        draws, stats.levy_stable(alpha, beta, loc=model.mean, scale=scale).cdf)
+    assert p_value > 0.001
+
+
+class Float32Draws(sth.RandomStreams):
+    """Single precision draws, returned in double precision"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs, dtype=np.float32)
+
+    def draw(self, name, rows, sampler, dtype=None, out=None):
+        out = super().draw(name, rows, sampler, dtype, out)
+        return out.astype(np.float64) if out.dtype == np.float32 else out
+
+    def standard_normal(self, name, rows, out=None):
+        # Also upcasts normal, which is scaled in place
+        out = super().standard_normal(name, rows, out)
+        return out.astype(np.float64, copy=False)
+
+    def noncentral_chisquare(self, *args, **kwargs):
+        return super().noncentral_chisquare(*args, **kwargs).astype(np.float64)
+
+
+@pytest.mark.parametrize("model, kwargs", models + [
+    (sth.LevyStable, {'alpha': 1.0, 'beta': 0.5}),
+])
+def test_float32(model, kwargs: dict):
+    result = model(252, 3, seed=123, dtype='float32', **kwargs)
+    paths = result.transform(output='numpy')
+    assert paths.dtype == np.float32
+    assert all(
+        chunk.dtype == np.float32
+        for chunk in result.iter_transform(chunk_size=50, output='numpy')
+    )
+
+    # Same single precision draws, simulated in double precision
+    expected = model(252, 3, seed=123, **kwargs)
+    expected.streams = lambda: Float32Draws(
+        np.random.SeedSequence(123), expected.num_paths)
+    expected = expected.transform(output='numpy')
+    assert expected.dtype == np.float64
+
+    tol = 1e-5
+    if kwargs.get('method') == 'qe':
+        # Rounding amplified by the exponentials of the QE variance branches
+        tol = 2e-4
+    elif model is sth.Seasonal:
+        # Phases of up to 2 pi f t are rounded to float32
+        tol = 1e-3
+    error = np.abs(paths - expected).max() / np.abs(expected).max()
+    assert error < tol
+
+
+def test_float32_matrix():
+    matrix = np.array([[1, .5, .2], [.5, 1, .3], [.2, .3, 1]])
+    model = sth.GeometricBrownianMotion(252, 3, seed=123, dtype='float32')
+    assert model.transform(matrix, output='numpy').dtype == np.float32
+    assert model.create_corr_returns(matrix, output='numpy').dtype == np.float32
+
+    with pytest.raises(ValueError):
+        sth.GeometricBrownianMotion(dtype='int64')
+
+
+@pytest.mark.parametrize("model, kwargs", [
+    (model, kwargs) for model, kwargs in models
+    if model in (
+        sth.GeometricBrownianMotion, sth.Merton, sth.Poisson, sth.LevyStable)
+])
+def test_out_peak_memory(model, kwargs: dict):
+    model = model(252, 16384, seed=123, **kwargs)
+    out = np.empty((model.length, model.num_paths))
+
+    tracemalloc.start()
+    try:
+        result = model.transform(output='numpy', out=out)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # About 1x the output, which is preallocated
+    assert peak < 0.25 * out.nbytes
+    assert result is out
+    assert np.array_equal(out, type(model)(252, 16384, seed=123, **kwargs).transform(output='numpy'))
+
+
+@pytest.mark.parametrize("model, kwargs", models)
+def test_out(model, kwargs: dict):
+    model = model(100, 3, seed=123, **kwargs)
+    expected = model.transform()
+
+    out = np.empty((100, 3))
+    result = model.transform(out=out)
+    assert np.shares_memory(result.to_numpy(), out)
+    assert np.array_equal(out, expected.to_numpy())
+
+    # Correlated paths
+    matrix = np.array([[1, .5, .2], [.5, 1, .3], [.2, .3, 1]])
+    if kwargs.get('method') != 'exact':
+        assert np.array_equal(
+            model.transform(matrix, out=out).to_numpy(),
+            model.transform(matrix).to_numpy()
+        )
+
+    with pytest.raises(ValueError):
+        model.transform(out=np.empty((100, 2)))
+    with pytest.raises(ValueError):
+        model.transform(out=np.empty((100, 3), dtype=np.float32))
+
+
+@pytest.mark.parametrize("model, kwargs", models)
+def test_to_memmap(tmp_path, model, kwargs: dict):
+    model = model(100, 3, seed=123, **kwargs)
+    expected = model.transform(output='numpy')
+
+    result = model.to_memmap(tmp_path / 'paths.npy', chunk_size=7)
+    assert isinstance(result, np.memmap)
+    assert np.allclose(result, expected, rtol=1e-12)
+    assert np.array_equal(np.load(tmp_path / 'paths.npy', mmap_mode='r'), result)
+
+
+@pytest.mark.parametrize("model, kwargs", [
+    (model, kwargs) for model, kwargs in models
+    # Stable, noncentral chi-square and uniform draws are not mirrored, and
+    # the 3 series of the VAR process cannot form pairs
+    if model not in (sth.LevyStable, sth.NARMA)
+    and (model, kwargs.get('method')) != (sth.CIR, 'exact')
+    and np.ndim(kwargs.get('ar', [])) < 2
+])
+def test_antithetic(model, kwargs: dict):
+    model = model(100, 4, seed=123, variance_reduction='antithetic', **kwargs)
+    expected = model.transform()
+
+    result = pd.concat(model.iter_transform(chunk_size=7))
+    assert np.allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-12)
+    assert not np.allclose(expected.to_numpy(), type(model)(100, 4, seed=123, **kwargs).transform().to_numpy())
+
+
+def test_antithetic_pairs():
+    # Linear models mirror around their deterministic path
+    paths = sth.AutoRegressive(100, 4, ar=[0.5, 0.2], seed=123, variance_reduction='antithetic').transform()
+    assert np.allclose(paths.iloc[:, 0::2].to_numpy(), -paths.iloc[:, 1::2].to_numpy())
+
+    model = sth.GeometricBrownianMotion(100, 4, seed=123, variance_reduction='antithetic')
+    log_prices = np.log(model.transform().to_numpy() / 100)
+    drift = np.cumsum(np.full(100, model.mu * model.delta - 0.5 * model.sigma ** 2 * model.delta))
+    assert np.allclose((log_prices[:, 0::2] + log_prices[:, 1::2]) / 2, drift[:, None])
+
+
+@pytest.mark.parametrize("model, kwargs, ratio", [
+    (sth.GeometricBrownianMotion, {}, 0.5),
+    (sth.Heston, {}, 0.9),
+    (sth.Heston, {'method': 'qe'}, 0.8),
+])
+def test_antithetic_variance(model, kwargs: dict, ratio: float):
+    # Standard error of the mean terminal price over seeds
+    def estimates(**options):
+        return [
+            model(252, 200, seed=seed, **kwargs, **options).transform(output='numpy')[-1].mean()
+            for seed in range(40)
+        ]
+    assert np.std(estimates(variance_reduction='antithetic')) < ratio * np.std(estimates())
+
+
+@pytest.mark.parametrize("model, kwargs, ratio", [
+    (sth.GeometricBrownianMotion, {}, 0.1),
+    (sth.Heston, {}, 0.8),
+    (sth.Heston, {'method': 'qe'}, 0.8),
+    (sth.CIR, {}, 0.1),
+    (sth.MeanReverting, {}, 0.1),
+])
+def test_sobol(model, kwargs: dict, ratio: float):
+    sobol = model(100, 8, seed=123, variance_reduction='sobol', **kwargs)
+    sobol.block_size = 4
+    expected = sobol.transform(output='numpy')
+
+    chunks = np.vstack(list(sobol.iter_transform(7, output='numpy')))
+    assert np.allclose(chunks, expected, rtol=1e-12)
+    batches = pd.concat(list(sobol.iter_paths(4)), axis=1)
+    assert np.array_equal(batches.to_numpy(), expected)
+
+    # Standard error of the mean terminal value over seeds
+    def estimates(**options):
+        return [
+            model(252, 256, seed=seed, **kwargs, **options).transform(output='numpy')[-1].mean()
+            for seed in range(20)
+        ]
+    assert np.std(estimates(variance_reduction='sobol')) < ratio * np.std(estimates())
+
+
+def test_moment_matching():
+    model = sth.GeometricBrownianMotion(100, 8, seed=123, variance_reduction='moment_matching')
+    log_returns = np.diff(np.log(model.transform(output='numpy')), axis=0)
+    drift = (model.mu - 0.5 * model.sigma ** 2) * model.delta
+    assert np.allclose(log_returns.mean(axis=1), drift)
+    assert np.allclose(log_returns.std(axis=1), np.sqrt(model.delta) * model.sigma)
+
+    chunks = np.vstack(list(model.iter_transform(7, output='numpy')))
+    assert np.allclose(chunks, model.transform(output='numpy'), rtol=1e-12)
+
+
+def test_gbm_expectation():
+    model = sth.GeometricBrownianMotion(252, 20000, mean=0.0001, seed=123)
+    expectation = model.expectation()
+    assert expectation.index.equals(model.index)
+
+    terminal = model.transform(output='numpy')[-1]
+    std_error = terminal.std() / np.sqrt(20000)
+    assert abs(terminal.mean() - expectation.iloc[-1]) < 4 * std_error
+
+
+@pytest.mark.parametrize("model, control, gbm, ratio", [
+    # GBM with the white noise and the drift of the diffusion
+    (
+        lambda seed: sth.Merton(252, 500, seed=seed, lmbda=0.02, mu=0.0, var=0.02),
+        lambda seed: sth.GeometricBrownianMotion(252, 500, seed=seed, mu=0.125 ** 2 / 2),
+        sth.GeometricBrownianMotion(252, mu=0.125 ** 2 / 2),
+        0.5
+    ),
+    # Heston with a constant variance, i.e. GBM with the Heston price noise
+    (
+        lambda seed: sth.Heston(252, 500, seed=seed),
+        lambda seed: sth.Heston(252, 500, seed=seed, nu=0, vol0=0.2 ** 2),
+        sth.GeometricBrownianMotion(252, mu=0.02, sigma=0.2),
+        0.8
+    ),
+])
+def test_control_variate(model, control, gbm, ratio: float):
+    expectation = gbm.expectation().iloc[-1]
+
+    estimates, adjusted = [], []
+    for seed in range(20):
+        values = model(seed).transform(output='numpy')[-1]
+        controls = control(seed).transform(output='numpy')[-1]
+        estimates.append(values.mean())
+        adjusted.append(sth.control_variate(values, controls, expectation)[0])
+
+    assert np.std(adjusted) < ratio * np.std(estimates)
+    assert abs(np.mean(adjusted) - np.mean(estimates)) < 4 * np.std(estimates) / np.sqrt(20)
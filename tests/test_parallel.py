@@ -0,0 +1,88 @@
+import pytest
+import numpy as np
+
+import synthetica as sth
+from synthetica import ParallelRunner
+
+
+def make_model(model, **kwargs):
+    model = model(120, 50, seed=123, **kwargs)
+    model.block_size = 8
+    return model
+
+
+@pytest.mark.parametrize("model, kwargs", [
+    (sth.GeometricBrownianMotion, {}),
+    (sth.Heston, {'method': 'qe'}),
+    (sth.Merton, {'lmbda': 0.05}),
+    (sth.CIR, {'method': 'exact'}),
+    (sth.NARMA, {}),
+    (sth.AutoRegressive, {'ar': [0.5, 0.2], 'initial': np.ones((2, 50))}),
+])
+@pytest.mark.parametrize("n_jobs", [1, 3])
+def test_bit_identical(model, kwargs: dict, n_jobs: int):
+    model = make_model(model, **kwargs)
+    expected = model.transform()
+    result = ParallelRunner(model, n_jobs=n_jobs).transform()
+    assert np.array_equal(result.to_numpy(), expected.to_numpy(), equal_nan=True)
+    assert result.index.equals(expected.index)
+    assert result.columns.equals(expected.columns)
+
+
+@pytest.mark.parametrize("model", [
+    sth.GeometricBrownianMotion,
+    sth.LevyStable,
+    sth.Seasonal,
+    sth.Merton,
+])
+@pytest.mark.parametrize("n_jobs", [2, 4])
+def test_threads_bit_identical(model, n_jobs: int):
+    model = make_model(model)
+    expected = model.transform().to_numpy()
+    result = ParallelRunner(model, n_jobs=n_jobs, backend='threads').transform()
+    assert np.array_equal(result.to_numpy(), expected)
+
+
+def test_shards():
+    model = make_model(sth.GeometricBrownianMotion)
+    assert ParallelRunner(model, n_jobs=3).shards() == [(0, 2), (2, 4), (4, 7)]
+    # No more shards than blocks
+    assert len(ParallelRunner(model, n_jobs=64).shards()) == 7
+
+
+def test_unseeded():
+    model = make_model(sth.GeometricBrownianMotion)
+    model.seed = None
+    result = ParallelRunner(model, n_jobs=2).transform()
+    assert result.shape == (120, 50)
+    assert np.all(np.isfinite(result.to_numpy()))
+
+
+def test_invalid():
+    model = make_model(sth.GeometricBrownianMotion)
+    with pytest.raises(ValueError):
+        ParallelRunner(model, n_jobs=0)
+    with pytest.raises(ValueError):
+        ParallelRunner(model, backend='unknown')
+    with pytest.raises(ValueError):
+        ParallelRunner(model, n_jobs=2).transform(np.eye(50))
+
+    var = sth.AutoRegressive(120, 2, ar=np.zeros((1, 2, 2)))
+    with pytest.raises(ValueError):
+        ParallelRunner(var, n_jobs=2).transform()
+
+
+@pytest.mark.parametrize("backend", ['processes', 'threads'])
+def test_output_numpy(backend: str):
+    model = make_model(sth.GeometricBrownianMotion)
+    result = ParallelRunner(model, n_jobs=2, backend=backend).transform(output='numpy')
+    assert isinstance(result, np.ndarray)
+    assert np.array_equal(result, model.transform(output='numpy'))
+
+
+@pytest.mark.parametrize("backend", ['processes', 'threads'])
+def test_float32(backend: str):
+    model = make_model(sth.Merton, lmbda=0.05, dtype='float32')
+    result = ParallelRunner(model, n_jobs=2, backend=backend).transform(output='numpy')
+    assert result.dtype == np.float32
+    assert np.array_equal(result, model.transform(output='numpy'))
@@ -1,6 +1,7 @@
+import pytest
 import numpy as np
 
-from synthetica.stats import _is_positive_definite, nearest_positive_definite
+from synthetica.stats import _is_positive_definite, nearest_positive_definite, control_variate
 
 
 def test_is_positive_definite():
@@ -46,3 +47,65 @@ def test_nearest_positive_definite_large_matrix():
         "Expected the result to be positive definite"
     assert result.shape == large_matrix.shape, \
         "Expected the result to have the same shape as the input"
+
+
+def test_nearest_positive_definite_eigenvalue_clipping():
+    # Estimated correlation matrix from fewer observations than assets
+    rng = np.random.default_rng(123)
+    matrix = np.corrcoef(rng.normal(size=(20, 50)), rowvar=False)
+    matrix[0, 1] = matrix[1, 0] = 0.99
+    assert not _is_positive_definite(matrix)
+
+    result = nearest_positive_definite(matrix)
+    assert _is_positive_definite(result)
+    assert np.allclose(result, result.T)
+
+    # Eigenvalues clipped to the floor, eigenvectors preserved
+    eigenvalues = np.linalg.eigvalsh(matrix)
+    expected = np.maximum(eigenvalues, 0)
+    assert np.allclose(np.linalg.eigvalsh(result), expected, atol=1e-8)
+
+
+def test_nearest_positive_definite_factor():
+    matrix = np.array([[1, 2], [2, 1]])
+    factor = nearest_positive_definite(matrix, return_factor=True)
+    assert np.allclose(factor, np.tril(factor))
+    assert np.allclose(factor @ factor.T, nearest_positive_definite(matrix))
+
+    positive_definite_matrix = np.array([[2, 1], [1, 2]])
+    factor = nearest_positive_definite(positive_definite_matrix, return_factor=True)
+    assert np.allclose(factor, np.linalg.cholesky(positive_definite_matrix))
+
+
+def test_nearest_positive_definite_tol():
+    matrix = np.array([[1, 2], [2, 1]])
+    result = nearest_positive_definite(matrix, tol=0.1)
+    assert np.allclose(np.linalg.eigvalsh(result), [0.1, 3])
+
+    for tol in (0.0, -1.0):
+        with pytest.raises(ValueError):
+            nearest_positive_definite(matrix, tol=tol)
+
+
+def test_nearest_positive_definite_max_iter():
+    matrix = np.array([[1, 2], [2, 1]])
+    with pytest.raises(np.linalg.LinAlgError):
+        nearest_positive_definite(matrix, tol=1e-300, max_iter=0)
+
+
+def test_control_variate():
+    rng = np.random.default_rng(1)
+    controls = rng.normal(1.0, 1.0, size=(2, 1000))
+    values = 3 + 2 * (controls - 1) + rng.normal(0, 0.1, size=(2, 1000))
+
+    estimate, std_error = control_variate(values[0], controls[0], 1.0)
+    assert abs(estimate - 3) < 3 * std_error
+    assert std_error < 0.1 * values[0].std() / np.sqrt(1000)
+
+    # One estimate per row, with a scalar or one expectation per row
+    estimate, std_error = control_variate(values, controls, [1.0, 1.0])
+    assert estimate.shape == std_error.shape == (2,)
+    assert np.allclose(estimate, control_variate(values, controls, 1.0)[0])
+
+    with pytest.raises(ValueError):
+        control_variate(values, controls[0], 1.0)
@@ -0,0 +1,217 @@
+import warnings
+import pytest
+import numpy as np
+
+import synthetica as sth
+from synthetica import RandomStreams
+from synthetica.streams import brownian_bridge
+
+
+def make_streams(num_paths=10, block_size=4, block_offset=0, seed=123, **kwargs):
+    return RandomStreams(
+        np.random.SeedSequence(seed),
+        num_paths=num_paths,
+        block_size=block_size,
+        block_offset=block_offset,
+        **kwargs
+    )
+
+
+def test_blocks():
+    streams = make_streams(num_paths=10, block_size=4)
+    assert streams.blocks() == [(0, slice(0, 4)), (1, slice(4, 8)), (2, slice(8, 10))]
+
+    streams = make_streams(num_paths=3, block_size=4, block_offset=5)
+    assert streams.blocks() == [(5, slice(0, 3))]
+
+
+def test_reproducible():
+    a = make_streams().standard_normal('white_noise', rows=50)
+    b = make_streams().standard_normal('white_noise', rows=50)
+    assert a.shape == (50, 10)
+    assert np.array_equal(a, b)
+
+    c = make_streams(seed=321).standard_normal('white_noise', rows=50)
+    assert not np.array_equal(a, c)
+
+
+def test_names_are_independent():
+    streams = make_streams()
+    a = streams.standard_normal('price', rows=20)
+    b = streams.standard_normal('volatility', rows=20)
+    assert not np.array_equal(a, b)
+
+    # Drawing another name first does not shift the stream
+    streams = make_streams()
+    streams.uniform('phase', rows=20)
+    assert np.array_equal(streams.standard_normal('price', rows=20), a)
+
+
+def test_chunks_match_full_draw():
+    full = make_streams().normal('white_noise', rows=100, loc=1, scale=2)
+
+    streams = make_streams()
+    chunks = [streams.normal('white_noise', rows=r, loc=1, scale=2) for r in (30, 30, 40)]
+    assert np.array_equal(np.vstack(chunks), full)
+
+
+def test_blocks_match_full_draw():
+    full = make_streams(num_paths=10, block_size=4).standard_normal('x', rows=20)
+
+    # Paths 4..9 are blocks 1 and 2 of the full draw
+    part = make_streams(num_paths=6, block_size=4, block_offset=1).standard_normal('x', rows=20)
+    assert np.array_equal(part, full[:, 4:])
+
+
+@pytest.mark.parametrize("bit_generator", list(sth.BIT_GENERATORS))
+def test_bit_generators(bit_generator: str):
+    streams = make_streams(bit_generator=bit_generator)
+    assert isinstance(
+        streams.generator('x', 0).bit_generator,
+        sth.BIT_GENERATORS[bit_generator]
+    )
+    assert np.all(np.isfinite(streams.standard_normal('x', rows=10)))
+
+    with pytest.raises(ValueError):
+        make_streams(bit_generator='unknown')
+
+
+def test_compound_poisson():
+    sums = make_streams(num_paths=200, block_size=64).compound_poisson(
+        'jumps', 'sizes', rows=500, lam=0.05, loc=0.2, scale=0.01)
+    assert sums.shape == (500, 200)
+    assert sums.dtype == np.float64
+
+    # Jumps occur in the cells of the Poisson counts of each block
+    streams = make_streams(num_paths=200, block_size=64)
+    counts = np.hstack([
+        streams.generator('jumps', block).poisson(0.05, (500, cols.stop - cols.start))
+        for block, cols in streams.blocks()
+    ])
+    assert np.array_equal(sums != 0, counts != 0)
+    assert np.isclose(counts.mean(), 0.05, rtol=0.1)
+    assert np.isclose(sums.sum(), 0.2 * counts.sum(), rtol=0.05)
+
+    # Added in place to out, and matched by chunks of time steps
+    out = np.ones((500, 200))
+    streams = make_streams(num_paths=200, block_size=64)
+    assert streams.compound_poisson(
+        'jumps', 'sizes', rows=500, lam=0.05, loc=0.2, scale=0.01, out=out) is out
+    assert np.allclose(out, sums + 1)
+
+    streams = make_streams(num_paths=200, block_size=64)
+    chunks = [
+        streams.compound_poisson('jumps', 'sizes', rows=r, lam=0.05, loc=0.2, scale=0.01)
+        for r in (200, 300)
+    ]
+    assert np.array_equal(np.vstack(chunks), sums)
+
+
+def test_noncentral_chisquare():
+    streams = make_streams(num_paths=20000, block_size=1024)
+    draws = streams.noncentral_chisquare('rates', 3.0, np.full(20000, 2.0))
+    assert draws.shape == (20000,)
+    assert np.isclose(draws.mean(), 5.0, rtol=0.05)
+
+
+def test_antithetic():
+    draws = make_streams(num_paths=11, block_size=5, variance_reduction='antithetic').normal(
+        'white_noise', rows=50, loc=1, scale=2)
+
+    # Adjacent paths of a block are mirrored around the mean, the last path
+    # of an odd block is unpaired
+    for first in (0, 2, 5, 7):
+        assert np.allclose(draws[:, first] + draws[:, first + 1], 2)
+    assert not np.allclose(draws[:, 4] + draws[:, 5], 2)
+    assert not np.allclose(draws[:, 10] + draws[:, 9], 2)
+
+    # Chunks and blocks still match the full draw
+    streams = make_streams(num_paths=11, block_size=5, variance_reduction='antithetic')
+    chunks = [streams.normal('white_noise', rows=r, loc=1, scale=2) for r in (20, 30)]
+    assert np.array_equal(np.vstack(chunks), draws)
+
+    part = make_streams(num_paths=6, block_size=5, block_offset=1, variance_reduction='antithetic')
+    assert np.array_equal(part.normal('white_noise', rows=50, loc=1, scale=2), draws[:, 5:])
+
+    # Other variables are drawn for every path
+    uniform = make_streams(variance_reduction='antithetic').uniform('phase', rows=50)
+    assert np.array_equal(uniform, make_streams().uniform('phase', rows=50))
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 252])
+def test_brownian_bridge(n: int):
+    # Linear map of independent variables to independent increments
+    bridge = brownian_bridge(np.eye(n))
+    assert np.allclose(bridge @ bridge.T, np.eye(n))
+
+    # The first variable sets the terminal value
+    z = np.random.default_rng(1).standard_normal((n, 3))
+    assert np.allclose(brownian_bridge(z).sum(axis=0), np.sqrt(n) * z[0])
+
+
+def test_sobol():
+    streams = make_streams(num_paths=64, block_size=16, variance_reduction='sobol', length=50)
+    draws = streams.normal('white_noise', rows=50, loc=1, scale=2)
+    assert draws.shape == (50, 64)
+    assert np.isclose(draws.mean(), 1, atol=0.05)
+    assert np.isclose(draws.std(), 2, rtol=0.05)
+
+    # Terminal values are stratified across the paths, so that their mean is
+    # well within the Monte Carlo standard error
+    terminal = draws.sum(axis=0) - 50
+    assert abs(terminal.mean()) < 0.2 * terminal.std() / np.sqrt(64)
+
+    # Chunks and blocks still match the full draw
+    streams = make_streams(num_paths=64, block_size=16, variance_reduction='sobol', length=50)
+    chunks = [streams.normal('white_noise', rows=r, loc=1, scale=2) for r in (20, 30)]
+    assert np.array_equal(np.vstack(chunks), draws)
+    with pytest.raises(ValueError):
+        streams.normal('white_noise', rows=1)
+
+    part = make_streams(
+        num_paths=32, block_size=16, block_offset=2, variance_reduction='sobol', length=50)
+    assert np.array_equal(part.normal('white_noise', rows=50, loc=1, scale=2), draws[:, 32:])
+
+    # Names are paired at random
+    streams = make_streams(num_paths=1024, block_size=1024, variance_reduction='sobol')
+    price = streams.standard_normal('price', rows=10)
+    volatility = streams.standard_normal('volatility', rows=10)
+    assert abs(np.corrcoef(price.ravel(), volatility.ravel())[0, 1]) < 0.05
+
+    with pytest.raises(ValueError):
+        make_streams(variance_reduction='halton')
+
+
+def test_sobol_limits():
+    # Block widths other than powers of 2 are drawn without scipy's warning
+    streams = make_streams(num_paths=10, block_size=4, variance_reduction='sobol')
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert np.all(np.isfinite(streams.standard_normal('x', rows=20)))
+
+    streams = make_streams(variance_reduction='sobol', length=sth.SOBOL_MAX_DIMENSION + 1)
+    with pytest.raises(ValueError, match='21201'):
+        streams.standard_normal('x', rows=1)
+
+
+def test_moment_matching():
+    draws = make_streams(num_paths=10, block_size=4, variance_reduction='moment_matching').normal(
+        'white_noise', rows=50, loc=1, scale=2)
+
+    # Exact moments of each time step across the blocks of paths, and so
+    # across all the paths
+    for cols in (slice(0, 4), slice(4, 8), slice(8, 10)):
+        assert np.allclose(draws[:, cols].mean(axis=1), 1)
+        assert np.allclose(draws[:, cols].std(axis=1), 2)
+    assert np.allclose(draws.mean(axis=1), 1)
+    assert np.allclose(draws.std(axis=1), 2)
+
+    streams = make_streams(num_paths=10, block_size=4, variance_reduction='moment_matching')
+    chunks = [streams.normal('white_noise', rows=r, loc=1, scale=2) for r in (20, 30)]
+    assert np.allclose(np.vstack(chunks), draws)
+
+    # A block of a single path cannot be matched
+    with pytest.raises(ValueError):
+        make_streams(num_paths=9, block_size=4, variance_reduction='moment_matching')
+    with pytest.raises(ValueError):
+        make_streams(num_paths=9, block_size=1, variance_reduction='moment_matching')